@@ -0,0 +1,117 @@
+"""
+워커 빠른 시작 도구
+Azure App Service 스케일 아웃 / gunicorn 워커 재시작 시 첫 요청까지의 시간 단축
+
+- 미리 생성한 OpenAPI 스키마 로드 (첫 /docs, /openapi.json 접근 시 스키마 생성 생략)
+- 임포트 시간 리포트 (python -X importtime 결과 요약)
+
+Usage:
+    python -m api.fast_start openapi [openapi.json]   # OpenAPI 스키마 미리 생성 (배포 빌드 단계)
+    python -m api.fast_start importtime [top]         # api.main 임포트 시간 상위 모듈
+
+Version: 1.0
+"""
+
+import os
+import sys
+import json
+import subprocess
+from typing import List, Tuple
+
+from fastapi import FastAPI
+
+# 미리 생성한 OpenAPI 스키마 경로 (없으면 FastAPI가 첫 접근 시 생성)
+OPENAPI_SCHEMA_PATH = os.getenv("OPENAPI_SCHEMA_PATH", "")
+
+
+def load_prebuilt_openapi(app: FastAPI, path: str = OPENAPI_SCHEMA_PATH) -> bool:
+    """
+    미리 생성한 OpenAPI 스키마를 앱에 설정
+
+    Args:
+        app: FastAPI 앱
+        path: 스키마 JSON 경로
+
+    Returns:
+        로드 여부 (파일이 없거나 앱 버전과 다르면 False)
+    """
+    if not path or not os.path.isfile(path):
+        return False
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[STARTUP] OpenAPI 스키마 로드 실패: {e}")
+        return False
+
+    # 다른 버전에서 생성된 스키마는 사용하지 않음 (FastAPI가 다시 생성)
+    if schema.get("info", {}).get("version") != app.version:
+        print(f"[STARTUP] OpenAPI 스키마 버전 불일치 - 무시 ({path})")
+        return False
+
+    app.openapi_schema = schema
+    # FastAPI 0.120+: 라우트 버전이 바뀌면 스키마를 다시 생성하므로 현재 버전 기록
+    get_routes_version = getattr(app.router, "_get_routes_version", None)
+    if get_routes_version is not None:
+        app._openapi_routes_version = get_routes_version()
+    return True
+
+
+def dump_openapi(app: FastAPI, path: str) -> None:
+    """OpenAPI 스키마 생성 후 저장"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(app.openapi(), f, ensure_ascii=False)
+
+
+def import_time_report(module: str = "api.main", top: int = 20) -> List[Tuple[str, int, int]]:
+    """
+    모듈 임포트 시간 측정 (새 인터프리터에서 python -X importtime 실행)
+
+    Args:
+        module: 측정할 모듈
+        top: 반환할 상위 모듈 수 (누적 시간 기준)
+
+    Returns:
+        [(모듈명, 자체 시간(us), 누적 시간(us))]
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 행
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows[:top]
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "importtime"
+
+    if command == "openapi":
+        from api.main import app
+
+        output = sys.argv[2] if len(sys.argv) > 2 else (OPENAPI_SCHEMA_PATH or "openapi.json")
+        dump_openapi(app, output)
+        print(f"OpenAPI 스키마 저장: {output}")
+
+    elif command == "importtime":
+        top = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+        print("=" * 60)
+        print(f"api.main 임포트 시간 (누적 상위 {top}개)")
+        print("=" * 60)
+        for name, self_us, cumulative_us in import_time_report(top=top):
+            print(f"{cumulative_us / 1000:8.1f}ms  (자체 {self_us / 1000:6.1f}ms)  {name}")
+
+    else:
+        print(f"알 수 없는 명령: {command} (openapi | importtime)")
+        sys.exit(1)
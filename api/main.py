@@ -7,15 +7,30 @@ Usage: uvicorn api.main:app --reload --host 0.0.0.0 --port 8000
 """
 
 import os
+import time
+
+# 워커 시작 ~ 첫 요청 가능 시점 측정 (임포트 포함)
+_IMPORT_STARTED = time.perf_counter()
+
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 # 환경 변수 로드
 load_dotenv()
 
-from .routers import commentary
+from .fast_start import load_prebuilt_openapi
+from .routers import admin, commentary
+from .services.metrics import get_metrics
+from .services.profiler import RequestCounterMiddleware
+from .services.capture_sink import get_capture_sink
+from .services.loop_monitor import get_loop_monitor
+from .services.readiness import get_readiness_probe
+from .services.sharding import get_shard_router
+from .services.runpod_async import RUNPOD_CALL_MODE
+from .services.warmup_service import get_warmup_scheduler, RUNPOD_WARMUP_ENABLED
 
 
 @asynccontextmanager
@@ -29,22 +44,49 @@ async def lifespan(app: FastAPI):
     # RunPod 설정 확인
     runpod_key = os.getenv("RUNPOD_API_KEY", "")
     runpod_url = os.getenv("RUNPOD_ENDPOINT_URL", "")
+    runpod_endpoints = os.getenv("RUNPOD_ENDPOINTS", "")
 
     if runpod_key:
         print(f"RUNPOD_API_KEY: {runpod_key[:10]}...{runpod_key[-4:]}")
     else:
         print("WARNING: RUNPOD_API_KEY not set")
 
-    if runpod_url:
+    if runpod_endpoints:
+        print(f"RUNPOD_ENDPOINTS: {runpod_endpoints[:60]}...")
+    elif runpod_url:
         print(f"RUNPOD_ENDPOINT_URL: {runpod_url}")
     else:
         print("WARNING: RUNPOD_ENDPOINT_URL not set")
 
     print("=" * 60)
 
+    # 샤드 번호 선점 / 워커 간 전달 수신 소켓 (SHARD_COUNT > 1)
+    await get_shard_router().start(app)
+
+    # RunPod 웜 유지 스케줄러
+    if RUNPOD_WARMUP_ENABLED and (runpod_endpoints or (runpod_key and runpod_url)):
+        get_warmup_scheduler().start()
+
+    # RunPod 비동기 모드: 재시작 전에 제출한 원격 작업 결과 수집 재개
+    if RUNPOD_CALL_MODE == "async":
+        print(f"RUNPOD_CALL_MODE: async (/run 제출 + 결과 수집)")
+        await commentary.resume_remote_jobs()
+
+    # 이벤트 루프 지연 모니터 (과부하 시 새 해설 요청 차단)
+    get_loop_monitor().start()
+
+    startup_seconds = time.perf_counter() - _IMPORT_STARTED
+    get_metrics().set_gauge("startup_seconds", startup_seconds)
+    print(f"[STARTUP] 요청 처리 준비 완료: {startup_seconds * 1000:.0f}ms (임포트 포함)")
+
     yield
 
     # 종료 시
+    await get_loop_monitor().stop()
+    await get_shard_router().stop()
+    await get_warmup_scheduler().stop()
+    # 남은 캡처 기록 후 세그먼트 닫기
+    get_capture_sink().close()
     print("K리그 AI 해설 서버 종료")
 
 
@@ -78,8 +120,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 완료 요청 수 집계 (관리 API의 N개 요청 동안 CPU 프로파일용)
+app.add_middleware(RequestCounterMiddleware)
+
 # 라우터 등록
 app.include_router(commentary.router)
+app.include_router(admin.router)
 
 
 @app.get("/", tags=["health"])
@@ -96,15 +142,41 @@ async def root():
 async def health_check():
     """헬스 체크"""
     runpod_configured = bool(
-        os.getenv("RUNPOD_API_KEY") and os.getenv("RUNPOD_ENDPOINT_URL")
+        os.getenv("RUNPOD_ENDPOINTS")
+        or (os.getenv("RUNPOD_API_KEY") and os.getenv("RUNPOD_ENDPOINT_URL"))
     )
 
     return {
         "status": "healthy",
-        "runpod_configured": runpod_configured
+        "runpod_configured": runpod_configured,
+        "loop_monitor": get_loop_monitor().snapshot(),
+        "shard": get_shard_router().snapshot()
     }
 
 
+@app.get("/ready", tags=["health"])
+async def readiness_check():
+    """
+    준비 상태 확인 (로드 밸런서 / 자동 확장 프로브용)
+
+    대기열 깊이/대기 시간, 이벤트 루프 지연, PENDING 작업 수가 한도를 넘으면 503
+    """
+    result = get_readiness_probe().check()
+    return JSONResponse(status_code=200 if result["ready"] else 503, content=result)
+
+
+@app.get("/metrics", tags=["health"])
+async def metrics():
+    """메트릭 조회 (RunPod 응답 시간, 콜드 스타트 등)"""
+    return get_metrics().snapshot()
+
+
+# 미리 생성한 OpenAPI 스키마 (OPENAPI_SCHEMA_PATH, python -m api.fast_start openapi)
+# 모든 라우트 등록 후 로드해야 FastAPI가 스키마를 다시 생성하지 않음
+if load_prebuilt_openapi(app):
+    print("[STARTUP] 미리 생성한 OpenAPI 스키마 사용")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
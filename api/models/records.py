@@ -0,0 +1,157 @@
+"""
+정규화된 입력 레코드
+Spring Backend가 보내는 matchInfo / rawData(camelCase 또는 snake_case)를 요청 수신 시 한 번만 정규화
+
+- 하위 처리(CSV 생성, 위치 특성, 규칙 기반 해설)는 dict 키 탐색 없이 속성으로 접근
+- 좌표는 float으로 한 번만 파싱 (숫자가 아니거나 유한하지 않으면 None)
+
+Version: 1.0
+"""
+
+import math
+from typing import Iterable, List, Optional, Union
+
+# (속성명, camelCase 키, snake_case 키)
+ACTION_TEXT_FIELDS = (
+    ("action_id", "actionId", "action_id"),
+    ("period_id", "periodId", "period_id"),
+    ("time_seconds", "timeSeconds", "time_seconds"),
+    ("result_name", "resultName", "result_name"),
+    ("type_name", "typeName", "type_name"),
+    ("type_name_ko", "typeNameKo", "type_name_ko"),
+    ("player_name_ko", "playerNameKo", "player_name_ko"),
+    ("team_name_ko_short", "teamNameKoShort", "team_name_ko_short"),
+    ("position_name", "positionName", "position_name"),
+    ("main_position", "mainPosition", "main_position"),
+)
+
+ACTION_COORDINATE_FIELDS = (
+    ("start_x", "startX", "start_x"),
+    ("start_y", "startY", "start_y"),
+    ("end_x", "endX", "end_x"),
+    ("end_y", "endY", "end_y"),
+    ("dx", "dx", "dx"),
+    ("dy", "dy", "dy"),
+)
+
+MATCH_TEXT_FIELDS = (
+    ("game_id", "gameId", "game_id"),
+    ("home_team_name_ko", "homeTeamNameKo", "home_team_name_ko"),
+    ("away_team_name_ko", "awayTeamNameKo", "away_team_name_ko"),
+    ("home_team_name_ko_short", "homeTeamNameKoShort", "home_team_name_ko_short"),
+    ("away_team_name_ko_short", "awayTeamNameKoShort", "away_team_name_ko_short"),
+    ("venue", "venue", "venue"),
+    ("game_date", "gameDate", "game_date"),
+    ("weather", "weather", "weather"),
+    ("temperature", "temperature", "temperature"),
+    ("home_team_uniform", "homeTeamUniform", "home_team_uniform"),
+    ("away_team_uniform", "awayTeamUniform", "away_team_uniform"),
+    ("referee", "referee", "referee"),
+    ("assistant_referees", "assistantReferees", "assistant_referees"),
+    ("fourth_official", "fourthOfficial", "fourth_official"),
+    ("var_referees", "varReferees", "var_referees"),
+    ("home_score", "homeScore", "home_score"),
+    ("away_score", "awayScore", "away_score"),
+)
+
+
+def _raw(item: dict, camel: str, snake: str):
+    """camelCase 우선, 없거나 빈 값이면 snake_case"""
+    value = item.get(camel)
+    if (value is None or value == "") and snake != camel:
+        value = item.get(snake)
+    return value
+
+
+def _text(item: dict, camel: str, snake: str) -> str:
+    value = _raw(item, camel, snake)
+    return "" if value is None else str(value)
+
+
+def _number(item: dict, camel: str, snake: str) -> Optional[float]:
+    value = _raw(item, camel, snake)
+    if value is None or value == "":
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+class ActionRecord:
+    """액션 1건 (문자열 필드는 값이 없으면 "", 좌표는 None)"""
+
+    __slots__ = (
+        tuple(name for name, _, _ in ACTION_TEXT_FIELDS)
+        + tuple(name for name, _, _ in ACTION_COORDINATE_FIELDS)
+        + ("period", "time_value")
+    )
+
+    @classmethod
+    def from_dict(cls, item: dict) -> "ActionRecord":
+        """dict -> ActionRecord (별칭 해석 및 숫자 파싱)"""
+        record = cls.__new__(cls)
+        for name, camel, snake in ACTION_TEXT_FIELDS:
+            setattr(record, name, _text(item, camel, snake))
+        for name, camel, snake in ACTION_COORDINATE_FIELDS:
+            setattr(record, name, _number(item, camel, snake))
+
+        period = _number(item, "periodId", "period_id")
+        record.period = int(period) if period is not None else None
+        record.time_value = _number(item, "timeSeconds", "time_seconds")
+        return record
+
+    def to_dict(self) -> dict:
+        """camelCase dict (값이 없는 필드 제외)"""
+        result = {}
+        for name, camel, _ in ACTION_TEXT_FIELDS:
+            value = getattr(self, name)
+            if value != "":
+                result[camel] = value
+        for name, camel, _ in ACTION_COORDINATE_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                result[camel] = value
+        return result
+
+    def __repr__(self) -> str:
+        return f"ActionRecord(action_id={self.action_id!r}, type_name={self.type_name!r}, player={self.player_name_ko!r})"
+
+
+class MatchRecord:
+    """경기 메타데이터 (값이 없으면 "")"""
+
+    __slots__ = tuple(name for name, _, _ in MATCH_TEXT_FIELDS)
+
+    @classmethod
+    def from_dict(cls, match_info: Optional[dict]) -> "MatchRecord":
+        """dict -> MatchRecord (별칭 해석)"""
+        match_info = match_info or {}
+        record = cls.__new__(cls)
+        for name, camel, snake in MATCH_TEXT_FIELDS:
+            setattr(record, name, _text(match_info, camel, snake))
+        return record
+
+    @property
+    def away_names(self) -> set:
+        """원정팀 이름 (짧은 이름 / 풀네임, 공격 방향 판별용)"""
+        return {name for name in (self.away_team_name_ko_short, self.away_team_name_ko) if name}
+
+    def __repr__(self) -> str:
+        return f"MatchRecord(game_id={self.game_id!r}, home={self.home_team_name_ko_short!r}, away={self.away_team_name_ko_short!r})"
+
+
+def to_actions(raw_data: Iterable[Union[dict, ActionRecord]]) -> List[ActionRecord]:
+    """액션 리스트 정규화 (이미 ActionRecord면 그대로 사용)"""
+    return [
+        item if isinstance(item, ActionRecord) else ActionRecord.from_dict(item)
+        for item in raw_data
+    ]
+
+
+def to_match(match_info: Union[dict, MatchRecord, None]) -> MatchRecord:
+    """경기 메타데이터 정규화 (이미 MatchRecord면 그대로 사용)"""
+    if isinstance(match_info, MatchRecord):
+        return match_info
+    return MatchRecord.from_dict(match_info)
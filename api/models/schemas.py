@@ -6,10 +6,12 @@ Version: 1.2
 - Dict 기반 유연한 스키마로 변경
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Any, Dict
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import List, Optional, Any, Dict, Union
 from enum import Enum
 
+from .records import ActionRecord, MatchRecord, to_actions, to_match
+
 
 class StyleEnum(str, Enum):
     """해설 스타일"""
@@ -29,6 +31,13 @@ class ToneEnum(str, Enum):
     EMPHASIS = "EMPHASIS"
 
 
+class PriorityEnum(str, Enum):
+    """작업 우선순위 클래스"""
+    LIVE = "LIVE"      # 실시간 경기 (청취자 대기 중)
+    NORMAL = "NORMAL"
+    BULK = "BULK"      # 지난 경기 재생성 등 일괄 작업
+
+
 class JobStatusEnum(str, Enum):
     """작업 상태"""
     PENDING = "PENDING"
@@ -46,10 +55,44 @@ class CommentaryJobRequest(BaseModel):
     style: StyleEnum
     matchInfo: Dict[str, Any]  # 유연하게 모든 필드 허용
     rawData: List[Dict[str, Any]]  # 유연하게 모든 필드 허용
+    instantDraft: bool = False  # True면 규칙 기반 초안 해설을 즉시 반환 (LLM 결과로 나중에 교체)
+    priority: PriorityEnum = PriorityEnum.NORMAL
+    deadlineSeconds: Optional[float] = Field(default=None, gt=0)  # 요청 수신 후 이 시간(초) 안에 RunPod 호출이 시작되지 않으면 마감 초과
+
+    # 수신 시 한 번만 정규화한 레코드 (하위 처리는 dict 대신 사용)
+    _match: MatchRecord = PrivateAttr()
+    _actions: List[ActionRecord] = PrivateAttr()
 
     class Config:
         extra = "allow"
 
+    def model_post_init(self, __context: Any) -> None:
+        self._match = to_match(self.matchInfo)
+        self._actions = to_actions(self.rawData)
+
+    @property
+    def match(self) -> MatchRecord:
+        """정규화된 경기 메타데이터"""
+        return self._match
+
+    @property
+    def actions(self) -> List[ActionRecord]:
+        """정규화된 액션 레코드"""
+        return self._actions
+
+
+class CommentaryBatchRequest(BaseModel):
+    """해설 생성 일괄 요청 (여러 윈도우/스타일을 한 번에 제출)"""
+    jobs: List[CommentaryJobRequest]
+
+
+class WarmupScheduleItem(BaseModel):
+    """웜 유지 경기 일정 항목 (kickoff 또는 start/end 지정)"""
+    gameId: str
+    kickoff: Optional[str] = None  # "YYYY-MM-DD HH:MM:SS"
+    start: Optional[str] = None
+    end: Optional[str] = None
+
 
 # =============================================================================
 # 응답 모델
@@ -67,6 +110,7 @@ class JobPendingResponse(BaseModel):
     """작업 대기중 응답"""
     jobId: str
     status: JobStatusEnum = JobStatusEnum.PENDING
+    draftScript: Optional[List[ScriptItem]] = None  # instantDraft 요청 시 규칙 기반 초안
 
 
 class JobDoneResponse(BaseModel):
@@ -85,6 +129,45 @@ class JobErrorResponse(BaseModel):
     errorMessage: str
 
 
+class ArchivedScriptItem(ScriptItem):
+    """아카이브 해설 항목"""
+    periodId: Optional[int] = None
+    style: StyleEnum
+
+
+class GameScriptResponse(BaseModel):
+    """경기 해설 구간 조회 응답 (시간순)"""
+    gameId: str
+    script: List[ArchivedScriptItem]
+    count: int
+
+
+class JobBatchCreatedResponse(BaseModel):
+    """일괄 요청 응답 (jobs 순서는 요청 순서와 동일)"""
+    jobs: List[JobPendingResponse]
+    count: int
+
+
+class JobBatchStatusResponse(BaseModel):
+    """일괄 상태 조회 응답"""
+    jobs: List[Union[JobPendingResponse, JobDoneResponse, JobErrorResponse]]
+    missing: List[str] = []  # 존재하지 않는 Job ID
+
+
+class JobTimingStage(BaseModel):
+    """작업 단계 시각 (enqueued 기준 경과 시간)"""
+    stage: str
+    offsetMs: float  # enqueued 이후 경과 시간
+    deltaMs: float  # 직전 단계 이후 경과 시간
+
+
+class JobTimingsResponse(BaseModel):
+    """작업 단계별 지연 타임라인"""
+    jobId: str
+    status: JobStatusEnum
+    stages: List[JobTimingStage]
+    totalMs: float  # enqueued ~ 마지막 기록 단계
+
 # =============================================================================
 # RunPod 통신용 모델
 # =============================================================================
@@ -1,2 +1,3 @@
 # Routers 패키지
 from . import commentary
+from . import admin
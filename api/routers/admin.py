@@ -0,0 +1,161 @@
+"""
+운영 관리 API 라우터 (X-Admin-Token 헤더 필요)
+POST /admin/profile/cpu - CPU 샘플링 프로파일 (N초 또는 N개 요청)
+POST /admin/profile/memory - tracemalloc 스냅샷 차이 (N초 동안 증가한 할당 위치)
+GET /admin/profile/files - 프로파일 결과 파일 목록
+GET /admin/profile/files/{name} - 프로파일 결과 파일 다운로드
+GET /admin/captures - 프롬프트/응답 캡처 싱크 상태
+
+Version: 1.0
+"""
+
+import os
+import hmac
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from ..services.capture_sink import get_capture_sink
+from ..services.profiler import PROFILE_MAX_SECONDS, ProfileBusy, get_profiler
+
+# 관리 API 토큰 (빈 문자열이면 관리 API 비활성화)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """X-Admin-Token 헤더 확인 (ADMIN_TOKEN 미설정 시 403)"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "errorCode": "ADMIN_DISABLED",
+                "errorMessage": "관리 API가 비활성화되어 있습니다. (ADMIN_TOKEN)"
+            }
+        )
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "errorCode": "UNAUTHORIZED",
+                "errorMessage": "관리 토큰이 일치하지 않습니다."
+            }
+        )
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+def _busy_error() -> HTTPException:
+    return HTTPException(
+        status_code=409,
+        detail={
+            "errorCode": "PROFILE_BUSY",
+            "errorMessage": "이미 프로파일이 실행 중입니다. 완료 후 다시 요청하세요."
+        }
+    )
+
+
+@router.post(
+    "/profile/cpu",
+    summary="CPU 샘플링 프로파일",
+    description="seconds 동안 (requests 지정 시 해당 수의 HTTP 요청이 완료될 때까지, 최대 seconds) "
+                "스택을 샘플링하여 collapsed stack(.folded) 파일로 저장하고 자체 샘플 상위 프레임을 반환합니다."
+)
+async def profile_cpu(
+    seconds: float = Query(default=10.0, gt=0, le=PROFILE_MAX_SECONDS),
+    requests: Optional[int] = Query(default=None, gt=0),
+    intervalMs: float = Query(default=10.0, ge=1, le=1000),
+    top: int = Query(default=20, ge=1, le=200),
+    allThreads: bool = False
+):
+    """CPU 샘플링 프로파일 실행"""
+    profiler = get_profiler()
+    if profiler.busy:
+        raise _busy_error()
+
+    print(f"[PROFILE] CPU 프로파일 시작: {seconds}s, requests={requests}")
+    try:
+        # 샘플러는 별도 스레드에서 실행 (이벤트 루프는 계속 요청 처리)
+        result = await asyncio.to_thread(
+            profiler.sample_cpu, seconds, requests, intervalMs / 1000, top, allThreads
+        )
+    except ProfileBusy:
+        raise _busy_error()
+
+    print(f"[PROFILE] CPU 프로파일 저장: {result['file']} (샘플 {result['samples']}개)")
+    return result
+
+
+@router.post(
+    "/profile/memory",
+    summary="메모리 할당 프로파일 (tracemalloc 차이)",
+    description="seconds 동안 증가한 메모리 할당 위치 상위 항목을 반환하고, "
+                "요약(.txt)과 원본 스냅샷(.tracemalloc)을 저장합니다. "
+                "tracemalloc이 꺼져 있으면 구간 동안만 켭니다."
+)
+async def profile_memory(
+    seconds: float = Query(default=30.0, gt=0, le=PROFILE_MAX_SECONDS),
+    groupBy: str = Query(default="lineno", pattern="^(lineno|filename|traceback)$"),
+    top: int = Query(default=20, ge=1, le=200)
+):
+    """tracemalloc 스냅샷 차이 실행"""
+    profiler = get_profiler()
+    try:
+        before, started_here = await asyncio.to_thread(profiler.begin_memory)
+    except ProfileBusy:
+        raise _busy_error()
+
+    print(f"[PROFILE] 메모리 프로파일 시작: {seconds}s (groupBy={groupBy})")
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        # 취소되어도 tracemalloc 종료 / 잠금 해제
+        result = await asyncio.to_thread(
+            profiler.end_memory, before, started_here, seconds, groupBy, top
+        )
+
+    print(f"[PROFILE] 메모리 프로파일 저장: {result['file']}")
+    return result
+
+
+@router.get(
+    "/profile/files",
+    summary="프로파일 결과 파일 목록",
+    description="PROFILE_OUTPUT_DIR에 저장된 결과 파일을 최신순으로 조회합니다."
+)
+async def list_profile_files():
+    """프로파일 결과 파일 목록 반환"""
+    store = get_profiler().store
+    files = store.list_files()
+    return {"directory": store.directory, "files": files, "count": len(files)}
+
+
+@router.get(
+    "/profile/files/{name}",
+    summary="프로파일 결과 파일 다운로드"
+)
+async def download_profile_file(name: str):
+    """프로파일 결과 파일 반환"""
+    path = get_profiler().store.resolve(name)
+    if path is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "errorCode": "PROFILE_NOT_FOUND",
+                "errorMessage": f"프로파일 파일 {name}을 찾을 수 없습니다."
+            }
+        )
+    return FileResponse(path, filename=name)
+
+
+@router.get(
+    "/captures",
+    summary="프롬프트/응답 캡처 상태",
+    description="샘플링 캡처 싱크의 캡처/버림 수와 세그먼트 수를 조회합니다. "
+                "재실행: python -m api.services.capture_replay"
+)
+async def get_capture_status():
+    """캡처 싱크 상태 반환"""
+    return get_capture_sink().snapshot()
@@ -1,33 +1,263 @@
 """
 해설 생성 API 라우터
 POST /ai/commentary/jobs - 해설 생성 요청
+POST /ai/commentary/jobs:batch - 해설 생성 일괄 요청
 GET /ai/commentary/jobs/{jobId} - 작업 상태 조회
+GET /ai/commentary/jobs/{jobId}/timings - 작업 단계별 지연 타임라인
+GET /ai/commentary/jobs?ids=... - 작업 상태 일괄 조회
+DELETE /ai/commentary/jobs/{jobId} - 작업 취소 및 삭제 (대기 / 진행 중인 RunPod 호출 중단)
+GET /ai/commentary/games/{gameId}/script - 아카이브 해설 구간 조회
+POST /ai/commentary/runpod/webhook - RunPod 비동기 작업 완료 웹훅 수신
+WS /ai/commentary/ws - 작업 상태 푸시 채널 (gameId / jobId 구독, seq 기반 재연결)
 
 Version: 1.1 (웹훅 지원 추가)
 """
 
 import os
+import hmac
+import json
+import time
+import asyncio
 import httpx
-from fastapi import APIRouter, BackgroundTasks, HTTPException
-from typing import Union
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse
+from typing import Dict, List, Optional, Union
 
 from ..models.schemas import (
     CommentaryJobRequest,
+    CommentaryBatchRequest,
     JobPendingResponse,
     JobDoneResponse,
     JobErrorResponse,
+    JobBatchCreatedResponse,
+    ArchivedScriptItem,
+    GameScriptResponse,
+    JobBatchStatusResponse,
+    JobTimingStage,
+    JobTimingsResponse,
     ScriptItem,
+    StyleEnum,
     ToneEnum,
-    JobStatusEnum
+    JobStatusEnum,
+    WarmupScheduleItem
 )
-from ..services.job_store import get_job_store, JobStatus
+from ..services.job_store import get_job_store, JobData, JobStatus
 from ..services.runpod_service import get_runpod_service
+from ..services.warmup_service import get_warmup_scheduler, MatchWindow
+from ..services.usage_tracker import get_usage_tracker
+from ..services.metrics import get_metrics
+from ..services.job_scheduler import get_job_scheduler
+from ..services.script_archive import get_script_archive
+from ..services.runpod_async import RUNPOD_CALL_MODE, RUNPOD_WEBHOOK_TOKEN, get_async_poller
+from ..services.loop_monitor import LOOP_LAG_RETRY_AFTER, cpu_section, get_loop_monitor
+from ..services.push_hub import PUSH_TOKEN, PushSubscriber, get_push_hub
+from ..services.latency_model import get_latency_model
+from ..services.job_tasks import get_job_tasks
+from ..services.sharding import FORWARDED_HEADER, RELAY_HEADERS, get_shard_router
 
 # 웹훅 URL (환경 변수에서 로드, 선택 사항)
 WEBHOOK_URL = os.getenv("SPRING_WEBHOOK_URL", "")
+# 웹훅 타임아웃 상한 / 하한 (초, 그 사이에서 Spring 응답 시간 백분위로 결정)
+WEBHOOK_TIMEOUT = float(os.getenv("WEBHOOK_TIMEOUT", "10"))
+WEBHOOK_TIMEOUT_MIN = float(os.getenv("WEBHOOK_TIMEOUT_MIN", "1"))
+
+# 일괄 요청 / 일괄 조회 최대 건수
+COMMENTARY_BATCH_MAX_JOBS = int(os.getenv("COMMENTARY_BATCH_MAX_JOBS", "50"))
+
+# 마감 시간 초과 작업 처리: fallback (규칙 기반 해설로 완료) 또는 drop (DEADLINE_EXCEEDED 오류)
+JOB_DEADLINE_POLICY = os.getenv("JOB_DEADLINE_POLICY", "fallback")
 
 router = APIRouter(prefix="/ai/commentary", tags=["commentary"])
 
+# 워커 간 푸시 이벤트 중계 수신 경로 (전달 수신 Unix 소켓으로만 허용)
+PUSH_RELAY_PATH = "/ai/commentary/push/relay"
+
+# 대체된 작업의 오류 웹훅 전송 태스크 (새 작업 시작을 지연시키지 않도록 분리, GC 방지용 참조)
+_webhook_tasks: set = set()
+
+
+def _to_script_items(scripts: List[dict]) -> List[ScriptItem]:
+    """스크립트 dict 배열 -> ScriptItem 배열 (알 수 없는 tone은 DEFAULT)"""
+    script_items = []
+    for s in scripts:
+        try:
+            tone = ToneEnum(s.get("tone", "DEFAULT"))
+        except ValueError:
+            tone = ToneEnum.DEFAULT
+
+        script_items.append(ScriptItem(
+            actionId=str(s.get("actionId", "")),
+            timeSeconds=str(s.get("timeSeconds", "")),
+            tone=tone,
+            description=str(s.get("description", ""))
+        ))
+    return script_items
+
+
+class DeadlineExceeded(Exception):
+    """RunPod 호출 시작 전에 작업 마감 시간 초과 (JOB_DEADLINE_POLICY=drop)"""
+
+
+def _validate_request(request: CommentaryJobRequest, label: str = "rawData") -> None:
+    """해설 생성 요청 유효성 검사 (실패 시 400)"""
+    if not request.rawData:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "errorCode": "INVALID_DATA",
+                "errorMessage": f"{label}는 비어있을 수 없습니다."
+            }
+        )
+
+    if len(request.rawData) > 20:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "errorCode": "INVALID_DATA",
+                "errorMessage": f"{label}는 20개를 초과할 수 없습니다."
+            }
+        )
+
+
+def _build_draft(request: CommentaryJobRequest) -> Optional[List[dict]]:
+    """즉시 초안 해설 (규칙 기반, 수 밀리초) - LLM 결과가 도착하면 DONE으로 교체"""
+    if not request.instantDraft:
+        return None
+    # NumPy 지연 로드 (초안 요청이 있을 때만 임포트)
+    from ..services.rule_commentary import generate_rule_scripts
+    with cpu_section("draft"):
+        return generate_rule_scripts(request.actions, request.match, request.style.value)
+
+
+def _window_end(request: CommentaryJobRequest) -> Optional[tuple]:
+    """윈도우 마지막 액션 시각 (periodId, timeSeconds), 시각 정보가 없으면 None"""
+    times = [
+        (action.period or 0, action.time_value)
+        for action in request.actions if action.time_value is not None
+    ]
+    return max(times) if times else None
+
+
+def _check_overload() -> bool:
+    """
+    이벤트 루프 과부하 시 새 해설 요청 처리 (기존 작업 상태 조회는 영향 없음)
+
+    Returns:
+        True: 규칙 기반 해설로 대체 (LOOP_LAG_SHED_POLICY=fallback), False: 정상 처리
+
+    Raises:
+        HTTPException: 503 + Retry-After (LOOP_LAG_SHED_POLICY=reject)
+    """
+    monitor = get_loop_monitor()
+    if not monitor.shedding:
+        return False
+
+    monitor.note_shed()
+    if monitor.policy == "reject":
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "errorCode": "OVERLOADED",
+                "errorMessage": f"서버가 과부하 상태입니다. {LOOP_LAG_RETRY_AFTER}초 후 다시 요청하세요."
+            },
+            headers={"Retry-After": str(LOOP_LAG_RETRY_AFTER)}
+        )
+    return True
+
+
+def _job_response(
+    job_id: str,
+    job: JobData
+) -> Union[JobPendingResponse, JobDoneResponse, JobErrorResponse]:
+    """JobData -> 상태별 응답 모델"""
+    if job.status == JobStatus.PENDING:
+        return JobPendingResponse(
+            jobId=job_id,
+            status=JobStatusEnum.PENDING,
+            draftScript=_to_script_items(job.draft_script) if job.draft_script else None
+        )
+
+    if job.status == JobStatus.DONE:
+        return JobDoneResponse(
+            gameId=job.game_id,
+            jobId=job_id,
+            status=JobStatusEnum.DONE,
+            script=_to_script_items(job.script)
+        )
+
+    return JobErrorResponse(
+        jobId=job_id,
+        status=JobStatusEnum.ERROR,
+        errorCode=job.error_code or "UNKNOWN_ERROR",
+        errorMessage=job.error_message or "알 수 없는 오류가 발생했습니다."
+    )
+
+
+def _publish_job(job_id: str, job: Optional[JobData]) -> None:
+    """
+    작업 상태를 WebSocket 구독자에게 발행 (GET /jobs/{jobId} 응답과 같은 필드)
+    SHARD_COUNT>1이면 다른 워커에도 중계 (백엔드의 WebSocket이 다른 워커에 연결되어 있어도 수신)
+    """
+    if job is None:
+        return
+    payload = _job_response(job_id, job).model_dump(mode="json", exclude_none=True)
+    terminal = job.status != JobStatus.PENDING
+    get_push_hub().publish(job.game_id, job_id, payload, terminal=terminal)
+    get_shard_router().relay(PUSH_RELAY_PATH, {
+        "gameId": job.game_id, "jobId": job_id, "payload": payload, "terminal": terminal
+    })
+
+
+def _relay(forwarded: httpx.Response) -> Response:
+    """소유 워커 응답 -> 클라이언트 응답 (상태 코드 / 본문 / ETag 등 유지)"""
+    headers = {name: forwarded.headers[name] for name in RELAY_HEADERS if name in forwarded.headers}
+    return Response(content=forwarded.content, status_code=forwarded.status_code, headers=headers)
+
+
+def _shard_unavailable(shard: int) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail={
+            "errorCode": "SHARD_UNAVAILABLE",
+            "errorMessage": f"작업을 처리하는 워커(샤드 {shard})에 연결할 수 없습니다."
+        },
+        headers={"Retry-After": "1"}
+    )
+
+
+async def _forward_job_request(job_id: str, http_request: Request) -> Optional[Response]:
+    """
+    Job ID의 소유 샤드가 다른 워커면 요청 전달
+
+    Returns:
+        소유 워커 응답, 이 워커가 처리해야 하면 None
+
+    Raises:
+        HTTPException: 503 (소유 워커 연결 실패)
+    """
+    shard_router = get_shard_router()
+    shard = shard_router.owner_of_job(job_id)
+    if shard_router.is_local(shard) or FORWARDED_HEADER in http_request.headers:
+        return None
+    forwarded = await shard_router.forward(
+        shard, http_request.method, http_request.url.path, http_request.url.query,
+        await http_request.body(), http_request.headers
+    )
+    if forwarded is None:
+        raise _shard_unavailable(shard)
+    return _relay(forwarded)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 (약한 비교, "*" 허용)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 async def send_webhook(
     job_id: str,
@@ -36,7 +266,7 @@ async def send_webhook(
     script: list = None,
     error_code: str = None,
     error_message: str = None
-):
+) -> bool:
     """
     Spring Backend로 웹훅 전송
 
@@ -47,10 +277,13 @@ async def send_webhook(
         script: 생성된 해설 배열 (성공 시)
         error_code: 에러 코드 (실패 시)
         error_message: 에러 메시지 (실패 시)
+
+    Returns:
+        Spring Backend가 200으로 응답했는지 여부
     """
     if not WEBHOOK_URL:
         print(f"[WEBHOOK] 웹훅 URL이 설정되지 않았습니다. 웹훅 전송을 건너뜁니다.")
-        return
+        return False
 
     try:
         # 웹훅 페이로드 구성
@@ -66,22 +299,30 @@ async def send_webhook(
             callback_data["errorCode"] = error_code
             callback_data["errorMessage"] = error_message
 
-        # 웹훅 전송
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        # 웹훅 전송 (타임아웃은 최근 Spring 응답 시간 기반)
+        latency_model = get_latency_model()
+        timeout = latency_model.deadline(
+            "spring_webhook", floor=WEBHOOK_TIMEOUT_MIN, ceiling=WEBHOOK_TIMEOUT
+        ) or WEBHOOK_TIMEOUT
+        started = time.monotonic()
+        async with httpx.AsyncClient(timeout=timeout) as client:
             response = await client.post(WEBHOOK_URL, json=callback_data)
+            latency_model.observe("spring_webhook", time.monotonic() - started)
 
             if response.status_code == 200:
                 print(f"[WEBHOOK] 웹훅 전송 성공: {job_id} -> {WEBHOOK_URL}")
-            else:
-                print(f"[WEBHOOK] 웹훅 응답 오류: {response.status_code} - {response.text}")
+                return True
+            print(f"[WEBHOOK] 웹훅 응답 오류: {response.status_code} - {response.text}")
 
     except Exception as e:
         print(f"[WEBHOOK] 웹훅 전송 실패 (Spring 서버가 꺼져있나요?): {e}")
+    return False
 
 
 async def generate_commentary_task(
     job_id: str,
-    request: CommentaryJobRequest
+    request: CommentaryJobRequest,
+    degraded: bool = False
 ):
     """
     백그라운드 해설 생성 태스크
@@ -89,39 +330,91 @@ async def generate_commentary_task(
     Args:
         job_id: Job ID
         request: 해설 생성 요청
+        degraded: True면 RunPod 호출 없이 규칙 기반 해설로 완료 (이벤트 루프 과부하)
     """
     print(f"[DEBUG] Background task started for job {job_id}")
     job_store = get_job_store()
-    runpod_service = get_runpod_service()
+    job = None
 
     try:
-        # matchInfo와 rawData는 이미 dict 형태
-        match_info_dict = request.matchInfo
-        raw_data_list = request.rawData
+        runpod_service = get_runpod_service()
+        # 수신 시 정규화된 matchInfo / rawData 레코드
+        match_info = request.match
+        actions = request.actions
+        job = await job_store.get_job(job_id)
+        if job is not None:
+            job.mark("started")
 
-        print(f"[DEBUG] Calling RunPod LLM for {len(raw_data_list)} actions...")
+        # 비동기 모드: 재시작 후 결과 수집을 재개할 수 있도록 원본 요청 보관 (원격 작업 저널에 기록)
+        if job is not None and RUNPOD_CALL_MODE == "async" and job.resume_request is None:
+            job.resume_request = request.model_dump(mode="json")
 
-        # RunPod LLM 호출
-        scripts = await runpod_service.call_llm(
-            style=request.style.value,
-            match_info=match_info_dict,
-            raw_data=raw_data_list
-        )
+        # 우선순위 / 마감 시간 기준 RunPod 호출 슬롯 대기 (과부하 대체 시 호출 생략)
+        scheduler = get_job_scheduler()
+        dispatched = False
+        if not degraded:
+            dispatched = await scheduler.acquire(
+                request.priority.value,
+                job.deadline if job else None
+            )
+            if job is not None and dispatched:
+                job.mark("dispatched")
+
+        if degraded:
+            print(f"[LOAD] {job_id} 이벤트 루프 과부하 - 규칙 기반 해설로 완료")
+            scripts = runpod_service._generate_fallback_scripts(
+                actions, match_info, request.style.value
+            )
+        elif not dispatched:
+            print(f"[SCHEDULER] {job_id} 마감 시간 초과 ({request.priority.value}) - {JOB_DEADLINE_POLICY}")
+            if JOB_DEADLINE_POLICY == "drop":
+                raise DeadlineExceeded(f"Job {job_id}의 마감 시간({request.deadlineSeconds}초)이 지났습니다.")
+            scripts = runpod_service._generate_fallback_scripts(
+                actions, match_info, request.style.value
+            )
+        else:
+            try:
+                print(f"[DEBUG] Calling RunPod LLM for {len(actions)} actions...")
+
+                # RunPod LLM 호출
+                scripts = await runpod_service.call_llm(
+                    style=request.style.value,
+                    match_info=match_info,
+                    raw_data=actions,
+                    job=job
+                )
+            finally:
+                scheduler.release()
 
         print(f"[DEBUG] LLM returned {len(scripts)} scripts")
 
         # 작업 완료 업데이트
         await job_store.update_job_done(job_id, scripts)
+        if job is not None:
+            job.mark("stored")
+        _publish_job(job_id, job)
 
         print(f"Job {job_id} completed with {len(scripts)} scripts")
 
         # [웹훅] Spring Backend로 완료 알림 전송
-        await send_webhook(
+        acked = await send_webhook(
             job_id=job_id,
             game_id=request.gameId,
             status="DONE",
             script=scripts
         )
+        if job is not None and acked:
+            job.mark("webhook_acked")
+
+        # 경기 아카이브 저장 (재생/하이라이트 조회용, 웹훅 전송 후)
+        await get_script_archive().append_async(
+            request.gameId, request.style.value, scripts, actions, job_id
+        )
+        if job is not None and get_script_archive().enabled:
+            job.mark("archived")
+
+        if job is not None and job.remote_job_id:
+            await get_async_poller().journal.record_finished(job_id)
 
     except Exception as e:
         # 작업 오류 업데이트
@@ -131,12 +424,15 @@ async def generate_commentary_task(
         import traceback
         traceback.print_exc()
 
-        if "timeout" in error_message.lower():
+        if isinstance(e, DeadlineExceeded):
+            error_code = "DEADLINE_EXCEEDED"
+        elif "timeout" in error_message.lower():
             error_code = "LLM_TIMEOUT"
         else:
             error_code = "LLM_ERROR"
 
         await job_store.update_job_error(job_id, error_code, error_message)
+        _publish_job(job_id, await job_store.get_job(job_id))
         print(f"Job {job_id} failed: {error_code} - {error_message}")
 
         # [웹훅] Spring Backend로 실패 알림 전송
@@ -148,6 +444,138 @@ async def generate_commentary_task(
             error_message=error_message
         )
 
+        # 취소(워커 종료)가 아닌 실패만 완료로 기록 -> 종료로 중단된 원격 작업은 재시작 후 재개
+        if job is not None and job.remote_job_id:
+            await get_async_poller().journal.record_finished(job_id)
+
+
+async def resume_remote_jobs() -> int:
+    """
+    재시작 전에 제출한 RunPod 원격 작업의 결과 수집 재개 (lifespan에서 호출, RUNPOD_CALL_MODE=async)
+    워커들이 저널을 공유하므로 이 워커의 샤드 번호로 발급된 작업만 재개 (중복 폴링 / 웹훅 방지)
+
+    Returns:
+        재개한 작업 수
+    """
+    journal = get_async_poller().journal
+    try:
+        entries = await asyncio.to_thread(journal.load_unfinished, get_shard_router().issued_here)
+    except Exception as e:
+        print(f"[RUNPOD-ASYNC] 저널 로드 실패: {e}")
+        return 0
+
+    job_store = get_job_store()
+    resumed = 0
+    for entry in entries:
+        try:
+            request = CommentaryJobRequest.model_validate(entry["request"])
+        except Exception as e:
+            print(f"[RUNPOD-ASYNC] 저널 항목 복원 실패 ({entry.get('jobId')}): {e}")
+            await journal.record_finished(entry.get("jobId", ""))
+            continue
+
+        job_id = entry["jobId"]
+        job = await job_store.restore_job(
+            job_id, request.gameId, request.style.value, request.priority.value
+        )
+        job.remote_job_id = entry.get("remoteJobId")
+        job.remote_endpoint = entry.get("endpoint")
+        job.resume_request = entry["request"]
+
+        get_job_tasks().start(
+            job_id, request.gameId, request.style.value, generate_commentary_task(job_id, request)
+        )
+        resumed += 1
+
+    if resumed:
+        print(f"[RUNPOD-ASYNC] 원격 작업 {resumed}개 결과 수집 재개")
+    return resumed
+
+
+async def _run_job_task(
+    job_id: str,
+    request: CommentaryJobRequest,
+    degraded: bool = False
+) -> None:
+    """작업 태스크를 레지스트리에 등록하여 실행 (취소 가능) 후 종료 대기"""
+    task = get_job_tasks().start(
+        job_id, request.gameId, request.style.value,
+        generate_commentary_task(job_id, request, degraded)
+    )
+    try:
+        # 작업 취소(CancelledError)는 이 태스크로 전파하지 않음
+        await asyncio.wait({task})
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+
+
+async def _run_batch_tasks(items: List[tuple], degraded: bool = False) -> None:
+    """일괄 요청 작업 동시 실행"""
+    await asyncio.gather(*(
+        _run_job_task(job_id, request, degraded) for job_id, request in items
+    ))
+
+
+async def _cancel_job(job_id: str, reason: str, error_code: str, error_message: str) -> bool:
+    """
+    진행 중인 작업 취소 (스케줄러 대기 / RunPod 호출 중단, 비동기 모드 원격 작업 취소) 후 ERROR 상태로 기록
+
+    Args:
+        job_id: Job ID
+        reason: 취소 사유 (메트릭 라벨, "deleted" / "superseded")
+        error_code: 기록할 에러 코드 (CANCELLED / SUPERSEDED)
+        error_message: 기록할 에러 메시지
+
+    Returns:
+        False: 이미 완료되었거나 없는 작업
+    """
+    job_store = get_job_store()
+    job = await job_store.get_job(job_id)
+    if job is None or job.status != JobStatus.PENDING:
+        return False
+
+    await get_job_tasks().cancel(job_id, reason)
+    if job.remote_job_id:
+        await get_runpod_service().cancel_remote(job)
+
+    # 취소 대기 중 완료된 경우 결과 유지
+    if job.status != JobStatus.PENDING:
+        return False
+    await job_store.update_job_error(job_id, error_code, error_message)
+    _publish_job(job_id, job)
+    print(f"[CANCEL] {job_id} 취소: {error_code}")
+    return True
+
+
+async def _supersede_jobs(job_ids: List[str]) -> None:
+    """
+    같은 gameId + style의 이전 윈도우 작업 대체 (JOB_SUPERSEDE_POLICY, 새 작업 태스크 시작 전 실행)
+
+    Args:
+        job_ids: 새로 생성한 Job ID (같은 요청의 작업끼리는 대체하지 않음)
+    """
+    job_tasks = get_job_tasks()
+    if job_tasks.supersede_policy == "off":
+        return
+
+    job_store = get_job_store()
+    for job_id, job in (await job_store.get_jobs(job_ids)).items():
+        if job is None:
+            continue
+        for older_id in await job_tasks.supersede_candidates(job, exclude=job_ids):
+            error_message = f"같은 경기/스타일의 새 요청({job_id})으로 대체되었습니다."
+            if await _cancel_job(older_id, "superseded", "SUPERSEDED", error_message):
+                task = asyncio.create_task(send_webhook(
+                    job_id=older_id,
+                    game_id=job.game_id,
+                    status="ERROR",
+                    error_code="SUPERSEDED",
+                    error_message=error_message
+                ))
+                _webhook_tasks.add(task)
+                task.add_done_callback(_webhook_tasks.discard)
+
 
 @router.post(
     "/jobs",
@@ -157,7 +585,8 @@ async def generate_commentary_task(
 )
 async def create_commentary_job(
     request: CommentaryJobRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    http_request: Request
 ):
     """
     해설 생성 작업 생성
@@ -165,7 +594,20 @@ async def create_commentary_job(
     - matchInfo: 경기 메타데이터 (1개)
     - rawData: 이벤트 로그 데이터 (10개)
     - style: CASTER, ANALYST, FRIEND
+    - 경기 소유 샤드가 다른 워커면 그 워커로 전달 (전달 실패 / 5xx면 이 워커에서 생성)
     """
+    shard_router = get_shard_router()
+    shard = shard_router.owner_of_game(request.gameId)
+    if not shard_router.is_local(shard) and FORWARDED_HEADER not in http_request.headers:
+        _validate_request(request)
+        forwarded = await shard_router.forward(
+            shard, "POST", http_request.url.path, body=await http_request.body(),
+            headers={"content-type": "application/json"}
+        )
+        if forwarded is not None and forwarded.status_code < 500:
+            return _relay(forwarded)
+        print(f"[SHARD] 샤드 {shard} 응답 없음 - {request.gameId} 작업을 이 워커에서 생성")
+
     print(f"\n{'='*60}")
     print(f"[REQUEST] 해설 생성 요청 수신")
     print(f"[REQUEST] gameId: {request.gameId}, style: {request.style.value}")
@@ -173,58 +615,65 @@ async def create_commentary_job(
     print(f"{'='*60}\n")
 
     job_store = get_job_store()
+    get_warmup_scheduler().note_activity(request.gameId)
 
     # 유효성 검사
-    if not request.rawData:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "errorCode": "INVALID_DATA",
-                "errorMessage": "rawData는 비어있을 수 없습니다."
-            }
-        )
+    _validate_request(request)
 
-    if len(request.rawData) > 20:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "errorCode": "INVALID_DATA",
-                "errorMessage": "rawData는 20개를 초과할 수 없습니다."
-            }
-        )
+    # 이벤트 루프 과부하: 503 (reject) 또는 규칙 기반 해설로 대체 (fallback)
+    degraded = _check_overload()
+
+    draft_script = _build_draft(request)
 
     # Job 생성
     job_id = await job_store.create_job(
         game_id=request.gameId,
-        style=request.style.value
+        style=request.style.value,
+        draft_script=draft_script,
+        priority=request.priority.value,
+        deadline_seconds=request.deadlineSeconds,
+        window_end=_window_end(request)
     )
     print(f"[JOB] Job ID 생성 완료: {job_id}")
+    _publish_job(job_id, await job_store.get_job(job_id))
 
-    # 백그라운드 태스크 시작
+    # 백그라운드 태스크 시작 (이전 윈도우 작업 대체 후)
+    background_tasks.add_task(_supersede_jobs, [job_id])
     background_tasks.add_task(
-        generate_commentary_task,
+        _run_job_task,
         job_id,
-        request
+        request,
+        degraded
     )
     print(f"[JOB] 백그라운드 태스크 시작: {job_id}\n")
 
-    return JobPendingResponse(jobId=job_id, status=JobStatusEnum.PENDING)
+    return JobPendingResponse(
+        jobId=job_id,
+        status=JobStatusEnum.PENDING,
+        draftScript=_to_script_items(draft_script) if draft_script else None
+    )
 
 
 @router.get(
     "/jobs/{job_id}",
     response_model=Union[JobPendingResponse, JobDoneResponse, JobErrorResponse],
     summary="작업 상태 조회",
-    description="Job ID로 작업 상태 및 결과를 조회합니다."
+    description="Job ID로 작업 상태 및 결과를 조회합니다. "
+                "응답의 ETag를 If-None-Match로 보내면 상태가 바뀌지 않은 경우 본문 없이 304를 반환합니다."
 )
-async def get_job_status(job_id: str):
+async def get_job_status(job_id: str, request: Request, response: Response):
     """
     작업 상태 조회
 
     - PENDING: 처리 중
     - DONE: 완료 (script 배열 포함)
     - ERROR: 오류 발생
+    - 304: If-None-Match가 현재 ETag와 일치 (상태 변경 없음)
     """
+    forwarded = await _forward_job_request(job_id, request)
+    if forwarded is not None:
+        return forwarded
+
     print(f"[POLLING] Job 상태 조회: {job_id}")
     job_store = get_job_store()
     job = await job_store.get_job(job_id)
@@ -238,64 +687,288 @@ async def get_job_status(job_id: str):
             }
         )
 
+    # 조건부 요청: 상태가 바뀌지 않았으면 본문 없이 304
+    etag = job.etag
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        get_metrics().incr("job_status_not_modified_total", status=job.status.value)
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
     if job.status == JobStatus.PENDING:
         print(f"[POLLING] {job_id} - 상태: PENDING (처리 중)")
-        return JobPendingResponse(jobId=job_id, status=JobStatusEnum.PENDING)
-
     elif job.status == JobStatus.DONE:
         print(f"[POLLING] {job_id} - 상태: DONE (완료, script {len(job.script)}개)")
-        # script 항목을 ScriptItem으로 변환
-        script_items = []
-        for s in job.script:
-            try:
-                tone = ToneEnum(s.get("tone", "DEFAULT"))
-            except ValueError:
-                tone = ToneEnum.DEFAULT
+    else:  # ERROR
+        print(f"[POLLING] {job_id} - 상태: ERROR ({job.error_code})")
 
-            script_items.append(ScriptItem(
-                actionId=str(s.get("actionId", "")),
-                timeSeconds=str(s.get("timeSeconds", "")),
-                tone=tone,
-                description=str(s.get("description", ""))
-            ))
+    return _job_response(job_id, job)
 
-        return JobDoneResponse(
-            gameId=job.game_id,
-            jobId=job_id,
-            status=JobStatusEnum.DONE,
-            script=script_items
+
+@router.get(
+    "/jobs/{job_id}/timings",
+    response_model=JobTimingsResponse,
+    summary="작업 단계별 지연 타임라인",
+    description="작업 생성부터 스케줄러 대기, 프롬프트 생성, RunPod 요청/응답, 파싱, 저장, 웹훅 전송까지 "
+                "단계별 시각을 조회합니다. format=trace이면 Chrome Trace Event 형식(chrome://tracing, Perfetto)으로 반환합니다."
+)
+async def get_job_timings(
+    job_id: str,
+    http_request: Request,
+    format: str = Query(default="json", pattern="^(json|trace)$")
+):
+    """작업 단계별 지연 타임라인 반환"""
+    forwarded = await _forward_job_request(job_id, http_request)
+    if forwarded is not None:
+        return forwarded
+
+    job = await get_job_store().get_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "errorCode": "JOB_NOT_FOUND",
+                "errorMessage": f"Job {job_id}를 찾을 수 없습니다."
+            }
         )
 
-    else:  # ERROR
-        print(f"[POLLING] {job_id} - 상태: ERROR ({job.error_code})")
-        return JobErrorResponse(
+    if format == "trace":
+        return JSONResponse(job.trace_events(job_id))
+
+    timeline = job.timeline()
+    return JobTimingsResponse(
+        jobId=job_id,
+        status=JobStatusEnum(job.status.value),
+        stages=[
+            JobTimingStage(stage=stage, offsetMs=round(offset_ms, 3), deltaMs=round(delta_ms, 3))
+            for stage, offset_ms, delta_ms in timeline
+        ],
+        totalMs=round(timeline[-1][1], 3)
+    )
+
+
+@router.post(
+    "/jobs:batch",
+    response_model=JobBatchCreatedResponse,
+    summary="해설 생성 일괄 요청",
+    description="여러 해설 생성 요청을 한 번에 받아 Job ID 목록을 요청 순서대로 반환합니다."
+)
+async def create_commentary_jobs_batch(
+    request: CommentaryBatchRequest,
+    background_tasks: BackgroundTasks,
+    http_request: Request
+):
+    """
+    해설 생성 작업 일괄 생성
+
+    - 하나라도 유효하지 않으면 전체 요청을 거부 (400, 작업 생성 없음)
+    - 각 작업은 단건 요청과 동일하게 백그라운드에서 처리
+    - 경기 소유 샤드가 다른 작업은 샤드별 일괄 요청으로 전달 (전달 실패 / 5xx면 이 워커에서 생성)
+    """
+    if not request.jobs:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "errorCode": "INVALID_DATA",
+                "errorMessage": "jobs는 비어있을 수 없습니다."
+            }
+        )
+
+    if len(request.jobs) > COMMENTARY_BATCH_MAX_JOBS:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "errorCode": "INVALID_DATA",
+                "errorMessage": f"jobs는 {COMMENTARY_BATCH_MAX_JOBS}개를 초과할 수 없습니다."
+            }
+        )
+
+    for index, item in enumerate(request.jobs):
+        _validate_request(item, label=f"jobs[{index}].rawData")
+
+    # 소유 샤드별 작업 위치
+    shard_router = get_shard_router()
+    groups: Dict[int, List[int]] = {}
+    if FORWARDED_HEADER not in http_request.headers:
+        for index, item in enumerate(request.jobs):
+            shard = shard_router.owner_of_game(item.gameId)
+            if not shard_router.is_local(shard):
+                groups.setdefault(shard, []).append(index)
+
+    # 이 워커에서 생성할 작업이 있을 때만 과부하 확인
+    remote_count = sum(len(indexes) for indexes in groups.values())
+    degraded = _check_overload() if remote_count < len(request.jobs) else False
+
+    print(f"[REQUEST] 해설 생성 일괄 요청 수신: {len(request.jobs)}건")
+
+    results: Dict[int, JobPendingResponse] = {}
+    if groups:
+        results = await _forward_batch(groups, http_request)
+    local = [(index, item) for index, item in enumerate(request.jobs) if index not in results]
+    if local:
+        for (index, _), created in zip(local, await _create_batch_local(
+            [item for _, item in local], background_tasks, degraded
+        )):
+            results[index] = created
+
+    return JobBatchCreatedResponse(
+        jobs=[results[index] for index in range(len(request.jobs))],
+        count=len(request.jobs)
+    )
+
+
+async def _forward_batch(groups: Dict[int, List[int]], http_request: Request) -> Dict[int, JobPendingResponse]:
+    """
+    소유 샤드별 일괄 요청 전달
+
+    Args:
+        groups: {샤드: 원본 jobs 위치}
+        http_request: 원본 요청 (jobs 항목을 그대로 전달)
+
+    Returns:
+        {원본 위치: 생성된 작업} (전달에 실패한 샤드의 작업은 제외 -> 이 워커에서 생성)
+    """
+    shard_router = get_shard_router()
+    raw_jobs = json.loads(await http_request.body())["jobs"]
+    shards = list(groups.items())
+    responses = await asyncio.gather(*(
+        shard_router.forward(
+            shard, "POST", http_request.url.path,
+            body=json.dumps({"jobs": [raw_jobs[index] for index in indexes]}, ensure_ascii=False).encode("utf-8"),
+            headers={"content-type": "application/json"}
+        )
+        for shard, indexes in shards
+    ))
+
+    results = {}
+    for (shard, indexes), forwarded in zip(shards, responses):
+        if forwarded is None or forwarded.status_code != 200:
+            print(f"[SHARD] 샤드 {shard} 응답 없음 - 작업 {len(indexes)}개를 이 워커에서 생성")
+            continue
+        for index, item in zip(indexes, forwarded.json()["jobs"]):
+            results[index] = JobPendingResponse.model_validate(item)
+    return results
+
+
+async def _create_batch_local(
+    items: List[CommentaryJobRequest],
+    background_tasks: BackgroundTasks,
+    degraded: bool
+) -> List[JobPendingResponse]:
+    """이 워커에서 일괄 작업 생성 및 백그라운드 태스크 시작"""
+    warmup_scheduler = get_warmup_scheduler()
+    drafts = []
+    for item in items:
+        warmup_scheduler.note_activity(item.gameId)
+        drafts.append(_build_draft(item))
+
+    job_ids = await get_job_store().create_jobs([
+        {
+            "game_id": item.gameId,
+            "style": item.style.value,
+            "draft_script": draft,
+            "priority": item.priority.value,
+            "deadline_seconds": item.deadlineSeconds,
+            "window_end": _window_end(item)
+        }
+        for item, draft in zip(items, drafts)
+    ])
+    for job_id, job in (await get_job_store().get_jobs(job_ids)).items():
+        _publish_job(job_id, job)
+
+    # BackgroundTasks는 순차 실행되므로 일괄 작업은 한 태스크에서 동시에 시작 (순서는 스케줄러가 결정)
+    background_tasks.add_task(_supersede_jobs, job_ids)
+    background_tasks.add_task(_run_batch_tasks, list(zip(job_ids, items)), degraded)
+    print(f"[JOB] 백그라운드 태스크 {len(job_ids)}개 시작")
+
+    return [
+        JobPendingResponse(
             jobId=job_id,
-            status=JobStatusEnum.ERROR,
-            errorCode=job.error_code or "UNKNOWN_ERROR",
-            errorMessage=job.error_message or "알 수 없는 오류가 발생했습니다."
+            status=JobStatusEnum.PENDING,
+            draftScript=_to_script_items(draft) if draft else None
         )
+        for job_id, draft in zip(job_ids, drafts)
+    ]
 
 
 @router.get(
     "/jobs",
-    summary="모든 작업 목록 조회",
-    description="현재 저장된 모든 작업 목록을 조회합니다. (디버깅용)"
+    summary="작업 상태 일괄 조회 / 모든 작업 목록 조회",
+    description="ids(쉼표 구분 Job ID)를 지정하면 해당 작업들의 상태를 한 번에 조회합니다. "
+                "지정하지 않으면 현재 저장된 모든 작업 목록을 조회합니다. (디버깅용)"
 )
-async def list_jobs():
-    """모든 작업 목록 반환 (디버깅용)"""
+async def list_jobs(http_request: Request, ids: Optional[str] = None):
+    """작업 상태 일괄 조회 또는 모든 작업 목록 반환 (ids는 소유 샤드별로 나눠 조회, 목록은 이 워커만)"""
     job_store = get_job_store()
-    jobs = await job_store.list_jobs()
-    return {"jobs": jobs, "count": len(jobs)}
+
+    if ids is None:
+        jobs = await job_store.list_jobs()
+        return {"jobs": jobs, "count": len(jobs)}
+
+    # 중복 제거 (순서 유지)
+    job_ids = list(dict.fromkeys(job_id.strip() for job_id in ids.split(",") if job_id.strip()))
+    if len(job_ids) > COMMENTARY_BATCH_MAX_JOBS:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "errorCode": "INVALID_DATA",
+                "errorMessage": f"ids는 {COMMENTARY_BATCH_MAX_JOBS}개를 초과할 수 없습니다."
+            }
+        )
+
+    # 다른 워커 소유 작업은 샤드별로 한 번씩 전달
+    shard_router = get_shard_router()
+    remote: Dict[int, List[str]] = {}
+    if FORWARDED_HEADER not in http_request.headers:
+        for job_id in job_ids:
+            shard = shard_router.owner_of_job(job_id)
+            if not shard_router.is_local(shard):
+                remote.setdefault(shard, []).append(job_id)
+
+    if not remote:
+        found = await job_store.get_jobs(job_ids)
+        return JobBatchStatusResponse(
+            jobs=[_job_response(job_id, job) for job_id, job in found.items() if job is not None],
+            missing=[job_id for job_id, job in found.items() if job is None]
+        )
+
+    groups = list(remote.items())
+    responses = await asyncio.gather(*(
+        shard_router.forward(shard, "GET", http_request.url.path, f"ids={','.join(group)}")
+        for shard, group in groups
+    ))
+    statuses: Dict[str, Optional[dict]] = {}
+    for (shard, group), forwarded in zip(groups, responses):
+        if forwarded is None or forwarded.status_code != 200:
+            raise _shard_unavailable(shard)
+        body = forwarded.json()
+        statuses.update({item["jobId"]: item for item in body["jobs"]})
+        statuses.update({job_id: None for job_id in body["missing"]})
+
+    local_ids = [job_id for job_id in job_ids if job_id not in statuses]
+    for job_id, job in (await job_store.get_jobs(local_ids)).items():
+        statuses[job_id] = _job_response(job_id, job).model_dump(mode="json") if job is not None else None
+
+    return JSONResponse({
+        "jobs": [statuses[job_id] for job_id in job_ids if statuses.get(job_id) is not None],
+        "missing": [job_id for job_id in job_ids if statuses.get(job_id) is None]
+    })
 
 
 @router.delete(
     "/jobs/{job_id}",
-    summary="작업 삭제",
-    description="Job ID로 작업을 삭제합니다."
+    summary="작업 취소 및 삭제",
+    description="Job ID로 작업을 삭제합니다. 진행 중인 작업은 스케줄러 대기 / RunPod 호출을 중단하고 슬롯을 반환합니다."
 )
-async def delete_job(job_id: str):
-    """작업 삭제"""
+async def delete_job(job_id: str, http_request: Request):
+    """작업 취소 및 삭제 (취소된 작업은 구독자에게 CANCELLED 오류로 발행, 웹훅 없음)"""
+    forwarded = await _forward_job_request(job_id, http_request)
+    if forwarded is not None:
+        return forwarded
+
     job_store = get_job_store()
+    cancelled = await _cancel_job(job_id, "deleted", "CANCELLED", f"Job {job_id}가 삭제되어 취소되었습니다.")
     deleted = await job_store.delete_job(job_id)
 
     if not deleted:
@@ -307,4 +980,344 @@ async def delete_job(job_id: str):
             }
         )
 
-    return {"message": f"Job {job_id} 삭제 완료"}
+    return {"message": f"Job {job_id} 삭제 완료", "cancelled": cancelled}
+
+
+@router.get(
+    "/games/{game_id}/script",
+    response_model=GameScriptResponse,
+    summary="경기 해설 구간 조회",
+    description="아카이브에 저장된 경기 해설을 시간 구간(from~to, 초) / 스타일 / 전후반으로 조회합니다. "
+                "LLM 호출 없이 저장된 해설만 반환합니다."
+)
+async def get_game_script(
+    game_id: str,
+    time_from: Optional[float] = Query(default=None, alias="from"),
+    time_to: Optional[float] = Query(default=None, alias="to"),
+    style: Optional[StyleEnum] = None,
+    period: Optional[int] = None
+):
+    """경기 해설 구간 조회 (재생/하이라이트용)"""
+    archive = get_script_archive()
+    if not archive.enabled:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "errorCode": "ARCHIVE_DISABLED",
+                "errorMessage": "해설 아카이브가 비활성화되어 있습니다. (COMMENTARY_ARCHIVE_PATH)"
+            }
+        )
+
+    rows = await archive.query_async(
+        game_id,
+        style=style.value if style else None,
+        time_from=time_from,
+        time_to=time_to,
+        period_id=period
+    )
+
+    script = []
+    for row in rows:
+        try:
+            tone = ToneEnum(row["tone"])
+        except ValueError:
+            tone = ToneEnum.DEFAULT
+        script.append(ArchivedScriptItem(**{**row, "tone": tone}))
+
+    return GameScriptResponse(gameId=game_id, script=script, count=len(script))
+
+
+@router.get(
+    "/usage",
+    summary="토큰 사용량 조회",
+    description="LLM 토큰 사용량을 전체 / 스타일 / 경기 / 엔드포인트별로 조회합니다. gameId 지정 시 해당 경기만 반환합니다."
+)
+async def get_usage(gameId: Optional[str] = None):
+    """토큰 사용량 집계 반환"""
+    tracker = get_usage_tracker()
+    if gameId is None:
+        return tracker.snapshot()
+
+    usage = tracker.game_usage(gameId)
+    if usage is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "errorCode": "GAME_NOT_FOUND",
+                "errorMessage": f"경기 {gameId}의 사용량 기록이 없습니다."
+            }
+        )
+    return {"gameId": gameId, **usage}
+
+
+@router.get(
+    "/endpoints",
+    summary="RunPod 엔드포인트 상태 조회",
+    description="엔드포인트 풀의 라우팅 정책, 진행 중 요청 수, 응답 시간, 헬스 상태를 조회합니다."
+)
+async def get_endpoint_status():
+    """엔드포인트 풀 상태 반환"""
+    return get_runpod_service().pool.snapshot()
+
+
+@router.get(
+    "/scheduler",
+    summary="작업 스케줄러 상태 조회",
+    description="우선순위 클래스별 대기 작업 수, 대기 시간(p50/p95), 마감 초과 수와 작업 취소 / 대체 수를 조회합니다."
+)
+async def get_scheduler_status():
+    """작업 스케줄러 상태 반환"""
+    return {**get_job_scheduler().snapshot(), "tasks": get_job_tasks().snapshot()}
+
+
+@router.get(
+    "/latency",
+    summary="응답 시간 모델 조회",
+    description="적응형 타임아웃에 사용하는 (단계, 엔드포인트, 스타일, 액션 수)별 응답 시간 백분위를 조회합니다."
+)
+async def get_latency_status():
+    """응답 시간 모델 상태 반환"""
+    return get_latency_model().snapshot()
+
+
+@router.get(
+    "/runpod/async",
+    summary="RunPod 비동기 작업 상태 조회",
+    description="RUNPOD_CALL_MODE=async에서 결과를 기다리는 RunPod 원격 작업과 폴링/웹훅 수신 현황을 조회합니다."
+)
+async def get_runpod_async_status():
+    """RunPod 원격 작업 수집기 상태 반환"""
+    return get_async_poller().snapshot()
+
+
+@router.post(
+    "/runpod/webhook",
+    summary="RunPod 작업 완료 웹훅",
+    description="RunPod가 /run 작업 완료 시 전송하는 상태 본문을 받아 대기 중인 작업에 전달합니다. "
+                "token 쿼리 파라미터가 RUNPOD_WEBHOOK_TOKEN과 일치해야 하며, 미설정 시 웹훅을 받지 않습니다 (403)."
+)
+async def receive_runpod_webhook(payload: dict, token: Optional[str] = None):
+    """RunPod 작업 완료 웹훅 수신 (RUNPOD_WEBHOOK_TOKEN 미설정 시 403)"""
+    if not RUNPOD_WEBHOOK_TOKEN:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "errorCode": "WEBHOOK_DISABLED",
+                "errorMessage": "RunPod 웹훅 수신이 비활성화되어 있습니다. (RUNPOD_WEBHOOK_TOKEN)"
+            }
+        )
+    if not token or not hmac.compare_digest(token, RUNPOD_WEBHOOK_TOKEN):
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "errorCode": "UNAUTHORIZED",
+                "errorMessage": "웹훅 토큰이 일치하지 않습니다."
+            }
+        )
+
+    delivered = get_async_poller().deliver_webhook(payload)
+    print(f"[RUNPOD-ASYNC] 웹훅 수신: {payload.get('id')} ({payload.get('status')}) - 전달 {'완료' if delivered else '대상 없음'}")
+    return {"id": payload.get("id"), "delivered": delivered}
+
+
+@router.get(
+    "/push",
+    summary="푸시 채널 상태 조회",
+    description="WebSocket 푸시 채널의 현재 seq, 재전송 가능한 가장 오래된 seq, 구독자 수, 느린 소비자 종료 수를 조회합니다."
+)
+async def get_push_status():
+    """푸시 허브 상태 반환"""
+    return get_push_hub().snapshot()
+
+
+@router.post("/push/relay", include_in_schema=False)
+async def receive_push_relay(message: dict, http_request: Request):
+    """다른 워커가 중계한 작업 상태 이벤트를 이 워커의 WebSocket 구독자에게 발행 (내부 전용)"""
+    if not get_shard_router().is_internal(http_request.scope):
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "errorCode": "FORBIDDEN",
+                "errorMessage": "워커 간 내부 경로입니다."
+            }
+        )
+    try:
+        seq = get_push_hub().publish(
+            str(message["gameId"]), str(message["jobId"]), dict(message["payload"]),
+            terminal=bool(message.get("terminal"))
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "errorCode": "INVALID_DATA",
+                "errorMessage": f"중계 이벤트 형식 오류: {e}"
+            }
+        )
+    return {"seq": seq}
+
+
+def _split_ids(value) -> List[str]:
+    """쉼표 구분 문자열 또는 문자열 배열 -> ID 리스트"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    return [str(item).strip() for item in value if str(item).strip()]
+
+
+async def _push_subscribe(
+    subscriber: PushSubscriber,
+    game_ids: List[str],
+    job_ids: List[str],
+    since: Optional[int],
+    epoch: Optional[str]
+) -> None:
+    """구독 추가 + 놓친 이벤트 재전송 (since 없이 jobId로 구독하면 현재 상태 1회 전송)"""
+    hub = get_push_hub()
+    hub.subscribe(subscriber, game_ids, job_ids)
+    subscriber.send({
+        "type": "subscribed",
+        "gameIds": sorted(subscriber.game_ids),
+        "jobIds": sorted(subscriber.job_ids),
+        "seq": hub.seq
+    })
+    if since is not None:
+        resync = hub.replay(subscriber, since, epoch)
+        if resync:
+            # 재전송 불가 -> 클라이언트가 GET /jobs?ids= 로 현재 상태 조회
+            subscriber.send({"type": "resync", "reason": resync, "epoch": hub.epoch, "seq": hub.seq})
+
+    if since is None and job_ids:
+        for job_id, job in (await get_job_store().get_jobs(job_ids)).items():
+            if job is None:
+                continue
+            payload = _job_response(job_id, job).model_dump(mode="json", exclude_none=True)
+            subscriber.send({"type": "job", "seq": hub.seq, "snapshot": True, "gameId": job.game_id, **payload})
+            if job.status != JobStatus.PENDING:
+                subscriber.job_ids.discard(job_id)
+
+
+async def _push_sender(websocket: WebSocket, subscriber: PushSubscriber) -> None:
+    """전송 큐 -> WebSocket (연결당 유일한 송신자, 느린 소비자는 1013으로 종료)"""
+    while True:
+        text = await subscriber.queue.get()
+        if text is None:
+            await websocket.close(code=1013, reason="slow consumer: reconnect with since")
+            return
+        await websocket.send_text(text)
+
+
+async def _push_receiver(websocket: WebSocket, subscriber: PushSubscriber) -> None:
+    """클라이언트 메시지 처리 (subscribe / unsubscribe)"""
+    hub = get_push_hub()
+    while True:
+        try:
+            message = json.loads(await websocket.receive_text())
+            op = message.get("op")
+        except (ValueError, AttributeError):
+            subscriber.send({"type": "error", "errorCode": "INVALID_MESSAGE", "errorMessage": "JSON 객체가 아닙니다."})
+            continue
+
+        game_ids = _split_ids(message.get("gameIds"))
+        job_ids = _split_ids(message.get("jobIds"))
+        since = message.get("since")
+        if since is not None and not isinstance(since, int):
+            subscriber.send({"type": "error", "errorCode": "INVALID_MESSAGE", "errorMessage": "since는 정수여야 합니다."})
+            continue
+
+        if op == "subscribe":
+            await _push_subscribe(subscriber, game_ids, job_ids, since, message.get("epoch"))
+        elif op == "unsubscribe":
+            hub.unsubscribe(subscriber, game_ids, job_ids)
+            subscriber.send({
+                "type": "subscribed",
+                "gameIds": sorted(subscriber.game_ids),
+                "jobIds": sorted(subscriber.job_ids),
+                "seq": hub.seq
+            })
+        else:
+            subscriber.send({"type": "error", "errorCode": "INVALID_MESSAGE", "errorMessage": f"알 수 없는 op: {op}"})
+
+
+@router.websocket("/ws")
+async def push_channel(
+    websocket: WebSocket,
+    gameId: Optional[str] = None,
+    jobId: Optional[str] = None,
+    since: Optional[int] = None,
+    epoch: Optional[str] = None,
+    token: Optional[str] = None
+):
+    """
+    작업 상태 푸시 채널
+
+    - 쿼리 파라미터 또는 {"op": "subscribe", "gameIds": [...], "jobIds": [...], "since": n, "epoch": "..."}로 구독
+      (gameId="*"이면 모든 경기)
+    - 수신 메시지: hello(epoch, seq) / subscribed / job(seq, GET /jobs/{jobId} 응답 필드) / resync / error
+    - 재연결 시 마지막으로 받은 seq와 epoch를 since / epoch로 전달
+    """
+    if PUSH_TOKEN and not hmac.compare_digest(token or "", PUSH_TOKEN):
+        await websocket.close(code=1008, reason="invalid token")
+        return
+
+    await websocket.accept()
+    hub = get_push_hub()
+    subscriber = hub.connect()
+    if gameId or jobId:
+        await _push_subscribe(subscriber, _split_ids(gameId), _split_ids(jobId), since, epoch)
+
+    tasks = [
+        asyncio.create_task(_push_sender(websocket, subscriber)),
+        asyncio.create_task(_push_receiver(websocket, subscriber))
+    ]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        hub.disconnect(subscriber)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, WebSocketDisconnect):
+                pass
+            except RuntimeError:
+                pass  # 송신 측이 먼저 연결을 닫은 뒤의 수신 시도
+            except Exception as e:
+                print(f"[PUSH] 연결 종료 중 오류: {e}")
+
+
+@router.get(
+    "/warmup",
+    summary="웜 유지 상태 조회",
+    description="RunPod 웜 유지 스케줄러의 활성 경기와 일정을 조회합니다."
+)
+async def get_warmup_status():
+    """웜 유지 상태 반환"""
+    return get_warmup_scheduler().snapshot()
+
+
+@router.put(
+    "/warmup/schedule",
+    summary="웜 유지 경기 일정 설정",
+    description="경기 일정을 등록하면 킥오프 전후 구간 동안 RunPod 워커를 웜 상태로 유지합니다."
+)
+async def set_warmup_schedule(items: List[WarmupScheduleItem]):
+    """경기 일정 교체"""
+    try:
+        schedule = [
+            MatchWindow.from_dict(item.model_dump(exclude_none=True))
+            for item in items
+        ]
+    except (ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "errorCode": "INVALID_DATA",
+                "errorMessage": f"경기 일정 형식 오류: {e}"
+            }
+        )
+
+    get_warmup_scheduler().set_schedule(schedule)
+    return get_warmup_scheduler().snapshot()
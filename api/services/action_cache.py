@@ -0,0 +1,98 @@
+"""
+액션 단위 해설 캐시
+겹치는 슬라이딩 윈도우에서 이미 해설한 액션을 다시 생성하지 않도록 (gameId, style, actionId)별 해설 저장
+
+Version: 1.0
+"""
+
+import os
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+
+from ..models.records import ActionRecord
+from .metrics import get_metrics
+
+# 캐시 사용 여부 (기본 비활성화 - 같은 액션도 윈도우마다 새로 생성)
+ACTION_CACHE_ENABLED = os.getenv("ACTION_CACHE_ENABLED", "false").lower() == "true"
+ACTION_CACHE_MAX_ENTRIES = int(os.getenv("ACTION_CACHE_MAX_ENTRIES", "20000"))
+# 새로 생성할 액션 앞에 맥락으로 함께 보낼 캐시 액션 수 (0이면 맥락 없음)
+ACTION_CACHE_CONTEXT_ROWS = int(os.getenv("ACTION_CACHE_CONTEXT_ROWS", "2"))
+
+
+def action_id_of(item: Union[dict, ActionRecord]) -> str:
+    """액션 레코드 / 스크립트의 actionId (문자열)"""
+    if isinstance(item, ActionRecord):
+        return item.action_id
+    value = item.get("actionId", item.get("action_id", ""))
+    return "" if value is None else str(value)
+
+
+class ActionCache:
+    """(gameId, style, actionId) -> 해설 스크립트 LRU 캐시"""
+
+    def __init__(self, max_entries: int = ACTION_CACHE_MAX_ENTRIES, enabled: bool = ACTION_CACHE_ENABLED):
+        self.max_entries = max(1, max_entries)
+        self.enabled = enabled
+        self._entries: "OrderedDict[Tuple[str, str, str], dict]" = OrderedDict()
+
+    def lookup(self, game_id: str, style: str, raw_data: List[ActionRecord]) -> List[Optional[dict]]:
+        """
+        윈도우 액션별 캐시 조회
+
+        Args:
+            game_id: 경기 ID
+            style: 해설 스타일
+            raw_data: 정규화된 액션 레코드
+
+        Returns:
+            raw_data와 같은 길이의 리스트 (캐시된 스크립트 또는 None)
+        """
+        if not self.enabled or not game_id:
+            return [None] * len(raw_data)
+
+        hits: List[Optional[dict]] = []
+        for item in raw_data:
+            action_id = action_id_of(item)
+            key = (str(game_id), style, action_id)
+            script = self._entries.get(key) if action_id else None
+            if script is not None:
+                self._entries.move_to_end(key)
+            hits.append(script)
+
+        hit_count = sum(1 for script in hits if script is not None)
+        metrics = get_metrics()
+        metrics.incr("action_cache_hits_total", hit_count, style=style)
+        metrics.incr("action_cache_misses_total", len(hits) - hit_count, style=style)
+        return hits
+
+    def store(self, game_id: str, style: str, scripts: List[dict]) -> None:
+        """생성된 해설 저장 (actionId가 없는 항목은 무시)"""
+        if not self.enabled or not game_id:
+            return
+
+        for script in scripts:
+            action_id = action_id_of(script)
+            if not action_id:
+                continue
+            key = (str(game_id), style, action_id)
+            self._entries[key] = dict(script)
+            self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        get_metrics().set_gauge("action_cache_entries", len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 싱글톤 인스턴스
+_action_cache: Optional[ActionCache] = None
+
+
+def get_action_cache() -> ActionCache:
+    """ActionCache 인스턴스 반환"""
+    global _action_cache
+    if _action_cache is None:
+        _action_cache = ActionCache()
+    return _action_cache
@@ -0,0 +1,194 @@
+"""
+캡처 재실행 도구 (성능 회귀 비교)
+capture_sink가 저장한 요청 payload를 엔드포인트(또는 로컬 시뮬레이터)로 다시 보내
+캡처 당시와 응답 시간 / 파싱 성공률 / 액션 수 일치율을 비교
+
+- 요청 전송 / 텍스트 추출 / JSON 파싱은 RunPodService와 같은 코드 경로 사용
+- 시뮬레이터: 캡처된 응답을 캡처 당시 응답 시간(x --speed)만큼 지연 후 반환 (네트워크/GPU 없이 파이프라인 점검)
+
+Usage:
+    python -m api.services.capture_replay data/captures --simulate [--speed 0.1]
+    python -m api.services.capture_replay data/captures --endpoint https://api.runpod.ai/v2/<id>/openai/v1/chat/completions
+    python -m api.services.capture_replay data/captures/capture_....jsonl.gz --limit 100 --concurrency 4 --output report.json
+
+Version: 1.0
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from typing import List, Optional
+
+import httpx
+
+from .capture_sink import read_captures
+from .circuit_breaker import LatencyWindow
+from .endpoint_pool import Endpoint
+
+SIMULATOR_URL = "http://simulator.local/openai/v1/chat/completions"
+
+
+def simulator_transport(captures: List[dict], speed: float = 1.0) -> httpx.MockTransport:
+    """
+    로컬 시뮬레이터: 요청 payload와 같은 캡처의 응답을 캡처 당시 응답 시간 x speed 후 반환
+
+    Args:
+        captures: 캡처 레코드
+        speed: 지연 배율 (0이면 즉시 응답)
+    """
+    by_prompt = {
+        json.dumps(capture["payload"].get("messages"), ensure_ascii=False, sort_keys=True): capture
+        for capture in captures
+    }
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        capture = by_prompt.get(json.dumps(payload.get("messages"), ensure_ascii=False, sort_keys=True))
+        if capture is None:
+            return httpx.Response(404, json={"error": "capture not found"})
+        await asyncio.sleep(max(0.0, capture.get("latency", 0.0) * speed))
+        return httpx.Response(200, json=capture["response"])
+
+    return httpx.MockTransport(handler)
+
+
+def _outcome(service, result: Optional[dict], expected: int) -> str:
+    """응답 -> ok / count_mismatch / parse_error (RunPodService 파싱 경로 사용)"""
+    if result is None:
+        return "error"
+    try:
+        scripts = service._decode_response(service._extract_openai_text(result), expected)
+    except Exception:
+        return "parse_error"
+    if scripts is None:
+        return "parse_error"
+    return "ok" if len(scripts) == expected else "count_mismatch"
+
+
+async def replay(
+    captures: List[dict],
+    endpoint: Endpoint,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+    concurrency: int = 4,
+    timeout: float = 300.0
+) -> dict:
+    """
+    캡처 재실행 및 비교
+
+    Args:
+        captures: 캡처 레코드
+        endpoint: 재실행 대상 엔드포인트
+        transport: httpx transport (시뮬레이터 사용 시)
+        concurrency: 동시 요청 수
+        timeout: 요청 타임아웃 (초)
+
+    Returns:
+        {"count", "baseline": {...}, "replay": {...}, "items": [...]}
+    """
+    from .runpod_service import RunPodService
+
+    service = RunPodService(endpoints=[endpoint])
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(client: httpx.AsyncClient, capture: dict) -> dict:
+        async with semaphore:
+            started = time.monotonic()
+            result, error = None, None
+            try:
+                _, result = await service._post_completion(client, endpoint, capture["payload"])
+            except Exception as e:
+                error = str(e)[:200]
+            latency = time.monotonic() - started
+        return {
+            "jobId": capture.get("jobId"),
+            "variant": capture.get("variant"),
+            "baselineLatency": capture.get("latency"),
+            "baselineOutcome": capture.get("outcome"),
+            "latency": round(latency, 3),
+            "outcome": _outcome(service, result, capture.get("pendingCount", 0)),
+            "error": error
+        }
+
+    async with httpx.AsyncClient(timeout=timeout, transport=transport) as client:
+        items = await asyncio.gather(*(run_one(client, capture) for capture in captures))
+
+    def summarize(latencies: List[float], outcomes: List[str]) -> dict:
+        window = LatencyWindow(max_samples=max(1, len(latencies)))
+        for latency in latencies:
+            window.add(latency)
+        total = len(outcomes) or 1
+        return {
+            "p50": window.percentile(50),
+            "p95": window.percentile(95),
+            "okRate": round(outcomes.count("ok") / total, 4),
+            "parseErrorRate": round(outcomes.count("parse_error") / total, 4),
+            "countMismatchRate": round(outcomes.count("count_mismatch") / total, 4)
+        }
+
+    return {
+        "count": len(items),
+        "endpoint": endpoint.url,
+        "baseline": summarize(
+            [item["baselineLatency"] for item in items if item["baselineLatency"] is not None],
+            [item["baselineOutcome"] for item in items]
+        ),
+        "replay": summarize(
+            [item["latency"] for item in items if item["error"] is None],
+            [item["outcome"] for item in items]
+        ),
+        "errors": sum(1 for item in items if item["error"] is not None),
+        "items": items
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="캡처 재실행 및 성능 비교")
+    parser.add_argument("path", help="캡처 세그먼트 파일 또는 디렉터리 (CAPTURE_DIR)")
+    parser.add_argument("--endpoint", default=os.getenv("RUNPOD_ENDPOINT_URL", ""), help="OpenAI 호환 엔드포인트 URL")
+    parser.add_argument("--api-key", default=os.getenv("RUNPOD_API_KEY", ""))
+    parser.add_argument("--simulate", action="store_true", help="로컬 시뮬레이터 사용 (캡처된 응답 재생)")
+    parser.add_argument("--speed", type=float, default=1.0, help="시뮬레이터 지연 배율")
+    parser.add_argument("--limit", type=int, default=0, help="재실행할 최대 캡처 수 (0이면 전체)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--output", default="", help="항목별 결과 포함 리포트 JSON 경로")
+    args = parser.parse_args()
+
+    captures = []
+    for capture in read_captures(args.path):
+        captures.append(capture)
+        if args.limit and len(captures) >= args.limit:
+            break
+    if not captures:
+        print(f"캡처가 없습니다: {args.path}")
+        sys.exit(1)
+
+    if args.simulate:
+        target = Endpoint("simulator", SIMULATOR_URL, "simulator")
+        transport = simulator_transport(captures, args.speed)
+    else:
+        if not args.endpoint or not args.api_key:
+            print("--endpoint / --api-key (또는 RUNPOD_ENDPOINT_URL / RUNPOD_API_KEY)가 필요합니다. 시뮬레이터는 --simulate")
+            sys.exit(1)
+        target = Endpoint("replay", args.endpoint, args.api_key)
+        transport = None
+
+    report = asyncio.run(replay(captures, target, transport, args.concurrency))
+
+    print("=" * 60)
+    print(f"캡처 재실행: {report['count']}건 -> {report['endpoint']} (오류 {report['errors']}건)")
+    print("=" * 60)
+    print(f"{'':10} {'p50(s)':>8} {'p95(s)':>8} {'ok':>8} {'parse_err':>10} {'mismatch':>9}")
+    for label in ("baseline", "replay"):
+        summary = report[label]
+        print(
+            f"{label:10} {summary['p50'] or 0:8.2f} {summary['p95'] or 0:8.2f} "
+            f"{summary['okRate']:8.1%} {summary['parseErrorRate']:10.1%} {summary['countMismatchRate']:9.1%}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"리포트 저장: {args.output}")
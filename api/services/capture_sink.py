@@ -0,0 +1,198 @@
+"""
+프롬프트/응답 캡처 싱크 (운영 트래픽 -> 성능 회귀 테스트 코퍼스)
+샘플링한 LLM 호출의 요청 payload와 응답을 gzip JSON Lines 세그먼트로 저장
+
+- 이벤트 루프에서는 큐에 넣기만 하고 (가득 차면 버림) 파일 쓰기는 백그라운드 스레드에서 실행
+- 세그먼트가 CAPTURE_SEGMENT_MAX_BYTES(압축 후)를 넘으면 새 세그먼트로 교체
+- 세그먼트는 CAPTURE_MAX_SEGMENTS개만 유지 (오래된 세그먼트부터 삭제)
+- 재실행/비교: python -m api.services.capture_replay
+
+Version: 1.0
+"""
+
+import os
+import gzip
+import json
+import queue
+import random
+import threading
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from .metrics import get_metrics
+
+CAPTURE_ENABLED = os.getenv("CAPTURE_ENABLED", "false").lower() == "true"
+# 캡처할 LLM 호출 비율 (0~1)
+CAPTURE_SAMPLE_RATE = float(os.getenv("CAPTURE_SAMPLE_RATE", "0.05"))
+CAPTURE_DIR = os.getenv("CAPTURE_DIR", "data/captures")
+CAPTURE_SEGMENT_MAX_BYTES = int(os.getenv("CAPTURE_SEGMENT_MAX_BYTES", str(16 * 1024 * 1024)))
+CAPTURE_MAX_SEGMENTS = int(os.getenv("CAPTURE_MAX_SEGMENTS", "10"))
+# 쓰기 대기 큐 최대 길이 (초과 시 캡처 버림)
+CAPTURE_QUEUE_MAX = int(os.getenv("CAPTURE_QUEUE_MAX", "1000"))
+
+SEGMENT_PREFIX = "capture_"
+SEGMENT_SUFFIX = ".jsonl.gz"
+
+
+def list_segments(directory: str) -> List[str]:
+    """세그먼트 경로 목록 (오래된 순)"""
+    if not os.path.isdir(directory):
+        return []
+    names = sorted(
+        name for name in os.listdir(directory)
+        if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+    )
+    return [os.path.join(directory, name) for name in names]
+
+
+def read_captures(path: str) -> Iterator[dict]:
+    """
+    캡처 레코드 읽기
+
+    Args:
+        path: 세그먼트 파일 또는 세그먼트 디렉터리
+
+    Yields:
+        캡처 레코드 (쓰기 도중인 세그먼트의 잘린 마지막 행은 무시)
+    """
+    paths = list_segments(path) if os.path.isdir(path) else [path]
+    for segment in paths:
+        try:
+            with gzip.open(segment, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except (OSError, EOFError):
+            continue  # 쓰기 중인 세그먼트 (gzip 종료 블록 없음)
+
+
+class CaptureSink:
+    """샘플링 캡처 싱크 (백그라운드 스레드에서 gzip 세그먼트 기록)"""
+
+    def __init__(
+        self,
+        directory: str = CAPTURE_DIR,
+        sample_rate: float = CAPTURE_SAMPLE_RATE,
+        segment_max_bytes: int = CAPTURE_SEGMENT_MAX_BYTES,
+        max_segments: int = CAPTURE_MAX_SEGMENTS,
+        enabled: bool = CAPTURE_ENABLED
+    ):
+        self.directory = directory
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.segment_max_bytes = max(1024, segment_max_bytes)
+        self.max_segments = max(1, max_segments)
+        self.enabled = enabled and bool(directory) and self.sample_rate > 0
+
+        self._queue: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=max(1, CAPTURE_QUEUE_MAX))
+        self._thread: Optional[threading.Thread] = None
+        self._raw = None
+        self._gzip: Optional[gzip.GzipFile] = None
+        self._segment_seq = 0
+        self.captured = 0
+        self.dropped = 0
+
+    def should_sample(self) -> bool:
+        """이번 호출을 캡처할지 여부"""
+        return self.enabled and random.random() < self.sample_rate
+
+    def capture(self, record: dict) -> None:
+        """캡처 레코드 큐에 추가 (이벤트 루프에서 호출, 블로킹 없음)"""
+        if not self.enabled:
+            return
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            get_metrics().incr("capture_dropped_total")
+
+    def _ensure_writer(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="capture-sink", daemon=True)
+            self._thread.start()
+
+    def _open_segment(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._segment_seq += 1
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(
+            self.directory, f"{SEGMENT_PREFIX}{timestamp}_{os.getpid()}_{self._segment_seq:04d}{SEGMENT_SUFFIX}"
+        )
+        self._raw = open(path, "wb")
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode="wb")
+
+        # 오래된 세그먼트 삭제 (현재 세그먼트 포함 max_segments개 유지)
+        for old in list_segments(self.directory)[:-self.max_segments]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+    def _close_segment(self) -> None:
+        if self._gzip is not None:
+            self._gzip.close()
+            self._raw.close()
+            self._gzip = None
+            self._raw = None
+
+    def _write(self, record: dict) -> None:
+        if self._gzip is None:
+            self._open_segment()
+        self._gzip.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+        self.captured += 1
+        if self._raw.tell() >= self.segment_max_bytes:
+            self._close_segment()
+
+    def _run(self) -> None:
+        """쓰기 스레드: 큐가 비면 flush (재생 도구가 쓰기 중인 세그먼트도 읽을 수 있도록)"""
+        while True:
+            try:
+                record = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                if self._gzip is not None:
+                    self._gzip.flush()
+                continue
+            if record is None:
+                self._close_segment()
+                return
+            try:
+                self._write(record)
+            except Exception as e:
+                self.dropped += 1
+                print(f"[CAPTURE] 캡처 저장 실패: {e}")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """쓰기 스레드 종료 (남은 레코드 기록 후 세그먼트 닫기, lifespan 종료 시 호출)"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout=timeout)
+
+    def snapshot(self) -> dict:
+        """상태 요약"""
+        return {
+            "enabled": self.enabled,
+            "sampleRate": self.sample_rate,
+            "directory": self.directory,
+            "captured": self.captured,
+            "dropped": self.dropped,
+            "queued": self._queue.qsize(),
+            "segments": len(list_segments(self.directory))
+        }
+
+
+# 싱글톤 인스턴스
+_capture_sink: Optional[CaptureSink] = None
+
+
+def get_capture_sink() -> CaptureSink:
+    """CaptureSink 인스턴스 반환"""
+    global _capture_sink
+    if _capture_sink is None:
+        _capture_sink = CaptureSink()
+    return _capture_sink
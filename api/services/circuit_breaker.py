@@ -0,0 +1,153 @@
+"""
+RunPod 호출용 서킷 브레이커
+연속 실패 또는 지연 SLO 초과 시 회로를 열어 즉시 fallback 처리
+
+Version: 1.0
+"""
+
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Optional
+
+
+class BreakerState(str, Enum):
+    """서킷 브레이커 상태"""
+    CLOSED = "CLOSED"        # 정상 호출
+    OPEN = "OPEN"            # 즉시 실패 (fallback)
+    HALF_OPEN = "HALF_OPEN"  # 복구 확인용 단일 요청 허용
+
+
+class LatencyWindow:
+    """최근 응답 시간 슬라이딩 윈도우 (백분위 계산용)"""
+
+    def __init__(self, max_samples: int = 200):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+
+    def add(self, latency: float) -> None:
+        """응답 시간(초) 추가"""
+        self._samples.append(latency)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        백분위 응답 시간 계산
+
+        Args:
+            pct: 백분위 (0~100)
+
+        Returns:
+            응답 시간(초), 샘플이 없으면 None
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+        return ordered[index]
+
+
+class CircuitBreaker:
+    """
+    연속 실패 / SLO 초과 기반 서킷 브레이커
+
+    - CLOSED: 연속 실패(또는 SLO 초과)가 임계값에 도달하면 OPEN
+    - OPEN: reset_timeout 동안 모든 호출 즉시 거부
+    - HALF_OPEN: 단일 probe 요청 허용, 성공 시 CLOSED / 실패 시 다시 OPEN
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        latency_slo: float = 60.0,
+        reset_timeout: float = 30.0,
+        name: str = "runpod"
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.latency_slo = latency_slo
+        self.reset_timeout = reset_timeout
+
+        self._state = BreakerState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> BreakerState:
+        """현재 상태 (OPEN 유지 시간이 지나면 HALF_OPEN으로 전환)"""
+        if (
+            self._state == BreakerState.OPEN
+            and self._opened_at is not None
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = BreakerState.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        요청 허용 여부
+
+        Returns:
+            True면 호출 진행, False면 즉시 fallback
+        """
+        state = self.state
+        if state == BreakerState.CLOSED:
+            return True
+        if state == BreakerState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self, latency: float) -> None:
+        """
+        성공 기록 (SLO 초과 응답은 실패로 간주)
+
+        Args:
+            latency: 응답 시간(초)
+        """
+        if self.latency_slo > 0 and latency > self.latency_slo:
+            print(f"[BREAKER] {self.name}: SLO 초과 응답 ({latency:.1f}s > {self.latency_slo:.1f}s)")
+            self.record_failure()
+            return
+
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+        if self._state != BreakerState.CLOSED:
+            print(f"[BREAKER] {self.name}: 회로 닫힘 (복구 확인)")
+        self._state = BreakerState.CLOSED
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """실패 기록"""
+        self._consecutive_failures += 1
+        self._probe_in_flight = False
+
+        if (
+            self._state == BreakerState.HALF_OPEN
+            or self._consecutive_failures >= self.failure_threshold
+        ):
+            if self._state != BreakerState.OPEN:
+                print(
+                    f"[BREAKER] {self.name}: 회로 열림 "
+                    f"(연속 실패 {self._consecutive_failures}회, {self.reset_timeout:.0f}s 동안 fallback)"
+                )
+            self._state = BreakerState.OPEN
+            self._opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """취소된 호출의 HALF_OPEN probe 슬롯 반환 (성공/실패로 집계하지 않음)"""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        """상태 요약 (모니터링용)"""
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "consecutiveFailures": self._consecutive_failures,
+            "failureThreshold": self.failure_threshold,
+            "latencySlo": self.latency_slo,
+            "resetTimeout": self.reset_timeout
+        }
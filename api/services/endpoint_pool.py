@@ -0,0 +1,186 @@
+"""
+RunPod 엔드포인트 풀
+여러 Serverless 엔드포인트(리전/GPU별) 간 부하 분산 및 헬스 관리
+
+Version: 1.0
+"""
+
+import json
+import random
+from typing import Iterable, List, Optional
+
+from .circuit_breaker import BreakerState, CircuitBreaker, LatencyWindow
+from .metrics import get_metrics
+
+# EWMA 가중치 (최근 샘플 비중)
+EWMA_ALPHA = 0.3
+
+
+class Endpoint:
+    """
+    RunPod 엔드포인트 1개
+
+    - outstanding: 진행 중인 요청 수
+    - ewma_latency: 응답 시간 EWMA (초)
+    - health: 성공률 EWMA (0~1)
+    - breaker: 연속 실패 시 풀에서 제외(OPEN), 일정 시간 후 probe(HALF_OPEN)로 복귀
+    """
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        api_key: str,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        self.name = name
+        self.url = url
+        self.api_key = api_key
+        self.breaker = breaker or CircuitBreaker(name=name)
+        self.breaker.name = name
+        self.latencies = LatencyWindow()
+
+        self.outstanding = 0
+        self.ewma_latency: Optional[float] = None
+        self.health = 1.0
+        self.total_requests = 0
+        self.total_failures = 0
+
+    def score(self, policy: str) -> float:
+        """라우팅 점수 (낮을수록 우선)"""
+        if policy == "ewma":
+            latency = self.ewma_latency if self.ewma_latency is not None else 0.0
+            return (latency + 0.001) * (self.outstanding + 1) / max(self.health, 0.1)
+        # least_outstanding: 진행 중 요청 수 우선, 동률이면 건강도
+        return self.outstanding + (1.0 - self.health)
+
+    def snapshot(self) -> dict:
+        return {
+            "name": self.name,
+            "url": self.url,
+            "state": self.breaker.state.value,
+            "outstanding": self.outstanding,
+            "ewmaLatency": round(self.ewma_latency, 3) if self.ewma_latency is not None else None,
+            "p95Latency": self.latencies.percentile(95),
+            "health": round(self.health, 3),
+            "totalRequests": self.total_requests,
+            "totalFailures": self.total_failures
+        }
+
+
+def load_endpoints(source: str, default_api_key: str) -> List[Endpoint]:
+    """
+    RUNPOD_ENDPOINTS 설정 파싱
+
+    Args:
+        source: JSON 배열 ([{"name", "url", "apiKey"}]) 또는 쉼표로 구분된 URL 목록
+        default_api_key: apiKey 미지정 시 사용할 키 (RUNPOD_API_KEY)
+
+    Returns:
+        Endpoint 리스트 (breaker는 호출 측에서 설정)
+    """
+    source = source.strip()
+    if not source:
+        return []
+
+    if source.startswith("["):
+        items = json.loads(source)
+    else:
+        items = [{"url": url.strip()} for url in source.split(",") if url.strip()]
+
+    endpoints = []
+    for index, item in enumerate(items):
+        endpoints.append(Endpoint(
+            name=item.get("name") or f"endpoint-{index}",
+            url=item["url"],
+            api_key=item.get("apiKey") or item.get("api_key") or default_api_key
+        ))
+    return endpoints
+
+
+class EndpointPool:
+    """
+    엔드포인트 선택 / 상태 기록
+
+    policy:
+        - "least_outstanding": 진행 중 요청이 가장 적은 엔드포인트
+        - "ewma": EWMA 응답 시간 x (진행 중 요청 + 1) / 건강도 가 가장 낮은 엔드포인트
+    """
+
+    def __init__(self, endpoints: List[Endpoint], policy: str = "least_outstanding"):
+        if not endpoints:
+            raise ValueError("At least one RunPod endpoint is required")
+        self.endpoints = endpoints
+        self.policy = policy if policy in ("least_outstanding", "ewma") else "least_outstanding"
+
+    def select(self, exclude: Iterable[Endpoint] = ()) -> Optional[Endpoint]:
+        """
+        요청을 보낼 엔드포인트 선택
+
+        Args:
+            exclude: 제외할 엔드포인트 (헤지 요청 시 기존 엔드포인트)
+
+        Returns:
+            Endpoint, 사용 가능한 엔드포인트가 없으면 None
+        """
+        excluded = set(id(e) for e in exclude)
+        candidates = [e for e in self.endpoints if id(e) not in excluded]
+
+        # 복귀 대기(HALF_OPEN) 엔드포인트에 probe 1건 우선 배정 (정상 엔드포인트가 있어도 복귀 가능하도록)
+        for endpoint in candidates:
+            if endpoint.breaker.state == BreakerState.HALF_OPEN and endpoint.breaker.allow_request():
+                print(f"[POOL] {endpoint.name}: 복귀 확인용 probe 요청")
+                return endpoint
+
+        # 정상(CLOSED) 엔드포인트 중 점수가 가장 낮은 것
+        healthy = [e for e in candidates if e.breaker.state == BreakerState.CLOSED]
+        if healthy:
+            best = min(e.score(self.policy) for e in healthy)
+            return random.choice([e for e in healthy if e.score(self.policy) == best])
+
+        return None
+
+    def get(self, name: str) -> Optional[Endpoint]:
+        """이름으로 엔드포인트 조회"""
+        return next((e for e in self.endpoints if e.name == name), None)
+
+    def on_start(self, endpoint: Endpoint) -> None:
+        """요청 시작 기록"""
+        endpoint.outstanding += 1
+        endpoint.total_requests += 1
+        get_metrics().set_gauge("runpod_endpoint_outstanding", endpoint.outstanding, endpoint=endpoint.name)
+
+    def on_finish(self, endpoint: Endpoint) -> None:
+        """요청 종료 기록 (성공/실패/취소 공통)"""
+        endpoint.outstanding = max(0, endpoint.outstanding - 1)
+        get_metrics().set_gauge("runpod_endpoint_outstanding", endpoint.outstanding, endpoint=endpoint.name)
+
+    def record_success(self, endpoint: Endpoint, latency: float) -> None:
+        """성공 기록 (응답 시간 EWMA / 건강도 갱신)"""
+        endpoint.latencies.add(latency)
+        if endpoint.ewma_latency is None:
+            endpoint.ewma_latency = latency
+        else:
+            endpoint.ewma_latency = EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * endpoint.ewma_latency
+        endpoint.health = EWMA_ALPHA * 1.0 + (1 - EWMA_ALPHA) * endpoint.health
+        endpoint.breaker.record_success(latency)
+
+        metrics = get_metrics()
+        metrics.observe("runpod_endpoint_seconds", latency, endpoint=endpoint.name)
+        metrics.set_gauge("runpod_endpoint_health", round(endpoint.health, 3), endpoint=endpoint.name)
+
+    def record_failure(self, endpoint: Endpoint) -> None:
+        """실패 기록 (건강도 감소, 연속 실패 시 풀에서 제외)"""
+        endpoint.total_failures += 1
+        endpoint.health = (1 - EWMA_ALPHA) * endpoint.health
+        endpoint.breaker.record_failure()
+
+        metrics = get_metrics()
+        metrics.incr("runpod_endpoint_errors_total", endpoint=endpoint.name)
+        metrics.set_gauge("runpod_endpoint_health", round(endpoint.health, 3), endpoint=endpoint.name)
+
+    def snapshot(self) -> dict:
+        return {
+            "policy": self.policy,
+            "endpoints": [e.snapshot() for e in self.endpoints]
+        }
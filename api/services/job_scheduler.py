@@ -0,0 +1,221 @@
+"""
+해설 작업 디스패치 스케줄러
+우선순위 클래스(LIVE > NORMAL > BULK) 안에서 마감 시간이 빠른 작업부터 RunPod 호출 슬롯 배정
+
+- 슬롯(동시 RunPod 호출 수)이 부족하면 대기열에서 대기
+- LIVE 전용 예약 슬롯: NORMAL/BULK 작업은 예약분을 제외한 슬롯만 사용
+- 대기 중 마감 시간이 지난 작업은 슬롯 없이 반환 (호출 측에서 fallback 또는 폐기)
+
+Version: 1.0
+"""
+
+import os
+import heapq
+import time
+import asyncio
+import itertools
+from typing import Dict, List, Optional, Tuple
+
+from .circuit_breaker import LatencyWindow
+from .metrics import get_metrics
+
+# 동시 RunPod 호출 수
+RUNPOD_MAX_CONCURRENCY = int(os.getenv("RUNPOD_MAX_CONCURRENCY", "8"))
+# LIVE 작업 전용 예약 슬롯 수
+JOB_LIVE_RESERVED_SLOTS = int(os.getenv("JOB_LIVE_RESERVED_SLOTS", "2"))
+
+# 우선순위 클래스 (작을수록 먼저)
+PRIORITY_RANK = {
+    "LIVE": 0,
+    "NORMAL": 1,
+    "BULK": 2,
+}
+DEFAULT_PRIORITY = "NORMAL"
+
+
+class DispatchTicket:
+    """대기열 항목"""
+
+    def __init__(self, priority: str, deadline: Optional[float], seq: int):
+        self.priority = priority
+        self.deadline = deadline  # time.monotonic() 기준, None이면 마감 없음
+        self.seq = seq
+        self.enqueued_at = time.monotonic()
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def sort_key(self) -> Tuple[int, float, int]:
+        """우선순위 클래스 -> 마감 시간(EDF) -> 도착 순서"""
+        deadline = self.deadline if self.deadline is not None else float("inf")
+        return (PRIORITY_RANK.get(self.priority, PRIORITY_RANK[DEFAULT_PRIORITY]), deadline, self.seq)
+
+    def __lt__(self, other: "DispatchTicket") -> bool:
+        return self.sort_key() < other.sort_key()
+
+
+class JobScheduler:
+    """
+    우선순위 + EDF(earliest deadline first) 디스패치 스케줄러
+
+    Usage:
+        if await scheduler.acquire(priority, deadline):
+            try:
+                ...  # RunPod 호출
+            finally:
+                scheduler.release()
+        else:
+            ...  # 마감 초과
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = RUNPOD_MAX_CONCURRENCY,
+        live_reserved_slots: int = JOB_LIVE_RESERVED_SLOTS
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.live_reserved_slots = min(max(0, live_reserved_slots), self.max_concurrency - 1)
+
+        self._queue: List[DispatchTicket] = []
+        self._running = 0
+        self._seq = itertools.count()
+        self._queue_latency: Dict[str, LatencyWindow] = {
+            priority: LatencyWindow() for priority in PRIORITY_RANK
+        }
+        self._dispatched: Dict[str, int] = {priority: 0 for priority in PRIORITY_RANK}
+        self._expired: Dict[str, int] = {priority: 0 for priority in PRIORITY_RANK}
+
+    def _slot_limit(self, priority: str) -> int:
+        """우선순위별 사용 가능한 최대 슬롯 수"""
+        if priority == "LIVE":
+            return self.max_concurrency
+        return self.max_concurrency - self.live_reserved_slots
+
+    def _dispatch(self) -> None:
+        """대기열 맨 앞부터 슬롯 배정 (마감 초과 작업은 슬롯 없이 반환)"""
+        now = time.monotonic()
+        while self._queue:
+            ticket = self._queue[0]
+            if ticket.future.done():
+                # 대기 중 취소됨
+                heapq.heappop(self._queue)
+                continue
+
+            if ticket.deadline is not None and ticket.deadline <= now:
+                heapq.heappop(self._queue)
+                self._expired[ticket.priority] = self._expired.get(ticket.priority, 0) + 1
+                get_metrics().incr("scheduler_expired_total", priority=ticket.priority)
+                ticket.future.set_result(False)
+                continue
+
+            # 맨 앞 작업이 슬롯을 받을 수 없으면 뒤 작업도 대기 (우선순위 역전 방지)
+            if self._running >= self._slot_limit(ticket.priority):
+                break
+
+            heapq.heappop(self._queue)
+            self._running += 1
+            wait = now - ticket.enqueued_at
+            self._queue_latency.setdefault(ticket.priority, LatencyWindow()).add(wait)
+            self._dispatched[ticket.priority] = self._dispatched.get(ticket.priority, 0) + 1
+            get_metrics().observe("scheduler_queue_seconds", wait, priority=ticket.priority)
+            ticket.future.set_result(True)
+
+        get_metrics().set_gauge("scheduler_running", self._running)
+        get_metrics().set_gauge("scheduler_queued", len(self._queue))
+
+    async def acquire(self, priority: str = DEFAULT_PRIORITY, deadline: Optional[float] = None) -> bool:
+        """
+        RunPod 호출 슬롯 대기
+
+        Args:
+            priority: 우선순위 클래스 (LIVE / NORMAL / BULK)
+            deadline: 마감 시각 (time.monotonic() 기준)
+
+        Returns:
+            True: 슬롯 배정 (사용 후 release() 필수)
+            False: 슬롯 배정 전에 마감 시간 초과
+        """
+        if priority not in PRIORITY_RANK:
+            priority = DEFAULT_PRIORITY
+
+        ticket = DispatchTicket(priority, deadline, next(self._seq))
+        heapq.heappush(self._queue, ticket)
+        self._dispatch()
+
+        try:
+            if ticket.deadline is None:
+                return await ticket.future
+            # 마감 시각에 깨어나 대기열에서 정리
+            timeout = max(0.0, ticket.deadline - time.monotonic())
+            try:
+                return await asyncio.wait_for(asyncio.shield(ticket.future), timeout=timeout)
+            except asyncio.TimeoutError:
+                self._dispatch()
+                if not ticket.future.done():
+                    # 슬롯이 모두 사용 중이라 _dispatch가 맨 앞까지 도달하지 못한 경우
+                    ticket.future.set_result(False)
+                    self._expired[priority] = self._expired.get(priority, 0) + 1
+                    get_metrics().incr("scheduler_expired_total", priority=priority)
+                return ticket.future.result()
+        except asyncio.CancelledError:
+            if ticket.future.done() and not ticket.future.cancelled() and ticket.future.result():
+                # 슬롯 배정 직후 취소 -> 반환
+                self.release()
+            else:
+                ticket.future.cancel()
+            raise
+
+    def release(self) -> None:
+        """슬롯 반환"""
+        self._running = max(0, self._running - 1)
+        self._dispatch()
+
+    def queue_stats(self) -> Tuple[int, float]:
+        """
+        대기열 현황 (준비 상태 확인용)
+
+        Returns:
+            (대기 중인 작업 수, 가장 오래 대기한 작업의 대기 시간(초))
+        """
+        now = time.monotonic()
+        waiting = [ticket for ticket in self._queue if not ticket.future.done()]
+        return len(waiting), max((now - ticket.enqueued_at for ticket in waiting), default=0.0)
+
+    @property
+    def running(self) -> int:
+        """현재 사용 중인 슬롯 수 (진행 중인 RunPod 호출)"""
+        return self._running
+
+    def snapshot(self) -> dict:
+        """상태 요약 (우선순위별 대기 수 / 대기 시간 / 마감 초과 수)"""
+        queued = {priority: 0 for priority in PRIORITY_RANK}
+        for ticket in self._queue:
+            if not ticket.future.done():
+                queued[ticket.priority] = queued.get(ticket.priority, 0) + 1
+
+        classes = {}
+        for priority, window in self._queue_latency.items():
+            classes[priority] = {
+                "queued": queued.get(priority, 0),
+                "dispatched": self._dispatched.get(priority, 0),
+                "expired": self._expired.get(priority, 0),
+                "queueP50": window.percentile(50),
+                "queueP95": window.percentile(95)
+            }
+
+        return {
+            "running": self._running,
+            "maxConcurrency": self.max_concurrency,
+            "liveReservedSlots": self.live_reserved_slots,
+            "classes": classes
+        }
+
+
+# 싱글톤 인스턴스
+_job_scheduler: Optional[JobScheduler] = None
+
+
+def get_job_scheduler() -> JobScheduler:
+    """JobScheduler 인스턴스 반환"""
+    global _job_scheduler
+    if _job_scheduler is None:
+        _job_scheduler = JobScheduler()
+    return _job_scheduler
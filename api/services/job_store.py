@@ -5,12 +5,14 @@ In-memory 기반 작업 상태 관리 (개발/테스트용)
 Version: 1.0
 """
 
-import uuid
+import time
 import asyncio
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from enum import Enum
 
+from .sharding import get_shard_router
+
 
 class JobStatus(str, Enum):
     """작업 상태"""
@@ -19,28 +21,130 @@ class JobStatus(str, Enum):
     ERROR = "ERROR"
 
 
+# 작업 단계 (generate_commentary_task / call_llm에서 기록, 적용되지 않는 단계는 생략)
+JOB_STAGES = (
+    "enqueued",           # 작업 생성
+    "started",            # 백그라운드 태스크 시작
+    "dispatched",         # 스케줄러 슬롯 배정
+    "prompt_built",       # 프롬프트 생성 완료
+    "request_sent",       # RunPod 요청 전송 (비동기 모드: /run 제출 완료)
+    "first_byte",         # RunPod 응답 헤더 수신
+    "response_complete",  # RunPod 응답 수신 완료
+    "parsed",             # 응답 파싱 / 캐시 병합 완료
+    "stored",             # JobStore 완료 상태 저장
+    "webhook_acked",      # Spring 웹훅 200 응답
+    "archived",           # 경기 아카이브 저장
+)
+
+
 class JobData:
     """작업 데이터 클래스"""
 
-    def __init__(self, game_id: str, style: str):
+    def __init__(
+        self,
+        game_id: str,
+        style: str,
+        priority: str = "NORMAL",
+        deadline_seconds: Optional[float] = None,
+        window_end: Optional[Tuple[int, float]] = None
+    ):
         self.game_id = game_id
         self.style = style
+        self.priority = priority  # LIVE / NORMAL / BULK
+        # RunPod 호출 시작 마감 시각 (time.monotonic() 기준)
+        self.deadline: Optional[float] = (
+            time.monotonic() + deadline_seconds if deadline_seconds else None
+        )
+        # 윈도우 마지막 액션 시각 (periodId, timeSeconds) - 이전 윈도우 작업 대체 판단용
+        self.window_end = window_end
         self.status = JobStatus.PENDING
+        self.version = 1  # 상태 변경 시 증가 (상태 조회 ETag)
         self.script: List[dict] = []
+        self.draft_script: Optional[List[dict]] = None  # 규칙 기반 즉시 초안
         self.error_code: Optional[str] = None
         self.error_message: Optional[str] = None
+        self.usage: Optional[dict] = None  # LLM 토큰 사용량 (promptTokens / completionTokens / totalTokens)
+        self.endpoint: Optional[str] = None  # 응답한 RunPod 엔드포인트 이름
+        self.prompt_variant: Optional[str] = None  # 사용한 프롬프트 CSV 형식 (A/B 비교용)
+        self.job_id: Optional[str] = None
+        # RunPod 비동기 모드 (RUNPOD_CALL_MODE=async): 원격 작업 ID / 제출한 엔드포인트 이름
+        self.remote_job_id: Optional[str] = None
+        self.remote_endpoint: Optional[str] = None
+        self.resume_request: Optional[dict] = None  # 재시작 후 결과 수집 재개용 원본 요청
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
+        # 단계별 시각 (time.monotonic(), 최초 기록만 유지)
+        self.timings: Dict[str, float] = {"enqueued": time.monotonic()}
+
+    def mark(self, stage: str) -> None:
+        """단계 시각 기록 (이미 기록된 단계는 유지 - 헤징 등 중복 요청 시 첫 시각)"""
+        if stage not in self.timings:
+            self.timings[stage] = time.monotonic()
+
+    def timeline(self) -> List[Tuple[str, float, float]]:
+        """
+        단계 타임라인
+
+        Returns:
+            [(단계, enqueued 이후 경과 ms, 직전 단계 이후 경과 ms)] (시각 순)
+        """
+        enqueued = self.timings["enqueued"]
+        stages = sorted(self.timings.items(), key=lambda item: item[1])
+        result = []
+        previous = enqueued
+        for stage, at in stages:
+            result.append((stage, (at - enqueued) * 1000, (at - previous) * 1000))
+            previous = at
+        return result
+
+    def trace_events(self, job_id: str) -> dict:
+        """
+        타임라인 -> Chrome Trace Event 형식 (chrome://tracing, Perfetto에서 열기)
+
+        각 구간은 "이전 단계 -> 다음 단계" 이름의 complete 이벤트(ph=X)
+        """
+        base_us = self.created_at.timestamp() * 1_000_000
+        events = []
+        timeline = self.timeline()
+        for (previous, previous_ms, _), (stage, offset_ms, delta_ms) in zip(timeline, timeline[1:]):
+            events.append({
+                "name": f"{previous} -> {stage}",
+                "cat": "job",
+                "ph": "X",
+                "ts": round(base_us + previous_ms * 1000),
+                "dur": round(delta_ms * 1000),
+                "pid": 1,
+                "tid": job_id,
+                "args": {"gameId": self.game_id, "style": self.style, "priority": self.priority}
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    @property
+    def etag(self) -> str:
+        """상태 조회 응답용 ETag (Job ID는 JobStore 키이므로 버전만 사용)"""
+        return f'"v{self.version}"'
+
+    def touch(self) -> None:
+        """상태 변경 기록 (버전 증가)"""
+        self.version += 1
+        self.updated_at = datetime.now()
 
     def to_dict(self) -> dict:
         """딕셔너리 변환"""
         return {
             "gameId": self.game_id,
             "style": self.style,
+            "priority": self.priority,
             "status": self.status.value,
+            "version": self.version,
             "script": self.script,
+            "draftScript": self.draft_script,
             "errorCode": self.error_code,
             "errorMessage": self.error_message,
+            "usage": self.usage,
+            "endpoint": self.endpoint,
+            "promptVariant": self.prompt_variant,
+            "remoteJobId": self.remote_job_id,
             "createdAt": self.created_at.isoformat(),
             "updatedAt": self.updated_at.isoformat()
         }
@@ -54,25 +158,95 @@ class JobStore:
         self._lock = asyncio.Lock()
 
     def generate_job_id(self) -> str:
-        """고유 Job ID 생성"""
-        return f"job_{uuid.uuid4().hex[:6]}"
+        """고유 Job ID 생성 (시간순, 소유 샤드 포함 - 다른 워커가 상태 조회를 전달할 수 있도록)"""
+        return get_shard_router().next_job_id()
 
-    async def create_job(self, game_id: str, style: str) -> str:
+    async def create_job(
+        self,
+        game_id: str,
+        style: str,
+        draft_script: Optional[List[dict]] = None,
+        priority: str = "NORMAL",
+        deadline_seconds: Optional[float] = None,
+        window_end: Optional[Tuple[int, float]] = None
+    ) -> str:
         """
         새 작업 생성
 
         Args:
             game_id: 경기 ID
             style: 해설 스타일
+            draft_script: 규칙 기반 초안 해설 (선택)
+            priority: 우선순위 클래스 (LIVE / NORMAL / BULK)
+            deadline_seconds: RunPod 호출 시작 마감 시간 (초, 선택)
+            window_end: 윈도우 마지막 액션 시각 (periodId, timeSeconds) (선택)
 
         Returns:
             생성된 Job ID
         """
         async with self._lock:
             job_id = self.generate_job_id()
-            self._jobs[job_id] = JobData(game_id, style)
+            job = JobData(game_id, style, priority, deadline_seconds, window_end)
+            job.job_id = job_id
+            job.draft_script = draft_script
+            self._jobs[job_id] = job
             return job_id
 
+    async def restore_job(
+        self,
+        job_id: str,
+        game_id: str,
+        style: str,
+        priority: str = "NORMAL"
+    ) -> JobData:
+        """
+        기존 Job ID로 작업 복원 (워커 재시작 후 RunPod 원격 작업 결과 수집 재개용)
+
+        Args:
+            job_id: 재시작 전 Job ID
+            game_id: 경기 ID
+            style: 해설 스타일
+            priority: 우선순위 클래스
+
+        Returns:
+            복원된 JobData (이미 있으면 기존 작업)
+        """
+        async with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                job = JobData(game_id, style, priority)
+                job.job_id = job_id
+                self._jobs[job_id] = job
+            return job
+
+    async def create_jobs(self, items: List[dict]) -> List[str]:
+        """
+        여러 작업을 한 번에 생성 (락 1회)
+
+        Args:
+            items: create_job 인자 dict 리스트
+                   ({"game_id", "style", "draft_script", "priority", "deadline_seconds"(선택), "window_end"(선택)})
+
+        Returns:
+            생성된 Job ID 리스트 (items 순서)
+        """
+        async with self._lock:
+            job_ids = []
+            for item in items:
+                job_id = self.generate_job_id()
+                job = JobData(
+                    item["game_id"],
+                    item["style"],
+                    item.get("priority", "NORMAL"),
+                    item.get("deadline_seconds"),
+                    item.get("window_end")
+                )
+                job.job_id = job_id
+                job.draft_script = item.get("draft_script")
+                self._jobs[job_id] = job
+                job_ids.append(job_id)
+            return job_ids
+
     async def get_job(self, job_id: str) -> Optional[JobData]:
         """
         작업 조회
@@ -85,6 +259,18 @@ class JobStore:
         """
         return self._jobs.get(job_id)
 
+    async def get_jobs(self, job_ids: List[str]) -> Dict[str, Optional[JobData]]:
+        """
+        여러 작업 조회
+
+        Args:
+            job_ids: Job ID 리스트
+
+        Returns:
+            {Job ID: JobData 또는 None} (job_ids 순서)
+        """
+        return {job_id: self._jobs.get(job_id) for job_id in job_ids}
+
     async def update_job_done(self, job_id: str, script: List[dict]) -> bool:
         """
         작업 완료 상태로 업데이트
@@ -101,7 +287,7 @@ class JobStore:
             if job:
                 job.status = JobStatus.DONE
                 job.script = script
-                job.updated_at = datetime.now()
+                job.touch()
                 return True
             return False
 
@@ -128,7 +314,7 @@ class JobStore:
                 job.status = JobStatus.ERROR
                 job.error_code = error_code
                 job.error_message = error_message
-                job.updated_at = datetime.now()
+                job.touch()
                 return True
             return False
 
@@ -155,6 +341,11 @@ class JobStore:
             for job_id, job in self._jobs.items()
         }
 
+    def stats(self) -> Dict[str, int]:
+        """저장된 작업 수 (전체 / PENDING)"""
+        pending = sum(1 for job in self._jobs.values() if job.status == JobStatus.PENDING)
+        return {"total": len(self._jobs), "pending": pending}
+
     async def cleanup_old_jobs(self, max_age_hours: int = 1) -> int:
         """
         오래된 작업 정리
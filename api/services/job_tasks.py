@@ -0,0 +1,154 @@
+"""
+해설 작업 태스크 레지스트리 / 취소
+작업별 백그라운드 태스크를 Job ID로 관리하여 작업 삭제(DELETE) / 대체(supersede) 시
+스케줄러 슬롯 대기나 진행 중인 RunPod 호출까지 실제로 중단
+
+- 취소하면 태스크에 CancelledError 전달 -> 스케줄러 대기열에서 제거 / 사용 중인 슬롯 반환 / HTTP 요청 중단
+- JOB_SUPERSEDE_POLICY: 같은 gameId + style의 새 윈도우가 들어오면 이전 윈도우 작업 취소 (이미 송출 시점이 지남)
+  - off (기본): 대체 안 함
+  - queued: 아직 슬롯을 받지 못한 (대기 중) 작업만 취소
+  - all: RunPod 호출 중인 작업도 취소
+  - 이전 작업의 마지막 액션 시각이 새 윈도우보다 늦으면 (순서가 바뀌어 도착) 대체하지 않음
+
+Version: 1.0
+"""
+
+import os
+import asyncio
+from typing import Coroutine, Dict, Iterable, List, Optional, Tuple
+
+from .job_store import JobData, JobStatus, get_job_store
+from .metrics import get_metrics
+
+# 새 윈도우 도착 시 이전 작업 대체: off / queued / all
+JOB_SUPERSEDE_POLICY = os.getenv("JOB_SUPERSEDE_POLICY", "off")
+# 취소 후 태스크 종료(슬롯 반환)를 기다리는 최대 시간 (초)
+JOB_CANCEL_WAIT_SECONDS = float(os.getenv("JOB_CANCEL_WAIT_SECONDS", "5"))
+
+
+class JobTaskRegistry:
+    """Job ID -> 백그라운드 태스크 (취소 / 대체용)"""
+
+    def __init__(
+        self,
+        supersede_policy: str = JOB_SUPERSEDE_POLICY,
+        cancel_wait: float = JOB_CANCEL_WAIT_SECONDS
+    ):
+        self.supersede_policy = supersede_policy if supersede_policy in ("off", "queued", "all") else "off"
+        self.cancel_wait = max(0.0, cancel_wait)
+        self._tasks: Dict[str, asyncio.Task] = {}
+        # (gameId, style) -> 진행 중인 Job ID (시작 순서 유지)
+        self._streams: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self.cancelled: Dict[str, int] = {}
+
+    def start(self, job_id: str, game_id: str, style: str, coro: Coroutine) -> asyncio.Task:
+        """
+        작업 태스크 시작 및 등록 (종료 시 자동 해제)
+
+        Args:
+            job_id: Job ID
+            game_id: 경기 ID
+            style: 해설 스타일
+            coro: generate_commentary_task(...) 코루틴
+
+        Returns:
+            시작한 태스크
+        """
+        task = asyncio.create_task(coro)
+        self._tasks[job_id] = task
+        self._streams.setdefault((game_id, style), {})[job_id] = None
+        task.add_done_callback(lambda _: self._forget(job_id, game_id, style, task))
+        get_metrics().set_gauge("job_tasks_running", len(self._tasks))
+        return task
+
+    def _forget(self, job_id: str, game_id: str, style: str, task: asyncio.Task) -> None:
+        # 같은 Job ID로 다시 시작한 태스크(재시작 복구)는 유지
+        if self._tasks.get(job_id) is task:
+            del self._tasks[job_id]
+            stream = self._streams.get((game_id, style))
+            if stream is not None:
+                stream.pop(job_id, None)
+                if not stream:
+                    del self._streams[(game_id, style)]
+        get_metrics().set_gauge("job_tasks_running", len(self._tasks))
+
+    def is_running(self, job_id: str) -> bool:
+        """작업 태스크 진행 여부"""
+        task = self._tasks.get(job_id)
+        return task is not None and not task.done()
+
+    async def cancel(self, job_id: str, reason: str) -> bool:
+        """
+        작업 태스크 취소 후 종료 대기 (슬롯 반환 / RunPod 요청 중단 확인)
+
+        Args:
+            job_id: Job ID
+            reason: 취소 사유 (메트릭 라벨, "deleted" / "superseded")
+
+        Returns:
+            False: 진행 중인 태스크 없음
+        """
+        task = self._tasks.get(job_id)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        self.cancelled[reason] = self.cancelled.get(reason, 0) + 1
+        get_metrics().incr("job_cancelled_total", reason=reason)
+        if self.cancel_wait <= 0:
+            return True
+        done, _ = await asyncio.wait({task}, timeout=self.cancel_wait)
+        if not done:
+            print(f"[CANCEL] {job_id} 태스크가 {self.cancel_wait:.0f}초 안에 종료되지 않았습니다")
+        return True
+
+    async def supersede_candidates(self, job: JobData, exclude: Iterable[str] = ()) -> List[str]:
+        """
+        job보다 먼저 들어온 같은 gameId + style 작업 중 대체할 작업
+
+        Args:
+            job: 새 작업
+            exclude: 대상에서 제외할 Job ID (같은 일괄 요청의 작업)
+
+        Returns:
+            Job ID 리스트 (JOB_SUPERSEDE_POLICY=off면 빈 리스트)
+        """
+        if self.supersede_policy == "off":
+            return []
+        excluded = set(exclude)
+        excluded.add(job.job_id)
+        candidates = [
+            job_id for job_id in self._streams.get((job.game_id, job.style), {})
+            if job_id not in excluded
+        ]
+        found = await get_job_store().get_jobs(candidates)
+
+        result = []
+        for job_id, older in found.items():
+            if older is None or older.status != JobStatus.PENDING or older.created_at > job.created_at:
+                continue
+            if self.supersede_policy == "queued" and "dispatched" in older.timings:
+                continue
+            if older.window_end is not None and job.window_end is not None and older.window_end > job.window_end:
+                continue
+            result.append(job_id)
+        return result
+
+    def snapshot(self) -> dict:
+        """상태 요약"""
+        return {
+            "running": len(self._tasks),
+            "supersedePolicy": self.supersede_policy,
+            "cancelled": dict(self.cancelled)
+        }
+
+
+# 싱글톤 인스턴스
+_job_tasks: Optional[JobTaskRegistry] = None
+
+
+def get_job_tasks() -> JobTaskRegistry:
+    """JobTaskRegistry 인스턴스 반환"""
+    global _job_tasks
+    if _job_tasks is None:
+        _job_tasks = JobTaskRegistry()
+    return _job_tasks
@@ -0,0 +1,175 @@
+"""
+응답 시간 모델 / 요청별 적응형 타임아웃
+고정 타임아웃(RunPod 300초, 웹훅 10초) 대신 관측한 응답 시간 백분위로 요청별 마감 시간을 계산
+-> 멈춘 호출은 수 분이 아니라 수 초 안에 실패하고, 다른 엔드포인트 재시도 또는 규칙 기반 해설로 전환
+
+- 키: (단계, 엔드포인트, 스타일, 액션 수) -> 샘플이 부족하면 (엔드포인트, 스타일) -> (엔드포인트) 순으로 대체
+- 단계: total (요청 ~ 응답 완료), queue / execution (비동기 모드, RunPod delayTime / executionTime)
+- 마감 시간 = 백분위(LATENCY_TIMEOUT_PERCENTILE) x LATENCY_TIMEOUT_MULTIPLIER (하한 / 상한 적용)
+- 엔드포인트가 LATENCY_MODEL_STALE_SECONDS 동안 응답하지 않았으면 (콜드 스타트 가능) 학습값 대신 기본 타임아웃 사용
+
+Version: 1.0
+"""
+
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from .circuit_breaker import LatencyWindow
+from .metrics import get_metrics
+
+# 적응형 타임아웃 사용 여부 (false면 고정 타임아웃)
+ADAPTIVE_TIMEOUT_ENABLED = os.getenv("ADAPTIVE_TIMEOUT_ENABLED", "true").lower() == "true"
+# 키별 최소 샘플 수 (미만이면 상위 키로 대체)
+LATENCY_MODEL_MIN_SAMPLES = int(os.getenv("LATENCY_MODEL_MIN_SAMPLES", "20"))
+LATENCY_TIMEOUT_PERCENTILE = float(os.getenv("LATENCY_TIMEOUT_PERCENTILE", "99"))
+LATENCY_TIMEOUT_MULTIPLIER = float(os.getenv("LATENCY_TIMEOUT_MULTIPLIER", "2.0"))
+# RunPod 호출 마감 시간 하한 (초, 상한은 호출 측 전체 타임아웃)
+LATENCY_TIMEOUT_MIN = float(os.getenv("LATENCY_TIMEOUT_MIN", "15"))
+# 마지막 응답 이후 이 시간(초)이 지나면 학습값 미사용 (RunPod 워커 유휴 종료 -> 콜드 스타트)
+LATENCY_MODEL_STALE_SECONDS = float(os.getenv("LATENCY_MODEL_STALE_SECONDS", "300"))
+
+Key = Tuple[str, str, Optional[str], Optional[int]]
+
+
+class LatencyModel:
+    """(단계, 엔드포인트, 스타일, 액션 수)별 응답 시간 백분위"""
+
+    def __init__(
+        self,
+        min_samples: int = LATENCY_MODEL_MIN_SAMPLES,
+        percentile: float = LATENCY_TIMEOUT_PERCENTILE,
+        multiplier: float = LATENCY_TIMEOUT_MULTIPLIER,
+        stale_seconds: float = LATENCY_MODEL_STALE_SECONDS,
+        enabled: bool = ADAPTIVE_TIMEOUT_ENABLED
+    ):
+        self.min_samples = max(1, min_samples)
+        self.percentile = percentile
+        self.multiplier = max(1.0, multiplier)
+        self.stale_seconds = stale_seconds
+        self.enabled = enabled
+        self._windows: Dict[Key, LatencyWindow] = {}
+        self._last_seen: Dict[str, float] = {}
+
+    @staticmethod
+    def _keys(phase: str, endpoint: str, style: Optional[str], count: Optional[int]):
+        """세부 키 -> 상위 키 순서"""
+        if style is not None and count is not None:
+            yield (phase, endpoint, style, count)
+        if style is not None:
+            yield (phase, endpoint, style, None)
+        yield (phase, endpoint, None, None)
+
+    def observe(
+        self,
+        endpoint: str,
+        seconds: float,
+        style: Optional[str] = None,
+        count: Optional[int] = None,
+        phase: str = "total"
+    ) -> None:
+        """
+        응답 시간 기록 (세부 키와 상위 키 모두)
+
+        Args:
+            endpoint: 엔드포인트 이름 (웹훅은 "spring_webhook")
+            seconds: 응답 시간 (초)
+            style: 해설 스타일
+            count: 요청 액션 수
+            phase: total / queue / execution
+        """
+        for key in self._keys(phase, endpoint, style, count):
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = LatencyWindow()
+            window.add(seconds)
+        if phase == "total":
+            self._last_seen[endpoint] = time.monotonic()
+
+    def quantile(
+        self,
+        endpoint: str,
+        pct: float,
+        style: Optional[str] = None,
+        count: Optional[int] = None,
+        phase: str = "total"
+    ) -> Optional[float]:
+        """
+        백분위 응답 시간 (샘플이 충분한 가장 세부적인 키 기준)
+
+        Returns:
+            응답 시간(초), 모든 키의 샘플이 부족하면 None
+        """
+        for key in self._keys(phase, endpoint, style, count):
+            window = self._windows.get(key)
+            if window is not None and len(window) >= self.min_samples:
+                return window.percentile(pct)
+        return None
+
+    def deadline(
+        self,
+        endpoint: str,
+        style: Optional[str] = None,
+        count: Optional[int] = None,
+        floor: float = LATENCY_TIMEOUT_MIN,
+        ceiling: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        요청 마감 시간 = 백분위 x 배율 (floor ~ ceiling)
+
+        Returns:
+            마감 시간(초), 비활성화 / 샘플 부족 / 오래된 샘플이면 None (호출 측 기본 타임아웃 사용)
+        """
+        if not self.enabled:
+            return None
+        last_seen = self._last_seen.get(endpoint)
+        if last_seen is None or time.monotonic() - last_seen > self.stale_seconds:
+            return None
+        quantile = self.quantile(endpoint, self.percentile, style, count)
+        if quantile is None:
+            return None
+        deadline = max(floor, quantile * self.multiplier)
+        if ceiling is not None:
+            deadline = min(deadline, ceiling)
+        get_metrics().observe("adaptive_deadline_seconds", deadline, endpoint=endpoint)
+        return deadline
+
+    def snapshot(self) -> dict:
+        """상태 요약 (키별 샘플 수 / 백분위)"""
+        now = time.monotonic()
+        items = []
+        for (phase, endpoint, style, count), window in sorted(
+            self._windows.items(), key=lambda item: tuple(str(part) for part in item[0])
+        ):
+            items.append({
+                "phase": phase,
+                "endpoint": endpoint,
+                "style": style,
+                "count": count,
+                "samples": len(window),
+                "p50": window.percentile(50),
+                "p95": window.percentile(95),
+                "p99": window.percentile(99)
+            })
+        return {
+            "enabled": self.enabled,
+            "percentile": self.percentile,
+            "multiplier": self.multiplier,
+            "minSamples": self.min_samples,
+            "lastSeenSecondsAgo": {
+                endpoint: round(now - seen, 1) for endpoint, seen in self._last_seen.items()
+            },
+            "keys": items
+        }
+
+
+# 싱글톤 인스턴스
+_latency_model: Optional[LatencyModel] = None
+
+
+def get_latency_model() -> LatencyModel:
+    """LatencyModel 인스턴스 반환"""
+    global _latency_model
+    if _latency_model is None:
+        _latency_model = LatencyModel()
+    return _latency_model
@@ -0,0 +1,147 @@
+"""
+이벤트 루프 지연 모니터 / 과부하 시 부하 차단
+워커의 폴링 응답, 파싱, JSON 직렬화, 웹훅 전송이 모두 같은 asyncio 루프를 공유하므로
+루프가 포화되면 새 해설 요청을 차단(503 + Retry-After)하거나 규칙 기반 해설로 대체
+
+- 주기적으로 sleep(interval) 후 실제 경과 시간과의 차이(루프 지연)를 측정
+- 지연 EWMA가 LOOP_LAG_SHED_THRESHOLD를 넘으면 과부하, 절반 아래로 내려오면 해제 (히스테리시스)
+- cpu_section(): 루프를 점유하는 CPU 구간(프롬프트 생성, 응답 파싱 등) 시간 측정
+
+Version: 1.0
+"""
+
+import os
+import time
+import asyncio
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from .circuit_breaker import LatencyWindow
+from .metrics import get_metrics
+
+# 루프 지연 측정 주기 (초)
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.5"))
+# 과부하 판정 지연 (초, EWMA 기준)
+LOOP_LAG_SHED_THRESHOLD = float(os.getenv("LOOP_LAG_SHED_THRESHOLD", "0.5"))
+# 과부하 시 새 해설 요청 처리: reject (503 + Retry-After) / fallback (규칙 기반 해설로 완료) / off
+LOOP_LAG_SHED_POLICY = os.getenv("LOOP_LAG_SHED_POLICY", "reject")
+# 503 응답의 Retry-After (초)
+LOOP_LAG_RETRY_AFTER = int(os.getenv("LOOP_LAG_RETRY_AFTER", "5"))
+# 이 시간(초) 이상 걸린 CPU 구간은 로그 출력
+CPU_SECTION_SLOW_SECONDS = float(os.getenv("CPU_SECTION_SLOW_SECONDS", "0.1"))
+
+EWMA_ALPHA = 0.3
+
+
+@contextmanager
+def cpu_section(name: str) -> Iterator[None]:
+    """
+    이벤트 루프를 점유하는 동기 CPU 구간 시간 측정 (cpu_section_seconds{section})
+
+    Usage:
+        with cpu_section("prompt_build"):
+            user_prompt = build_user_prompt(...)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        get_metrics().observe("cpu_section_seconds", elapsed, section=name)
+        if elapsed >= CPU_SECTION_SLOW_SECONDS:
+            print(f"[LOOP] CPU 구간 지연: {name} {elapsed * 1000:.0f}ms")
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 측정 및 과부하 판정"""
+
+    def __init__(
+        self,
+        interval: float = LOOP_LAG_INTERVAL,
+        threshold: float = LOOP_LAG_SHED_THRESHOLD,
+        policy: str = LOOP_LAG_SHED_POLICY
+    ):
+        self.interval = max(0.01, interval)
+        self.threshold = threshold
+        self.policy = policy if policy in ("reject", "fallback", "off") else "reject"
+
+        self.lag_ewma = 0.0
+        self.last_lag = 0.0
+        self.overloaded = False
+        self.shed_count = 0
+        self._window = LatencyWindow()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def shedding(self) -> bool:
+        """새 해설 요청을 차단/대체해야 하는지 여부"""
+        return self.overloaded and self.policy != "off"
+
+    def start(self) -> None:
+        """모니터 시작 (lifespan에서 호출)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """모니터 종료"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def record(self, lag: float) -> None:
+        """지연 샘플 반영 및 과부하 상태 갱신"""
+        self.last_lag = lag
+        self.lag_ewma = EWMA_ALPHA * lag + (1 - EWMA_ALPHA) * self.lag_ewma
+        self._window.add(lag)
+
+        if not self.overloaded and self.lag_ewma >= self.threshold:
+            self.overloaded = True
+            print(f"[LOOP] 이벤트 루프 과부하: 지연 {self.lag_ewma * 1000:.0f}ms - 새 요청 {self.policy}")
+        elif self.overloaded and self.lag_ewma < self.threshold / 2:
+            self.overloaded = False
+            print(f"[LOOP] 이벤트 루프 과부하 해제: 지연 {self.lag_ewma * 1000:.0f}ms")
+
+        metrics = get_metrics()
+        metrics.observe("event_loop_lag_seconds", lag)
+        metrics.set_gauge("event_loop_lag_ewma_seconds", round(self.lag_ewma, 4))
+        metrics.set_gauge("event_loop_overloaded", int(self.overloaded))
+
+    def note_shed(self) -> None:
+        """차단/대체한 요청 기록"""
+        self.shed_count += 1
+        get_metrics().incr("load_shed_total", policy=self.policy)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - started - self.interval))
+
+    def snapshot(self) -> dict:
+        """상태 요약"""
+        return {
+            "lagMs": round(self.last_lag * 1000, 1),
+            "lagEwmaMs": round(self.lag_ewma * 1000, 1),
+            "lagP95Ms": round((self._window.percentile(95) or 0.0) * 1000, 1),
+            "overloaded": self.overloaded,
+            "policy": self.policy,
+            "thresholdMs": round(self.threshold * 1000, 1),
+            "shed": self.shed_count
+        }
+
+
+# 싱글톤 인스턴스
+_loop_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_loop_monitor() -> LoopLagMonitor:
+    """LoopLagMonitor 인스턴스 반환"""
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = LoopLagMonitor()
+    return _loop_monitor
@@ -0,0 +1,101 @@
+"""
+In-memory 메트릭 수집
+카운터 / 게이지 / 응답 시간 분포 (최근 샘플 기반 백분위)
+
+Version: 1.0
+"""
+
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+def _metric_key(name: str, labels: dict) -> str:
+    """라벨 포함 메트릭 키 생성 (예: runpod_call_seconds{style=CASTER})"""
+    if not labels:
+        return name
+    label_text = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+    return f"{name}{{{label_text}}}"
+
+
+class Histogram:
+    """최근 샘플 기반 분포 (count/sum은 누적, 백분위는 최근 max_samples개 기준)"""
+
+    def __init__(self, max_samples: int = 1000):
+        self.count = 0
+        self.total = 0.0
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self._samples.append(value)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 4),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": max(self._samples) if self._samples else None
+        }
+
+
+class Metrics:
+    """프로세스 단위 메트릭 레지스트리"""
+
+    def __init__(self):
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._histograms: Dict[str, Histogram] = {}
+
+    def incr(self, name: str, value: float = 1, **labels) -> None:
+        """카운터 증가"""
+        key = _metric_key(name, labels)
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """게이지 값 설정"""
+        self._gauges[_metric_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """분포 샘플 추가 (주로 응답 시간, 초 단위)"""
+        key = _metric_key(name, labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram()
+        histogram.observe(value)
+
+    def get_histogram(self, name: str, **labels) -> Optional[Histogram]:
+        """분포 조회 (없으면 None)"""
+        return self._histograms.get(_metric_key(name, labels))
+
+    def snapshot(self) -> dict:
+        """전체 메트릭 스냅샷"""
+        return {
+            "counters": dict(self._counters),
+            "gauges": dict(self._gauges),
+            "histograms": {
+                key: histogram.summary()
+                for key, histogram in self._histograms.items()
+            }
+        }
+
+
+# 싱글톤 인스턴스
+_metrics: Optional[Metrics] = None
+
+
+def get_metrics() -> Metrics:
+    """Metrics 인스턴스 반환"""
+    global _metrics
+    if _metrics is None:
+        _metrics = Metrics()
+    return _metrics
@@ -0,0 +1,314 @@
+"""
+운영 워커 온디맨드 프로파일링
+재배포 없이 경기일 부하에서 CPU 핫 경로 / 메모리 증가 지점을 확인
+
+- CPU: 샘플링 프로파일러 (별도 스레드에서 sys._current_frames() 주기 수집, N초 또는 N개 요청 동안)
+  결과는 collapsed stack 형식 (.folded, speedscope / flamegraph.pl / inferno에서 열기)
+- 메모리: tracemalloc 스냅샷 차이 (구간 동안 증가한 할당 위치 상위 N개)
+  결과는 텍스트 요약 (.txt) + 원본 스냅샷 (.tracemalloc, tracemalloc.Snapshot.load로 열기)
+- 결과 파일은 PROFILE_OUTPUT_DIR에 최대 PROFILE_MAX_FILES개만 유지 (오래된 파일부터 삭제)
+
+Version: 1.0
+"""
+
+import os
+import sys
+import time
+import threading
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+# 결과 파일 디렉터리 / 최대 파일 수
+PROFILE_OUTPUT_DIR = os.getenv("PROFILE_OUTPUT_DIR", "data/profiles")
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "20"))
+# 프로파일 1회 최대 시간 (초)
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "120"))
+# tracemalloc 할당 위치별 저장 프레임 수 (groupBy=traceback에서 사용)
+PROFILE_TRACEMALLOC_FRAMES = int(os.getenv("PROFILE_TRACEMALLOC_FRAMES", "10"))
+
+PROFILE_FILE_EXTENSIONS = (".folded", ".txt", ".tracemalloc")
+
+
+class ProfileBusy(Exception):
+    """이미 다른 프로파일이 실행 중"""
+
+
+class RequestCounterMiddleware:
+    """완료된 HTTP 요청 수 집계 (N개 요청 동안 CPU 프로파일용, 순수 ASGI 미들웨어)"""
+
+    completed = 0
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            RequestCounterMiddleware.completed += 1
+
+
+# 프레임 파일 경로 축약 기준 (프로젝트 루트 / 표준 라이브러리)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_STDLIB_ROOT = os.path.dirname(os.__file__)
+
+
+def _frame_label(frame) -> str:
+    """스택 프레임 이름 (collapsed stack 구분자 ';' 제외)"""
+    code = frame.f_code
+    filename = code.co_filename
+    # site-packages / 프로젝트 / 표준 라이브러리 기준 상대 경로로 축약
+    if "site-packages" + os.sep in filename:
+        filename = filename.split("site-packages" + os.sep, 1)[1]
+    else:
+        for root in (_PROJECT_ROOT, _STDLIB_ROOT):
+            if filename.startswith(root + os.sep):
+                filename = filename[len(root) + 1:]
+                break
+    return f"{code.co_name} ({filename}:{frame.f_lineno})".replace(";", ",")
+
+
+class ProfileStore:
+    """프로파일 결과 디렉터리 (최대 파일 수 유지)"""
+
+    def __init__(self, directory: str = PROFILE_OUTPUT_DIR, max_files: int = PROFILE_MAX_FILES):
+        self.directory = directory
+        self.max_files = max(1, max_files)
+
+    def path_for(self, kind: str, extension: str) -> str:
+        """새 결과 파일 경로 (예: data/profiles/cpu_20240303_140000_123456.folded)"""
+        os.makedirs(self.directory, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return os.path.join(self.directory, f"{kind}_{timestamp}{extension}")
+
+    def list_files(self) -> List[dict]:
+        """결과 파일 목록 (최신순)"""
+        if not os.path.isdir(self.directory):
+            return []
+        files = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(PROFILE_FILE_EXTENSIONS) and os.path.isfile(path):
+                stat = os.stat(path)
+                files.append({"name": name, "size": stat.st_size, "modified": stat.st_mtime})
+        files.sort(key=lambda item: item["modified"], reverse=True)
+        return files
+
+    def resolve(self, name: str) -> Optional[str]:
+        """파일 이름 -> 경로 (목록에 있는 파일만, 경로 조작 방지)"""
+        if name in {item["name"] for item in self.list_files()}:
+            return os.path.join(self.directory, name)
+        return None
+
+    def prune(self) -> int:
+        """오래된 파일 삭제 (max_files개 유지)"""
+        removed = 0
+        for item in self.list_files()[self.max_files:]:
+            try:
+                os.remove(os.path.join(self.directory, item["name"]))
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+class Profiler:
+    """CPU 샘플링 / tracemalloc 프로파일 실행기 (동시에 1개만 실행)"""
+
+    def __init__(self, store: Optional[ProfileStore] = None):
+        self.store = store or ProfileStore()
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> None:
+        if not self._lock.acquire(blocking=False):
+            raise ProfileBusy("이미 프로파일이 실행 중입니다.")
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def sample_cpu(
+        self,
+        seconds: float,
+        requests: Optional[int] = None,
+        interval: float = 0.01,
+        top: int = 20,
+        all_threads: bool = False
+    ) -> dict:
+        """
+        CPU 샘플링 프로파일 (동기, asyncio.to_thread로 실행)
+
+        Args:
+            seconds: 최대 수집 시간 (초, PROFILE_MAX_SECONDS 이하)
+            requests: 지정 시 완료된 HTTP 요청이 이 수에 도달하면 종료
+            interval: 샘플링 주기 (초)
+            top: 반환할 상위 프레임 수 (자체 샘플 기준)
+            all_threads: False면 이벤트 루프(메인) 스레드만, True면 모든 스레드 (to_thread 작업 포함)
+
+        Returns:
+            {"file", "samples", "durationSeconds", "requests", "top": [{"frame", "samples", "ratio"}]}
+
+        Raises:
+            ProfileBusy: 다른 프로파일 실행 중
+        """
+        self._acquire()
+        try:
+            seconds = min(max(seconds, 0.1), PROFILE_MAX_SECONDS)
+            own_thread = threading.get_ident()
+            main_thread = threading.main_thread().ident
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+            stacks: Counter = Counter()
+            leaves: Counter = Counter()
+            samples = 0
+            started = time.monotonic()
+            requests_started = RequestCounterMiddleware.completed
+
+            while time.monotonic() - started < seconds:
+                if requests and RequestCounterMiddleware.completed - requests_started >= requests:
+                    break
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_thread or (not all_threads and thread_id != main_thread):
+                        continue
+                    labels = []
+                    while frame is not None:
+                        labels.append(_frame_label(frame))
+                        frame = frame.f_back
+                    if not labels:
+                        continue
+                    labels.append(thread_names.get(thread_id, f"thread-{thread_id}"))
+                    labels.reverse()
+                    stacks[";".join(labels)] += 1
+                    leaves[labels[-1]] += 1
+                samples += 1
+                time.sleep(interval)
+
+            duration = time.monotonic() - started
+            path = self.store.path_for("cpu", ".folded")
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            self.store.prune()
+
+            total = sum(leaves.values()) or 1
+            return {
+                "file": os.path.basename(path),
+                "samples": samples,
+                "durationSeconds": round(duration, 3),
+                "requests": RequestCounterMiddleware.completed - requests_started,
+                "top": [
+                    {"frame": frame, "samples": count, "ratio": round(count / total, 4)}
+                    for frame, count in leaves.most_common(top)
+                ]
+            }
+        finally:
+            self._lock.release()
+
+    def begin_memory(self) -> Tuple[tracemalloc.Snapshot, bool]:
+        """
+        tracemalloc 구간 시작
+
+        Returns:
+            (시작 스냅샷, 이 호출에서 tracemalloc을 켰는지 여부)
+
+        Raises:
+            ProfileBusy: 다른 프로파일 실행 중
+        """
+        self._acquire()
+        try:
+            started_here = not tracemalloc.is_tracing()
+            if started_here:
+                tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+            return tracemalloc.take_snapshot(), started_here
+        except Exception:
+            self._lock.release()
+            raise
+
+    def end_memory(
+        self,
+        before: tracemalloc.Snapshot,
+        started_here: bool,
+        seconds: float,
+        group_by: str = "lineno",
+        top: int = 20
+    ) -> dict:
+        """
+        tracemalloc 구간 종료 및 스냅샷 차이 저장 (begin_memory 이후 반드시 호출)
+
+        Args:
+            before: 시작 스냅샷
+            started_here: begin_memory에서 tracemalloc을 켰으면 종료
+            seconds: 구간 길이 (응답 기록용)
+            group_by: 집계 기준 (lineno / filename / traceback)
+            top: 반환할 상위 할당 위치 수
+
+        Returns:
+            {"file", "snapshotFile", "durationSeconds", "tracedKb", "top": [{"location", "sizeDiffKb", "countDiff", "sizeKb"}]}
+        """
+        try:
+            after = tracemalloc.take_snapshot()
+            traced_kb = tracemalloc.get_traced_memory()[0] / 1024
+            if started_here:
+                tracemalloc.stop()
+
+            filters = [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                tracemalloc.Filter(False, __file__),
+            ]
+            after = after.filter_traces(filters)
+            stats = after.compare_to(before.filter_traces(filters), group_by)
+            stats = [stat for stat in stats if stat.size_diff > 0][:top]
+
+            items = []
+            for stat in stats:
+                frames = stat.traceback.format(
+                    limit=PROFILE_TRACEMALLOC_FRAMES if group_by == "traceback" else 1,
+                    most_recent_first=True
+                )
+                items.append({
+                    "location": " <- ".join(line.strip() for line in frames if line.strip().startswith("File")),
+                    "sizeDiffKb": round(stat.size_diff / 1024, 1),
+                    "countDiff": stat.count_diff,
+                    "sizeKb": round(stat.size / 1024, 1)
+                })
+
+            path = self.store.path_for("memory", ".txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"# tracemalloc diff ({seconds:.1f}s, groupBy={group_by})\n")
+                for stat in stats:
+                    f.write(f"{stat}\n")
+                    if group_by == "traceback":
+                        for line in stat.traceback.format(most_recent_first=True):
+                            f.write(f"    {line}\n")
+            snapshot_path = path[:-len(".txt")] + ".tracemalloc"
+            after.dump(snapshot_path)
+            self.store.prune()
+
+            return {
+                "file": os.path.basename(path),
+                "snapshotFile": os.path.basename(snapshot_path),
+                "durationSeconds": round(seconds, 3),
+                "tracedKb": round(traced_kb, 1),
+                "top": items
+            }
+        finally:
+            self._lock.release()
+
+
+# 싱글톤 인스턴스
+_profiler: Optional[Profiler] = None
+
+
+def get_profiler() -> Profiler:
+    """Profiler 인스턴스 반환"""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
@@ -0,0 +1,220 @@
+"""
+WebSocket 푸시 채널 허브
+Spring Backend가 연결 1개를 유지하며 gameId / jobId 단위로 구독하고, 작업 상태가 저장될 때마다
+(PENDING 초안 -> DONE 해설 / ERROR) 이벤트를 받음 (작업별 웹훅 + 2초 폴링 대체)
+
+- 모든 이벤트에 단조 증가 seq 부여, 최근 PUSH_BUFFER_SIZE개를 링 버퍼에 보관
+  재연결 시 since=<마지막 seq>로 놓친 이벤트 재전송 (버퍼 범위를 벗어났거나 워커가 재시작되어
+  epoch가 다르면 resync 메시지 -> GET /jobs?ids= 로 현재 상태 조회)
+- 이벤트는 1회만 JSON 직렬화하여 모든 구독자에게 같은 문자열 전송
+- 흐름 제어: 구독자별 전송 큐(PUSH_QUEUE_MAX)가 가득 차면 (느린 소비자) 큐를 비우고 1013으로 연결 종료
+  -> 클라이언트는 since로 재연결하여 이어받음 (이벤트 루프 메모리 무한 증가 방지)
+
+Version: 1.0
+"""
+
+import os
+import json
+import uuid
+import asyncio
+from collections import deque
+from typing import Iterable, Optional, Set
+
+from .metrics import get_metrics
+
+# 재연결 재전송용 최근 이벤트 수
+PUSH_BUFFER_SIZE = int(os.getenv("PUSH_BUFFER_SIZE", "1000"))
+# 구독자별 전송 대기 최대 메시지 수 (초과 시 느린 소비자로 연결 종료)
+PUSH_QUEUE_MAX = int(os.getenv("PUSH_QUEUE_MAX", "256"))
+# 연결 토큰 (?token=, 빈 문자열이면 검사 안 함)
+PUSH_TOKEN = os.getenv("PUSH_TOKEN", "")
+
+# 모든 경기 구독 (gameIds에 "*")
+ALL_GAMES = "*"
+
+
+class PushSubscriber:
+    """WebSocket 연결 1개의 구독 상태 / 전송 큐"""
+
+    def __init__(self, queue_max: int = PUSH_QUEUE_MAX):
+        self.game_ids: Set[str] = set()
+        self.job_ids: Set[str] = set()
+        # 전송 대기 메시지 (None: 느린 소비자 -> 연결 종료)
+        self.queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=max(1, queue_max) + 1)
+        self.queue_max = max(1, queue_max)
+        self.overflowed = False
+        self.last_seq = 0  # 큐에 넣은 마지막 이벤트 seq
+
+    def matches(self, game_id: str, job_id: str) -> bool:
+        """이벤트 구독 여부"""
+        return job_id in self.job_ids or game_id in self.game_ids or ALL_GAMES in self.game_ids
+
+    def offer(self, text: str) -> bool:
+        """
+        전송 큐에 추가 (블로킹 없음)
+
+        Returns:
+            False: 큐가 가득 참 -> 큐를 비우고 종료 신호(None) 추가
+        """
+        if self.overflowed:
+            return False
+        if self.queue.qsize() >= self.queue_max:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+            return False
+        self.queue.put_nowait(text)
+        return True
+
+    def send(self, message: dict) -> bool:
+        """제어 메시지 전송 (hello / subscribed / resync / error 등)"""
+        return self.offer(json.dumps(message, ensure_ascii=False))
+
+
+class PushHub:
+    """구독자 관리 / 이벤트 발행 / 재연결 재전송"""
+
+    def __init__(self, buffer_size: int = PUSH_BUFFER_SIZE, queue_max: int = PUSH_QUEUE_MAX):
+        self.epoch = uuid.uuid4().hex[:8]  # 워커 재시작 시 seq가 초기화되므로 구분용
+        self.seq = 0
+        self.queue_max = queue_max
+        # (seq, gameId, jobId, 직렬화된 이벤트)
+        self._buffer: deque = deque(maxlen=max(1, buffer_size))
+        self._subscribers: Set[PushSubscriber] = set()
+        self.published = 0
+        self.overflows = 0
+
+    def connect(self) -> PushSubscriber:
+        """새 연결 등록 및 hello 메시지 전송"""
+        subscriber = PushSubscriber(self.queue_max)
+        self._subscribers.add(subscriber)
+        subscriber.send({"type": "hello", "epoch": self.epoch, "seq": self.seq})
+        get_metrics().set_gauge("push_subscribers", len(self._subscribers))
+        return subscriber
+
+    def disconnect(self, subscriber: PushSubscriber) -> None:
+        """연결 해제"""
+        self._subscribers.discard(subscriber)
+        get_metrics().set_gauge("push_subscribers", len(self._subscribers))
+
+    def subscribe(
+        self,
+        subscriber: PushSubscriber,
+        game_ids: Iterable[str] = (),
+        job_ids: Iterable[str] = ()
+    ) -> None:
+        """
+        구독 추가
+
+        Args:
+            subscriber: 구독자
+            game_ids: 경기 ID ("*"이면 모든 경기)
+            job_ids: Job ID (완료/오류 이벤트 후 자동 구독 해제)
+        """
+        subscriber.game_ids.update(game_ids)
+        subscriber.job_ids.update(job_ids)
+
+    def replay(
+        self,
+        subscriber: PushSubscriber,
+        since: int,
+        epoch: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        since 이후 놓친 이벤트 재전송 (재연결 시)
+
+        Args:
+            subscriber: 구독자
+            since: 마지막으로 받은 seq
+            epoch: 마지막으로 받은 hello의 epoch
+
+        Returns:
+            재전송 불가 사유 (None: 정상, "epoch_mismatch" / "gap": resync 필요)
+        """
+        if subscriber.overflowed:
+            return None
+        if epoch is not None and epoch != self.epoch:
+            return "epoch_mismatch"
+        if self._buffer and since < self._buffer[0][0] - 1:
+            return "gap"
+
+        for seq, game_id, job_id, text in self._buffer:
+            if seq > since and seq > subscriber.last_seq and subscriber.matches(game_id, job_id):
+                if not subscriber.offer(text):
+                    self._note_overflow()
+                    break
+                subscriber.last_seq = seq
+        return None
+
+    def unsubscribe(
+        self,
+        subscriber: PushSubscriber,
+        game_ids: Iterable[str] = (),
+        job_ids: Iterable[str] = ()
+    ) -> None:
+        """구독 해제"""
+        subscriber.game_ids.difference_update(game_ids)
+        subscriber.job_ids.difference_update(job_ids)
+
+    def publish(self, game_id: str, job_id: str, payload: dict, terminal: bool = False) -> int:
+        """
+        작업 상태 이벤트 발행 (이벤트 루프에서 호출, 블로킹 없음)
+
+        Args:
+            game_id: 경기 ID
+            job_id: Job ID
+            payload: 작업 상태 (GET /jobs/{jobId} 응답과 같은 필드)
+            terminal: DONE / ERROR 여부 (jobId 구독 자동 해제)
+
+        Returns:
+            이벤트 seq
+        """
+        self.seq += 1
+        text = json.dumps(
+            {"type": "job", "seq": self.seq, "gameId": game_id, **payload},
+            ensure_ascii=False
+        )
+        self._buffer.append((self.seq, game_id, job_id, text))
+        self.published += 1
+
+        for subscriber in self._subscribers:
+            if subscriber.overflowed or not subscriber.matches(game_id, job_id):
+                continue
+            if subscriber.offer(text):
+                subscriber.last_seq = self.seq
+            else:
+                self._note_overflow()
+            if terminal:
+                subscriber.job_ids.discard(job_id)
+
+        get_metrics().incr("push_events_total")
+        return self.seq
+
+    def _note_overflow(self) -> None:
+        self.overflows += 1
+        get_metrics().incr("push_overflow_total")
+        print(f"[PUSH] 느린 소비자 연결 종료 (전송 대기 {self.queue_max}개 초과)")
+
+    def snapshot(self) -> dict:
+        """상태 요약"""
+        return {
+            "epoch": self.epoch,
+            "seq": self.seq,
+            "oldestSeq": self._buffer[0][0] if self._buffer else None,
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "overflows": self.overflows
+        }
+
+
+# 싱글톤 인스턴스
+_push_hub: Optional[PushHub] = None
+
+
+def get_push_hub() -> PushHub:
+    """PushHub 인스턴스 반환"""
+    global _push_hub
+    if _push_hub is None:
+        _push_hub = PushHub()
+    return _push_hub
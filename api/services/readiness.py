@@ -0,0 +1,168 @@
+"""
+포화 인지 준비 상태 확인 (GET /ready)
+/health는 프로세스 생존과 설정 여부만 보고하므로, 로드 밸런서 / App Service 자동 확장이
+과부하 인스턴스를 피할 수 있도록 실제 처리 여유를 기준으로 준비 상태를 판정
+
+- 점검 항목: 스케줄러 대기 작업 수 / 최장 대기 시간, 이벤트 루프 지연(EWMA), JobStore PENDING 작업 수,
+  RunPod 응답 p95 (선택)
+- 한 항목이라도 한도를 넘으면 not ready (503), 모든 항목이 한도 x READY_RECOVERY_RATIO 아래로
+  내려와야 다시 ready (히스테리시스, 경계값에서 ready/not ready가 반복되지 않도록)
+- 진행 중 RunPod 호출 / 슬롯 한도, 서킷 브레이커 상태는 판정에 쓰지 않고 함께 보고
+  (모든 인스턴스가 같은 RunPod 엔드포인트를 공유하므로 다른 인스턴스로 보내도 해소되지 않음)
+
+Version: 1.0
+"""
+
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .job_scheduler import get_job_scheduler
+from .job_store import get_job_store
+from .loop_monitor import LOOP_LAG_SHED_THRESHOLD, get_loop_monitor
+from .metrics import get_metrics
+
+# 한도 (0이면 해당 항목 점검 안 함)
+READY_MAX_QUEUE_DEPTH = int(os.getenv("READY_MAX_QUEUE_DEPTH", "50"))
+READY_MAX_QUEUE_AGE = float(os.getenv("READY_MAX_QUEUE_AGE", "30"))
+READY_MAX_LOOP_LAG = float(os.getenv("READY_MAX_LOOP_LAG", str(LOOP_LAG_SHED_THRESHOLD)))
+READY_MAX_PENDING_JOBS = int(os.getenv("READY_MAX_PENDING_JOBS", "500"))
+READY_MAX_RUNPOD_P95 = float(os.getenv("READY_MAX_RUNPOD_P95", "0"))
+# not ready -> ready 복귀 기준 (한도 대비 비율)
+READY_RECOVERY_RATIO = float(os.getenv("READY_RECOVERY_RATIO", "0.8"))
+
+
+class ReadinessProbe:
+    """처리 여유 기반 준비 상태 판정 (히스테리시스)"""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, float]] = None,
+        recovery_ratio: float = READY_RECOVERY_RATIO
+    ):
+        self.limits = limits if limits is not None else {
+            "queueDepth": READY_MAX_QUEUE_DEPTH,
+            "queueAgeSeconds": READY_MAX_QUEUE_AGE,
+            "loopLagSeconds": READY_MAX_LOOP_LAG,
+            "pendingJobs": READY_MAX_PENDING_JOBS,
+            "runpodP95Seconds": READY_MAX_RUNPOD_P95
+        }
+        self.recovery_ratio = min(max(recovery_ratio, 0.0), 1.0)
+        self.ready = True
+        self.changed_at = time.monotonic()
+        self.flips = 0
+
+    def evaluate(self, values: Dict[str, Optional[float]]) -> Tuple[bool, Dict[str, dict], List[str]]:
+        """
+        측정값 -> 준비 상태
+
+        Args:
+            values: 항목별 측정값 (None이면 샘플 없음 -> 통과)
+
+        Returns:
+            (ready, 항목별 {"value", "limit", "ok"}, 한도 초과 항목)
+        """
+        # 현재 not ready면 복귀 기준(한도 x recovery_ratio)으로 판정
+        ratio = 1.0 if self.ready else self.recovery_ratio
+        checks = {}
+        failing = []
+        for name, limit in self.limits.items():
+            value = values.get(name)
+            if not limit:
+                continue
+            ok = value is None or value <= limit * ratio
+            checks[name] = {
+                "value": round(value, 3) if isinstance(value, float) else value,
+                "limit": limit,
+                "ok": ok
+            }
+            if not ok:
+                failing.append(name)
+
+        ready = not failing
+        if ready != self.ready:
+            self.ready = ready
+            self.changed_at = time.monotonic()
+            self.flips += 1
+            if ready:
+                print("[READY] 준비 상태 복귀")
+            else:
+                print(f"[READY] 포화로 not ready 전환: {', '.join(failing)}")
+        get_metrics().set_gauge("ready", int(self.ready))
+        return self.ready, checks, failing
+
+    def check(self) -> dict:
+        """
+        현재 인스턴스 상태 수집 및 판정
+
+        Returns:
+            {"ready", "reasons", "checks", "capacity", "breakers", "jobs", "loop", "sinceSeconds", "flips"}
+        """
+        scheduler = get_job_scheduler()
+        queue_depth, queue_age = scheduler.queue_stats()
+        jobs = get_job_store().stats()
+        monitor = get_loop_monitor()
+        loop = monitor.snapshot()
+
+        endpoints = _endpoint_snapshots() or []
+        p95_values = [item["p95Latency"] for item in endpoints if item.get("p95Latency") is not None]
+
+        ready, checks, failing = self.evaluate({
+            "queueDepth": queue_depth,
+            "queueAgeSeconds": queue_age,
+            "loopLagSeconds": monitor.lag_ewma,
+            "pendingJobs": jobs["pending"],
+            "runpodP95Seconds": max(p95_values) if p95_values else None
+        })
+
+        if not endpoints:
+            # RunPod 미설정 인스턴스는 트래픽을 받지 않음
+            ready = False
+            failing = failing + ["runpodConfigured"]
+
+        return {
+            "ready": ready,
+            "reasons": failing,
+            "checks": checks,
+            "capacity": {
+                "inflight": scheduler.running,
+                "maxConcurrency": scheduler.max_concurrency,
+                "queueDepth": queue_depth,
+                "queueAgeSeconds": round(queue_age, 3)
+            },
+            "breakers": [
+                {
+                    "name": item["name"],
+                    "state": item["state"],
+                    "outstanding": item["outstanding"],
+                    "p95Latency": item["p95Latency"]
+                }
+                for item in endpoints
+            ],
+            "jobs": jobs,
+            "loop": {"lagEwmaMs": loop["lagEwmaMs"], "lagP95Ms": loop["lagP95Ms"], "overloaded": loop["overloaded"]},
+            "sinceSeconds": round(time.monotonic() - self.changed_at, 1),
+            "flips": self.flips
+        }
+
+
+def _endpoint_snapshots() -> Optional[List[dict]]:
+    """RunPod 엔드포인트 상태 (미설정이면 None)"""
+    from .runpod_service import get_runpod_service
+
+    try:
+        return get_runpod_service().pool.snapshot()["endpoints"]
+    except ValueError:
+        return None
+
+
+# 싱글톤 인스턴스
+_readiness_probe: Optional[ReadinessProbe] = None
+
+
+def get_readiness_probe() -> ReadinessProbe:
+    """ReadinessProbe 인스턴스 반환"""
+    global _readiness_probe
+    if _readiness_probe is None:
+        _readiness_probe = ReadinessProbe()
+    return _readiness_probe
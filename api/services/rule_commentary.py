@@ -0,0 +1,498 @@
+"""
+규칙 기반 즉시 해설 엔진
+LLM 없이 액션 타입/결과/좌표만으로 수 밀리초 안에 해설 문장 생성
+(즉시 초안 해설 및 LLM 실패 시 fallback 용도)
+
+Version: 1.0
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+from ..models.records import ActionRecord, MatchRecord, to_actions, to_match
+from .spatial_features import LONG_DISTANCE, OPPONENT_BOX, OWN_BOX, compute_features
+
+STYLES = ("CASTER", "ANALYST", "FRIEND")
+
+
+# =============================================================================
+# 템플릿 (타입 -> 결과 -> (CASTER, ANALYST, FRIEND))
+# 사용 가능한 치환자: {who}, {who_ga}, {zone}, {target_ro}, {dir}, {action}, {action_eul}, {opponent}, {opponent_ga}
+# 문장 끝 "!"는 tone이 CALM이면 마침표로 바뀜 (TONE_ENDINGS)
+# =============================================================================
+
+TEMPLATES: Dict[str, Dict[str, Tuple[str, str, str]]] = {
+    "pass": {
+        "success": (
+            "{who_ga} {zone}에서 {dir} 패스합니다!",
+            "{who_ga} {zone}에서 {dir} 패스를 연결합니다.",
+            "{who_ga} {zone}에서 {dir} 패스했어!"
+        ),
+        "fail": (
+            "{who}의 패스가 끊깁니다!",
+            "{who_ga} {zone}에서 시도한 패스가 상대에게 막힙니다.",
+            "{who} 패스가 끊겼어!"
+        ),
+    },
+    "received": {
+        "default": (
+            "{who_ga} {zone}에서 공을 받습니다!",
+            "{who_ga} {zone}에서 패스를 받아 냅니다.",
+            "{who_ga} {zone}에서 공 받았어!"
+        ),
+    },
+    "cross": {
+        "success": (
+            "{who}, {zone}에서 크로스! {target_ro} 날아갑니다!",
+            "{who_ga} {zone}에서 {target_ro} 크로스를 올립니다.",
+            "{who_ga} {zone}에서 크로스 올렸어!"
+        ),
+        "fail": (
+            "{who}의 크로스, 수비에 걸립니다!",
+            "{who_ga} 올린 크로스가 수비에 차단됩니다.",
+            "{who} 크로스가 막혔어!"
+        ),
+    },
+    "carry": {
+        "default": (
+            "{who_ga} {zone}에서 {dir} 공을 몰고 갑니다!",
+            "{who_ga} {zone}에서 {dir} 볼을 운반합니다.",
+            "{who_ga} {dir} 공 몰고 가!"
+        ),
+    },
+    "dribble": {
+        "success": (
+            "{who}, {zone}에서 드리블 돌파! 수비를 제칩니다!",
+            "{who_ga} {zone}에서 드리블로 수비를 벗겨 냅니다.",
+            "{who}, 드리블로 수비 제쳤어!"
+        ),
+        "fail": (
+            "{who}의 드리블, 수비에 막힙니다!",
+            "{who_ga} 드리블을 시도했지만 수비에 막힙니다.",
+            "{who} 드리블이 막혔어!"
+        ),
+    },
+    "shot": {
+        "goal": (
+            "골! {who_ga} {zone}에서 골망을 흔듭니다!",
+            "{who_ga} {zone}에서 슈팅해 골로 연결합니다.",
+            "골이야! {who_ga} 넣었어!"
+        ),
+        "on_target": (
+            "{who}, {zone}에서 슈팅! 골문으로 향합니다!",
+            "{who_ga} {zone}에서 유효 슈팅을 기록합니다.",
+            "{who} 슈팅! 골대로 간다!"
+        ),
+        "fail": (
+            "{who}의 슈팅! 아쉽게 빗나갑니다!",
+            "{who_ga} {zone}에서 슈팅했지만 골로 이어지지 않습니다.",
+            "{who} 슈팅, 아깝다!"
+        ),
+    },
+    "tackle": {
+        "success": (
+            "{who_ga} {zone}에서 태클로 공을 빼앗습니다!",
+            "{who_ga} {zone}에서 정확한 태클로 소유권을 가져옵니다.",
+            "{who_ga} 태클로 공 뺏었어!"
+        ),
+        "fail": (
+            "{who}의 태클, 통하지 않습니다!",
+            "{who_ga} 태클을 시도했지만 공을 따내지 못합니다.",
+            "{who} 태클 실패야!"
+        ),
+    },
+    "interception": {
+        "default": (
+            "{who_ga} {zone}에서 패스를 가로챕니다!",
+            "{who_ga} {zone}에서 패스 길을 읽고 차단합니다.",
+            "{who_ga} 패스 끊었어!"
+        ),
+    },
+    "clearance": {
+        "default": (
+            "{who_ga} {zone}에서 걷어 냅니다!",
+            "{who_ga} {zone}에서 위험한 공을 걷어 냅니다.",
+            "{who_ga} 공 걷어 냈어!"
+        ),
+    },
+    "block": {
+        "default": (
+            "{who_ga} 몸으로 막아 냅니다!",
+            "{who_ga} {zone}에서 몸을 던져 막아 냅니다.",
+            "{who_ga} 몸으로 막았어!"
+        ),
+    },
+    "recovery": {
+        "default": (
+            "{who_ga} {zone}에서 공을 따냅니다!",
+            "{who_ga} {zone}에서 흘러나온 공을 확보합니다.",
+            "{who_ga} 공 따냈어!"
+        ),
+    },
+    "duel": {
+        "success": (
+            "{who_ga} {zone}에서 경합을 이겨 냅니다!",
+            "{who_ga} {zone}에서 볼 경합에서 우위를 점합니다.",
+            "{who_ga} 몸싸움 이겼어!"
+        ),
+        "fail": (
+            "{who}, 경합에서 밀립니다!",
+            "{who_ga} 볼 경합에서 밀립니다.",
+            "{who} 경합에서 밀렸어!"
+        ),
+    },
+    "foul": {
+        "default": (
+            "{who}의 파울! 경기가 멈춥니다!",
+            "{who_ga} {zone}에서 파울을 범합니다.",
+            "{who} 파울했어!"
+        ),
+    },
+    "throwin": {
+        "default": (
+            "{who_ga} {zone}에서 스로인합니다!",
+            "{who_ga} {zone}에서 스로인으로 경기를 재개합니다.",
+            "{who_ga} 스로인 던져!"
+        ),
+    },
+    "goalkick": {
+        "default": (
+            "{who_ga} 골킥을 찹니다!",
+            "{who_ga} 골킥으로 경기를 재개합니다.",
+            "{who_ga} 골킥 찬다!"
+        ),
+    },
+    "corner": {
+        "default": (
+            "{who_ga} 코너킥을 올립니다!",
+            "{who_ga} 코너킥으로 공격을 이어 갑니다.",
+            "{who_ga} 코너킥 찬다!"
+        ),
+    },
+    "freekick": {
+        "default": (
+            "{who_ga} {zone}에서 프리킥을 찹니다!",
+            "{who_ga} {zone}에서 프리킥으로 경기를 재개합니다.",
+            "{who_ga} 프리킥 찬다!"
+        ),
+    },
+    "keeper": {
+        "default": (
+            "{who_ga} 공을 잡아 냅니다! 골키퍼 선방!",
+            "골키퍼 {who_ga} 안정적으로 공을 처리합니다.",
+            "{who_ga} 공 잡았어!"
+        ),
+    },
+    "offside": {
+        "default": (
+            "{who}, 오프사이드입니다!",
+            "{who_ga} 오프사이드 위치에 있었습니다.",
+            "{who} 오프사이드야!"
+        ),
+    },
+    "generic": {
+        "default": (
+            "{who_ga} {zone}에서 {action_eul} 시도합니다!",
+            "{who_ga} {zone}에서 {action_eul} 시도합니다.",
+            "{who_ga} {zone}에서 {action} 했어!"
+        ),
+    },
+}
+
+# 자책골 (액션 타입과 관계없이 상대 팀 득점으로 처리, {opponent_ga}: 득점한 상대 팀)
+OWN_GOAL_TEMPLATES = (
+    "{who}의 자책골! {opponent_ga} 득점합니다!",
+    "{who_ga} 자책골을 기록하며 {opponent_ga} 득점합니다.",
+    "{who} 자책골이야! {opponent} 골이야!"
+)
+
+# 상대 팀 이름을 알 수 없을 때
+OPPONENT_FALLBACK = "상대 팀"
+
+# tone별 문장 끝 문장부호 (템플릿의 "!"를 대체, 없으면 템플릿 그대로)
+TONE_ENDINGS = {
+    "CALM": ".",
+}
+
+# 선수 정보가 없을 때
+NO_PLAYER_TEXT = (
+    "경기가 계속 진행됩니다!",
+    "경기가 이어지고 있습니다.",
+    "경기 계속 진행 중이야!"
+)
+
+# type_name 키워드 -> 템플릿 키 (위에서부터 우선 매칭)
+TYPE_KEYWORDS: List[Tuple[str, str]] = [
+    ("received", "received"),
+    ("cross", "cross"),
+    ("corner", "corner"),
+    ("free kick", "freekick"),
+    ("freekick", "freekick"),
+    ("throw", "throwin"),
+    ("goal kick", "goalkick"),
+    ("penalty", "shot"),
+    ("shot", "shot"),
+    ("pass", "pass"),
+    ("carry", "carry"),
+    ("dribble", "dribble"),
+    ("take-on", "dribble"),
+    ("tackle", "tackle"),
+    ("interception", "interception"),
+    ("clearance", "clearance"),
+    ("block", "block"),
+    ("recovery", "recovery"),
+    ("duel", "duel"),
+    ("foul", "foul"),
+    ("catch", "keeper"),
+    ("parry", "keeper"),
+    ("save", "keeper"),
+    ("keeper", "keeper"),
+    ("offside", "offside"),
+]
+
+
+# =============================================================================
+# 한국어 조사 처리
+# =============================================================================
+
+def _has_final_consonant(word: str) -> Optional[int]:
+    """마지막 글자의 종성 인덱스 (한글이 아니면 None, 받침 없으면 0)"""
+    if not word:
+        return None
+    last = word[-1]
+    if "가" <= last <= "힣":
+        return (ord(last) - ord("가")) % 28
+    return None
+
+
+def _josa(word: str, with_final: str, without_final: str) -> str:
+    """받침 유무에 따라 조사 선택 (예: 이/가, 을/를)"""
+    final = _has_final_consonant(word)
+    if final is None:
+        return word + without_final
+    return word + (with_final if final else without_final)
+
+
+def _josa_ro(word: str) -> str:
+    """으로/로 조사 (ㄹ 받침은 '로')"""
+    final = _has_final_consonant(word)
+    if final is None or final == 0 or final == 8:
+        return word + "로"
+    return word + "으로"
+
+
+# =============================================================================
+# 위치 / 방향 표현 (spatial_features 코드 -> 문장 표현)
+# =============================================================================
+
+THIRD_PHRASES = {"D": "자기 진영", "M": "중원", "A": "상대 진영"}
+CHANNEL_PHRASES = {"L": "왼쪽 측면", "C": "중앙", "R": "오른쪽 측면"}
+BOX_PHRASES = {OPPONENT_BOX: "상대 페널티 박스 안", OWN_BOX: "자기 페널티 박스 안"}
+DIRECTION_PHRASES = {
+    "F": "전방으로",
+    "B": "뒤쪽으로",
+    "L": "왼쪽으로",
+    "R": "오른쪽으로",
+    "S": "짧게",
+}
+
+
+def zone_phrase(zone_code: str) -> str:
+    """
+    구역 코드 -> 구역 표현
+
+    예: "PB" -> "상대 페널티 박스 안", "AL" -> "상대 진영 왼쪽 측면", "MC" -> "중원"
+    """
+    if zone_code in BOX_PHRASES:
+        return BOX_PHRASES[zone_code]
+    third = THIRD_PHRASES[zone_code[0]]
+    if zone_code[1] == "C":
+        return third if zone_code[0] == "M" else f"{third} 중앙"
+    return f"{third} {CHANNEL_PHRASES[zone_code[1]]}"
+
+
+def direction_phrase(direction_code: str, distance: float) -> str:
+    """
+    방향 코드 -> 방향 표현
+
+    예: "전방으로 길게", "뒤쪽으로", "짧게"
+    """
+    phrase = DIRECTION_PHRASES[direction_code]
+    if direction_code != "S" and distance >= LONG_DISTANCE:
+        phrase += " 길게"
+    return phrase
+
+
+# =============================================================================
+# 액션 분류 / 톤
+# =============================================================================
+
+def classify_type(type_name: str) -> str:
+    """type_name -> 템플릿 키"""
+    lowered = (type_name or "").lower()
+    for keyword, key in TYPE_KEYWORDS:
+        if keyword in lowered:
+            return key
+    return "generic"
+
+
+def classify_result(result_name: str) -> str:
+    """result_name -> 결과 키 (success / fail / goal / own_goal / on_target)"""
+    lowered = (result_name or "").lower()
+    if not lowered:
+        return "success"
+    if "goal" in lowered:
+        return "own_goal" if "own" in lowered else "goal"
+    if "on target" in lowered or "saved" in lowered:
+        return "on_target"
+    if lowered.startswith("un") or any(k in lowered for k in ("off target", "blocked", "miss", "fail", "out")):
+        return "fail"
+    return "success"
+
+
+def choose_tone(type_key: str, result_key: str, attacking_third: bool) -> str:
+    """액션 타입/결과 -> tone (system_prompts의 tone 사용 규칙 기준)"""
+    if result_key == "own_goal":
+        # 실책 + 실점 (상대 팀 득점)
+        return "SAD"
+    if type_key == "shot":
+        if result_key in ("goal", "on_target"):
+            return "EXCITED"
+        return "SAD"
+    if type_key in ("foul", "offside"):
+        return "ANGRY"
+    if result_key == "fail" and attacking_third:
+        return "SAD"
+    if type_key in ("cross", "dribble") and result_key == "success" and attacking_third:
+        return "EMPHASIS"
+    if type_key in ("pass", "received", "carry") and not attacking_third:
+        return "CALM"
+    return "DEFAULT"
+
+
+# =============================================================================
+# 해설 생성
+# =============================================================================
+
+def _opponent(team: str, match: MatchRecord) -> str:
+    """행동 팀의 상대 팀 이름 (경기 정보로 판별할 수 없으면 "상대 팀")"""
+    home_names = {name for name in (match.home_team_name_ko_short, match.home_team_name_ko) if name}
+    if team and team in home_names:
+        return match.away_team_name_ko_short or match.away_team_name_ko or OPPONENT_FALLBACK
+    if team and team in match.away_names:
+        return match.home_team_name_ko_short or match.home_team_name_ko or OPPONENT_FALLBACK
+    return OPPONENT_FALLBACK
+
+
+def _punctuate(description: str, tone: str) -> str:
+    """tone에 맞게 문장 끝 문장부호 교체 (예: CALM -> 느낌표 대신 마침표)"""
+    ending = TONE_ENDINGS.get(tone)
+    if ending is None or not description.endswith("!"):
+        return description
+    return description.rstrip("!") + ending
+
+
+def _subject(player: str, team: str, style_index: int, mention_team: bool) -> str:
+    """스타일별 주어 표현"""
+    if style_index == 1:  # ANALYST
+        who = f"{player} 선수"
+        return f"{team}의 {who}" if mention_team and team else who
+    if mention_team and team:
+        return f"{team} {player}"
+    return player
+
+
+def generate_rule_scripts(
+    raw_data: List[Union[dict, ActionRecord]],
+    match_info: Union[dict, MatchRecord, None] = None,
+    style: str = "CASTER"
+) -> List[dict]:
+    """
+    규칙 기반 해설 스크립트 생성
+
+    Args:
+        raw_data: 액션 데이터 리스트 (dict 또는 ActionRecord)
+        match_info: 경기 메타데이터 (홈/원정 공격 방향 판별용)
+        style: 해설 스타일 ("CASTER", "ANALYST", "FRIEND")
+
+    Returns:
+        해설 스크립트 배열 (입력 액션 수와 동일)
+    """
+    actions = to_actions(raw_data)
+    match = to_match(match_info)
+    style_index = STYLES.index(style) if style in STYLES else 0
+
+    # 윈도우 전체 위치 특성 (벡터화 계산)
+    features = compute_features(actions, match)
+
+    scripts = []
+    previous_team = None
+
+    for index, action in enumerate(actions):
+        action_id = action.action_id
+        time_seconds = action.time_seconds
+        player = action.player_name_ko
+        team = action.team_name_ko_short
+        type_name = action.type_name
+        type_name_ko = action.type_name_ko or type_name
+        result_name = action.result_name
+
+        if not player or not type_name:
+            scripts.append({
+                "actionId": action_id,
+                "timeSeconds": time_seconds,
+                "tone": "DEFAULT",
+                "description": NO_PLAYER_TEXT[style_index]
+            })
+            continue
+
+        has_start = bool(features.has_start[index])
+        has_move = has_start and bool(features.has_end[index])
+
+        zone = zone_phrase(features.start_zone[index]) if has_start else "그라운드"
+        target = zone_phrase(features.end_zone[index]) if has_move else "앞쪽"
+        direction = (
+            direction_phrase(features.direction[index], features.distance[index])
+            if has_move else "앞으로"
+        )
+        attacking_third = bool(features.attacking_third[index])
+
+        # 팀이 바뀌는 순간(첫 액션 포함)에만 팀명 언급
+        mention_team = team != previous_team
+        previous_team = team
+        who = _subject(player, team, style_index, mention_team)
+
+        type_key = classify_type(type_name)
+        result_key = classify_result(result_name)
+        if result_key == "own_goal":
+            templates = OWN_GOAL_TEMPLATES
+        else:
+            type_templates = TEMPLATES[type_key]
+            templates = (
+                type_templates.get(result_key)
+                or (type_templates.get("success") if result_key in ("goal", "on_target") else None)
+                or type_templates.get("default")
+                or next(iter(type_templates.values()))
+            )
+
+        opponent = _opponent(team, match)
+        description = templates[style_index].format(
+            who=who,
+            who_ga=_josa(who, "이", "가"),
+            zone=zone,
+            target_ro=_josa_ro(target),
+            dir=direction,
+            action=type_name_ko,
+            action_eul=_josa(type_name_ko, "을", "를"),
+            opponent=opponent,
+            opponent_ga=_josa(opponent, "이", "가")
+        )
+        tone = choose_tone(type_key, result_key, attacking_third)
+
+        scripts.append({
+            "actionId": action_id,
+            "timeSeconds": time_seconds,
+            "tone": tone,
+            "description": _punctuate(description, tone)
+        })
+
+    return scripts
@@ -0,0 +1,431 @@
+"""
+RunPod 비동기 작업 모드 (/run 제출 + /status 일괄 폴링 / RunPod 웹훅 수신)
+최대 300초 동안 HTTP 연결을 유지하는 대신 RunPod 작업 ID만 받아 두고 결과를 나중에 수집
+
+- 폴러 태스크 1개가 진행 중인 모든 원격 작업의 /status를 주기적으로 조회
+- RUNPOD_WEBHOOK_URL 설정 시 RunPod가 완료 결과를 웹훅으로 전송 (폴링은 누락 대비용)
+- 제출한 원격 작업은 저널 파일에 기록 -> 워커 재시작 후 결과 수집 재개
+  (멀티 워커는 저널 파일 하나를 파일 잠금으로 공유, 재개는 Job ID의 샤드가 같은 워커만)
+
+Version: 1.0
+"""
+
+import os
+import json
+import time
+import asyncio
+import tempfile
+import threading
+from contextlib import contextmanager, suppress
+from typing import Callable, Dict, Iterator, List, Optional
+
+import httpx
+
+from .endpoint_pool import Endpoint
+from .latency_model import get_latency_model
+from .metrics import get_metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows (로컬 개발, 단일 워커)
+    fcntl = None
+
+# RunPod 호출 방식: sync (OpenAI 호환 엔드포인트에 연결 유지) / async (/run 제출 후 결과 수집)
+RUNPOD_CALL_MODE = os.getenv("RUNPOD_CALL_MODE", "sync")
+# /status 폴링 주기 (초)
+RUNPOD_STATUS_POLL_INTERVAL = float(os.getenv("RUNPOD_STATUS_POLL_INTERVAL", "2"))
+# RunPod가 완료 결과를 보낼 이 서비스의 웹훅 URL (예: https://.../ai/commentary/runpod/webhook?token=...)
+RUNPOD_WEBHOOK_URL = os.getenv("RUNPOD_WEBHOOK_URL", "")
+# 웹훅 수신 시 확인할 토큰 (token 쿼리 파라미터, 빈 문자열이면 웹훅 비활성화 - 수신 거부 / 폴링만 사용)
+RUNPOD_WEBHOOK_TOKEN = os.getenv("RUNPOD_WEBHOOK_TOKEN", "")
+# 진행 중인 원격 작업 저널 (빈 문자열이면 재시작 복구 비활성화)
+RUNPOD_ASYNC_JOURNAL_PATH = os.getenv("RUNPOD_ASYNC_JOURNAL_PATH", "data/runpod_async_jobs.jsonl")
+
+# 제출 / 상태 조회 요청 타임아웃 (초, 짧은 요청)
+RUNPOD_ASYNC_REQUEST_TIMEOUT = 15.0
+
+# RunPod 작업 상태
+TERMINAL_FAILURE_STATUSES = ("FAILED", "CANCELLED", "TIMED_OUT")
+
+
+def native_base_url(url: str) -> str:
+    """
+    엔드포인트 URL -> RunPod 네이티브 API 기본 URL
+
+    https://api.runpod.ai/v2/<id>/openai/v1/chat/completions -> https://api.runpod.ai/v2/<id>
+    """
+    index = url.find("/openai/")
+    if index >= 0:
+        return url[:index]
+    url = url.rstrip("/")
+    for suffix in ("/runsync", "/run"):
+        if url.endswith(suffix):
+            return url[:-len(suffix)]
+    return url
+
+
+def unwrap_output(output):
+    """
+    /status 응답의 output -> OpenAI Chat Completion 응답
+
+    vLLM 워커는 OpenAI 응답을 리스트로 감싸서 반환하기도 함 ([{...}])
+    """
+    if isinstance(output, list) and len(output) == 1 and isinstance(output[0], dict):
+        return output[0]
+    return output
+
+
+class RemoteJob:
+    """결과 대기 중인 RunPod 원격 작업"""
+
+    def __init__(self, remote_id: str, endpoint: Endpoint):
+        self.remote_id = remote_id
+        self.endpoint = endpoint
+        self.started_at = time.monotonic()
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class AsyncJobJournal:
+    """
+    제출한 원격 작업 저널 (JSON Lines, append-only)
+
+    {"event": "submitted", "jobId", "remoteJobId", "endpoint", "request"}
+    {"event": "finished", "jobId"}
+
+    gunicorn 워커들이 같은 파일을 쓰므로 추가 / 정리는 path + ".lock" 파일 잠금(fcntl) 안에서 수행
+    (정리 중 다른 워커의 추가 기록 유실 방지)
+    """
+
+    def __init__(self, path: str = RUNPOD_ASYNC_JOURNAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """프로세스 내 잠금 + 워커 간 파일 잠금"""
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if fcntl is None:
+                yield
+                return
+            with open(self.path + ".lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _append(self, record: dict) -> None:
+        with self._locked():
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def load_unfinished(self, owns: Optional[Callable[[str], bool]] = None) -> List[dict]:
+        """
+        완료 기록이 없는 제출 기록 조회 (파일은 모든 워커의 미완료 기록만 남기고 다시 작성)
+
+        Args:
+            owns: Job ID -> 이 워커가 재개할 작업인지 (None이면 전체)
+
+        Returns:
+            submitted 기록 리스트 (제출 순서)
+        """
+        if not self.enabled or not os.path.isfile(self.path):
+            return []
+
+        with self._locked():
+            submitted: Dict[str, dict] = {}
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # 쓰기 도중 종료된 마지막 행
+                    job_id = record.get("jobId")
+                    if record.get("event") == "submitted" and job_id:
+                        submitted[job_id] = record
+                    elif record.get("event") == "finished":
+                        submitted.pop(job_id, None)
+
+            entries = list(submitted.values())
+            # 임시 파일 이름은 워커마다 다르게 (동시 시작 시 같은 임시 파일을 쓰지 않도록)
+            fd, temp_path = tempfile.mkstemp(
+                prefix=os.path.basename(self.path) + ".", suffix=".tmp",
+                dir=os.path.dirname(self.path) or "."
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    for record in entries:
+                        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                os.replace(temp_path, self.path)
+            except BaseException:
+                with suppress(FileNotFoundError):
+                    os.unlink(temp_path)
+                raise
+
+        if owns is None:
+            return entries
+        return [record for record in entries if owns(record["jobId"])]
+
+    async def record_submitted(
+        self,
+        job_id: str,
+        remote_id: str,
+        endpoint_name: str,
+        request: Optional[dict]
+    ) -> None:
+        """원격 작업 제출 기록 (원본 요청이 없으면 복구할 수 없으므로 생략, 실패해도 작업에는 영향 없음)"""
+        if not self.enabled or not job_id or request is None:
+            return
+        record = {
+            "event": "submitted",
+            "jobId": job_id,
+            "remoteJobId": remote_id,
+            "endpoint": endpoint_name,
+            "request": request
+        }
+        try:
+            await asyncio.to_thread(self._append, record)
+        except Exception as e:
+            print(f"[RUNPOD-ASYNC] 저널 기록 실패 ({job_id}): {e}")
+
+    async def record_finished(self, job_id: str) -> None:
+        """원격 작업 결과 처리 완료 기록"""
+        if not self.enabled or not job_id:
+            return
+        try:
+            await asyncio.to_thread(self._append, {"event": "finished", "jobId": job_id})
+        except Exception as e:
+            print(f"[RUNPOD-ASYNC] 저널 기록 실패 ({job_id}): {e}")
+
+
+class RunPodAsyncPoller:
+    """
+    RunPod 원격 작업 결과 수집기
+
+    Usage:
+        remote_id = await poller.submit(client, endpoint, payload)
+        result = await poller.wait(endpoint, remote_id, timeout=300)
+    """
+
+    def __init__(
+        self,
+        interval: float = RUNPOD_STATUS_POLL_INTERVAL,
+        webhook_url: str = RUNPOD_WEBHOOK_URL,
+        webhook_token: str = RUNPOD_WEBHOOK_TOKEN,
+        journal: Optional[AsyncJobJournal] = None
+    ):
+        self.interval = max(0.1, interval)
+        if webhook_url and not webhook_token:
+            print("[RUNPOD-ASYNC] RUNPOD_WEBHOOK_TOKEN 미설정 - 웹훅 비활성화 (폴링으로 결과 수집)")
+            webhook_url = ""
+        self.webhook_url = webhook_url
+        self.journal = journal or AsyncJobJournal()
+        self._pending: Dict[str, RemoteJob] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._polls = 0
+        self._webhook_deliveries = 0
+
+    @staticmethod
+    def _headers(endpoint: Endpoint) -> dict:
+        return {
+            "Authorization": f"Bearer {endpoint.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    async def submit(self, client: httpx.AsyncClient, endpoint: Endpoint, payload: dict) -> str:
+        """
+        /run 제출 (OpenAI 호환 요청을 vLLM 워커 openai_route 입력으로 전달)
+
+        Args:
+            client: HTTP 클라이언트
+            endpoint: RunPod 엔드포인트
+            payload: OpenAI Chat Completion 요청
+
+        Returns:
+            RunPod 작업 ID
+
+        Raises:
+            Exception: 제출 실패 시
+        """
+        body = {
+            "input": {
+                "openai_route": "/v1/chat/completions",
+                "openai_input": payload
+            }
+        }
+        if self.webhook_url:
+            body["webhook"] = self.webhook_url
+
+        response = await client.post(
+            f"{native_base_url(endpoint.url)}/run",
+            json=body,
+            headers=self._headers(endpoint)
+        )
+        if response.status_code != 200:
+            raise Exception(f"RunPod API error: {response.status_code} - {response.text}")
+
+        remote_id = response.json().get("id")
+        if not remote_id:
+            raise Exception(f"RunPod /run 응답에 작업 ID가 없습니다: {response.text}")
+
+        get_metrics().incr("runpod_async_submitted_total", endpoint=endpoint.name)
+        return remote_id
+
+    def track(self, endpoint: Endpoint, remote_id: str) -> RemoteJob:
+        """결과 수집 대상 등록 (제출 직후 호출 - 웹훅이 wait()보다 먼저 도착해도 반영)"""
+        remote = self._pending.get(remote_id)
+        if remote is None:
+            remote = RemoteJob(remote_id, endpoint)
+            self._pending[remote_id] = remote
+        self._ensure_polling()
+        return remote
+
+    async def wait(self, endpoint: Endpoint, remote_id: str, timeout: float) -> dict:
+        """
+        원격 작업 결과 대기 (폴러 또는 웹훅이 결과 전달)
+
+        Args:
+            endpoint: 작업을 제출한 엔드포인트
+            remote_id: RunPod 작업 ID
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            OpenAI 형식 응답
+
+        Raises:
+            TimeoutError: 시간 초과 (원격 작업 취소 요청)
+            Exception: 원격 작업 실패
+        """
+        remote = self.track(endpoint, remote_id)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(remote.future), timeout=timeout)
+        except asyncio.TimeoutError:
+            get_metrics().incr("runpod_async_timeouts_total", endpoint=endpoint.name)
+            await self.cancel_remote(endpoint, remote_id)
+            raise TimeoutError(f"RunPod async job {remote_id} timeout ({timeout:.0f}s)")
+        finally:
+            self._pending.pop(remote_id, None)
+
+    def deliver(self, status: dict) -> bool:
+        """
+        /status 응답 또는 RunPod 웹훅 본문 반영
+
+        Args:
+            status: {"id", "status", "output", "error", "delayTime", "executionTime"}
+
+        Returns:
+            대기 중인 작업이 완료(성공/실패) 처리되었는지 여부
+        """
+        remote = self._pending.get(str(status.get("id", "")))
+        if remote is None or remote.future.done():
+            return False
+
+        state = status.get("status", "")
+        metrics = get_metrics()
+        if state == "COMPLETED":
+            if status.get("delayTime") is not None:
+                metrics.observe(
+                    "runpod_async_queue_seconds", status["delayTime"] / 1000, endpoint=remote.endpoint.name
+                )
+                get_latency_model().observe(remote.endpoint.name, status["delayTime"] / 1000, phase="queue")
+            if status.get("executionTime") is not None:
+                get_latency_model().observe(remote.endpoint.name, status["executionTime"] / 1000, phase="execution")
+            remote.future.set_result(unwrap_output(status.get("output")))
+            return True
+
+        if state in TERMINAL_FAILURE_STATUSES:
+            metrics.incr("runpod_async_failed_total", endpoint=remote.endpoint.name, status=state)
+            remote.future.set_exception(
+                Exception(f"RunPod job {remote.remote_id} {state}: {status.get('error', '')}")
+            )
+            return True
+
+        return False  # IN_QUEUE / IN_PROGRESS
+
+    def deliver_webhook(self, status: dict) -> bool:
+        """RunPod 웹훅 본문 반영"""
+        delivered = self.deliver(status)
+        if delivered:
+            self._webhook_deliveries += 1
+            get_metrics().incr("runpod_async_webhook_total")
+        return delivered
+
+    def _ensure_polling(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """대기 중인 원격 작업이 있는 동안 /status 일괄 조회"""
+        async with httpx.AsyncClient(timeout=RUNPOD_ASYNC_REQUEST_TIMEOUT) as client:
+            while self._pending:
+                await asyncio.sleep(self.interval)
+                remotes = [r for r in self._pending.values() if not r.future.done()]
+                if not remotes:
+                    continue
+                self._polls += 1
+                get_metrics().set_gauge("runpod_async_pending", len(remotes))
+                await asyncio.gather(*(self._poll(client, remote) for remote in remotes))
+        get_metrics().set_gauge("runpod_async_pending", 0)
+
+    async def _poll(self, client: httpx.AsyncClient, remote: RemoteJob) -> None:
+        """원격 작업 1건 상태 조회 (실패 시 다음 주기에 재시도)"""
+        try:
+            response = await client.get(
+                f"{native_base_url(remote.endpoint.url)}/status/{remote.remote_id}",
+                headers=self._headers(remote.endpoint)
+            )
+            if response.status_code != 200:
+                raise Exception(f"{response.status_code} - {response.text}")
+            self.deliver(response.json())
+        except Exception as e:
+            get_metrics().incr("runpod_async_poll_errors_total", endpoint=remote.endpoint.name)
+            print(f"[RUNPOD-ASYNC] 상태 조회 실패 ({remote.remote_id}): {e}")
+
+    async def cancel_remote(self, endpoint: Endpoint, remote_id: str) -> None:
+        """원격 작업 취소 요청 (best effort)"""
+        try:
+            async with httpx.AsyncClient(timeout=RUNPOD_ASYNC_REQUEST_TIMEOUT) as client:
+                await client.post(
+                    f"{native_base_url(endpoint.url)}/cancel/{remote_id}",
+                    headers=self._headers(endpoint)
+                )
+        except Exception as e:
+            print(f"[RUNPOD-ASYNC] 원격 작업 취소 실패 ({remote_id}): {e}")
+
+    def snapshot(self) -> dict:
+        """상태 요약"""
+        return {
+            "mode": RUNPOD_CALL_MODE,
+            "pending": [
+                {
+                    "remoteJobId": remote.remote_id,
+                    "endpoint": remote.endpoint.name,
+                    "waitingSeconds": round(time.monotonic() - remote.started_at, 1)
+                }
+                for remote in self._pending.values()
+            ],
+            "pollInterval": self.interval,
+            "polls": self._polls,
+            "webhookEnabled": bool(self.webhook_url),
+            "webhookDeliveries": self._webhook_deliveries
+        }
+
+
+# 싱글톤 인스턴스
+_async_poller: Optional[RunPodAsyncPoller] = None
+
+
+def get_async_poller() -> RunPodAsyncPoller:
+    """RunPodAsyncPoller 인스턴스 반환"""
+    global _async_poller
+    if _async_poller is None:
+        _async_poller = RunPodAsyncPoller()
+    return _async_poller
@@ -7,19 +7,75 @@ Version: 1.0
 
 import os
 import json
+import time
+import random
+import asyncio
 import httpx
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 from io import StringIO
 
-# 상위 디렉토리의 system_prompts 임포트
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from system_prompts import get_system_prompt
+from ..models.records import ActionRecord, MatchRecord, to_actions, to_match
+from ..models.schemas import ToneEnum
+from ..system_prompts import get_system_prompt
+
+from .action_cache import ACTION_CACHE_CONTEXT_ROWS, action_id_of, get_action_cache
+from .capture_sink import get_capture_sink
+from .loop_monitor import cpu_section
+from .circuit_breaker import CircuitBreaker
+from .endpoint_pool import Endpoint, EndpointPool, load_endpoints
+from .latency_model import LATENCY_TIMEOUT_MIN, get_latency_model
+from .metrics import get_metrics
+from .runpod_async import RUNPOD_ASYNC_REQUEST_TIMEOUT, RUNPOD_CALL_MODE, get_async_poller
+from .usage_tracker import extract_usage, get_usage_tracker
 
 # 환경 변수에서 RunPod 설정 로드
 RUNPOD_API_KEY = os.getenv("RUNPOD_API_KEY", "")
 RUNPOD_ENDPOINT_URL = os.getenv("RUNPOD_ENDPOINT_URL", "")
 
+# 엔드포인트 풀 (선택 사항, 설정 시 RUNPOD_ENDPOINT_URL 대신 사용)
+# JSON 배열 [{"name", "url", "apiKey"}] 또는 쉼표로 구분된 URL 목록
+RUNPOD_ENDPOINTS = os.getenv("RUNPOD_ENDPOINTS", "")
+RUNPOD_LB_POLICY = os.getenv("RUNPOD_LB_POLICY", "least_outstanding")
+
+# 프롬프트 좌표 표현 방식
+# - raw: 원시 좌표 (start_x ~ dy, 소수점 2자리)
+# - features: 행동 팀 기준 위치 코드 (zone, end_zone, prog, dir)
+PROMPT_COORD_MODE = os.getenv("PROMPT_COORD_MODE", "raw")
+
+# 액션 CSV 형식
+# - full: 매 행에 선수/팀/포지션 전체 기재
+# - compact: 윈도우별 선수/팀 코드표 + 행에는 코드만 기재
+PROMPT_CSV_FORMAT = os.getenv("PROMPT_CSV_FORMAT", "full")
+# main_position이 position_name과 같으면 생략
+PROMPT_DROP_DUPLICATE_MAIN_POSITION = os.getenv("PROMPT_DROP_DUPLICATE_MAIN_POSITION", "false").lower() == "true"
+# A/B 비교: 0보다 크면 요청의 해당 비율만 compact, 나머지는 full 형식 사용
+PROMPT_AB_COMPACT_RATIO = float(os.getenv("PROMPT_AB_COMPACT_RATIO", "0"))
+
+# 좌표 관련 컬럼 (소수점 2자리로 반올림하여 토큰 절약)
+COORDINATE_COLUMNS = ["start_x", "start_y", "end_x", "end_y", "dx", "dy"]
+
+# 서킷 브레이커 설정 (연속 실패 횟수 / 지연 SLO(초) / OPEN 유지 시간(초))
+RUNPOD_BREAKER_FAILURE_THRESHOLD = int(os.getenv("RUNPOD_BREAKER_FAILURE_THRESHOLD", "3"))
+RUNPOD_BREAKER_LATENCY_SLO = float(os.getenv("RUNPOD_BREAKER_LATENCY_SLO", "60"))
+RUNPOD_BREAKER_RESET_SECONDS = float(os.getenv("RUNPOD_BREAKER_RESET_SECONDS", "30"))
+
+# 헤징 설정 (지연 백분위 이후 중복 요청 전송)
+RUNPOD_HEDGE_ENABLED = os.getenv("RUNPOD_HEDGE_ENABLED", "false").lower() == "true"
+RUNPOD_HEDGE_PERCENTILE = float(os.getenv("RUNPOD_HEDGE_PERCENTILE", "95"))
+RUNPOD_HEDGE_MIN_DELAY = float(os.getenv("RUNPOD_HEDGE_MIN_DELAY", "2"))
+RUNPOD_HEDGE_DEFAULT_DELAY = float(os.getenv("RUNPOD_HEDGE_DEFAULT_DELAY", "20"))
+
+# 연결 타임아웃 (초) / 학습한 마감 시간 초과 시 다른 엔드포인트 재시도 횟수 (이후 fallback)
+RUNPOD_CONNECT_TIMEOUT = float(os.getenv("RUNPOD_CONNECT_TIMEOUT", "10"))
+RUNPOD_TIMEOUT_RETRIES = int(os.getenv("RUNPOD_TIMEOUT_RETRIES", "1"))
+
+# LLM 출력 형식
+# - text: 자유 텍스트 (```json 블록 / 대괄호 탐색으로 JSON 배열 추출)
+# - json_schema: response_format={"type": "json_schema"}로 스크립트 배열 스키마 전달 (vLLM 구조화 출력)
+# - guided_json: vLLM 확장 파라미터 guided_json으로 스키마 전달 (response_format 미지원 vLLM 버전용)
+RUNPOD_OUTPUT_MODE = os.getenv("RUNPOD_OUTPUT_MODE", "text")
+TONE_VALUES = tuple(tone.value for tone in ToneEnum)
+
 
 class RunPodService:
     """RunPod Serverless LLM 호출 서비스"""
@@ -27,23 +83,71 @@ class RunPodService:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        endpoint_url: Optional[str] = None
+        endpoint_url: Optional[str] = None,
+        endpoints: Optional[List[Endpoint]] = None
     ):
         self.api_key = api_key or RUNPOD_API_KEY
         self.endpoint_url = endpoint_url or RUNPOD_ENDPOINT_URL
 
-        if not self.api_key:
-            raise ValueError("RUNPOD_API_KEY is required")
-        if not self.endpoint_url:
-            raise ValueError("RUNPOD_ENDPOINT_URL is required")
+        # 명시적인 엔드포인트 인자가 없으면 RUNPOD_ENDPOINTS 설정 사용
+        if endpoints is None and api_key is None and endpoint_url is None:
+            endpoints = load_endpoints(RUNPOD_ENDPOINTS, self.api_key)
+
+        if not endpoints:
+            if not self.api_key:
+                raise ValueError("RUNPOD_API_KEY is required")
+            if not self.endpoint_url:
+                raise ValueError("RUNPOD_ENDPOINT_URL is required")
+            endpoints = [Endpoint("primary", self.endpoint_url, self.api_key)]
+
+        for endpoint in endpoints:
+            if not endpoint.api_key:
+                raise ValueError(f"RUNPOD_API_KEY is required for endpoint {endpoint.name}")
+            endpoint.breaker = CircuitBreaker(
+                failure_threshold=RUNPOD_BREAKER_FAILURE_THRESHOLD,
+                latency_slo=RUNPOD_BREAKER_LATENCY_SLO,
+                reset_timeout=RUNPOD_BREAKER_RESET_SECONDS,
+                name=endpoint.name
+            )
+
+        self.pool = EndpointPool(endpoints, policy=RUNPOD_LB_POLICY)
+        self.endpoint_url = self.endpoint_url or endpoints[0].url
+        self.hedge_enabled = RUNPOD_HEDGE_ENABLED
+        self.call_mode = RUNPOD_CALL_MODE
+        self.output_mode = RUNPOD_OUTPUT_MODE if RUNPOD_OUTPUT_MODE in ("text", "json_schema", "guided_json") else "text"
+
+    @staticmethod
+    def _csv_value(action: ActionRecord, column: str) -> str:
+        """액션 레코드에서 CSV 컬럼 값 추출"""
+        val = getattr(action, column)
+        if val is None:
+            return ""
+
+        # 좌표 컬럼은 소수점 2자리로 반올림
+        if column in COORDINATE_COLUMNS:
+            return str(round(val, 2))
+
+        # CSV 안전 처리 (쉼표, 따옴표 이스케이프)
+        if "," in val or '"' in val or "\n" in val:
+            val = '"' + val.replace('"', '""') + '"'
+        return val
 
-    def _build_raw_data_csv(self, raw_data: List[dict]) -> str:
+    def _build_raw_data_csv(
+        self,
+        raw_data: List[ActionRecord],
+        match_info: Optional[MatchRecord] = None,
+        coord_mode: str = "raw",
+        drop_duplicate_main_position: bool = False
+    ) -> str:
         """
         raw_data를 CSV 형식 문자열로 변환 (토큰 수 절약)
 
         Args:
-            raw_data: 액션 데이터 리스트 (보통 10개)
-                     (Spring Backend의 'id' 필드가 포함되어 있어도 자동으로 무시됨)
+            raw_data: 정규화된 액션 레코드 리스트 (보통 10개)
+                     (Spring Backend의 'id' 필드는 정규화 단계에서 제외됨)
+            match_info: 경기 메타데이터 (features 모드의 홈/원정 판별용)
+            coord_mode: "raw" (원시 좌표) 또는 "features" (위치 코드)
+            drop_duplicate_main_position: main_position이 position_name과 같으면 비워 둠
 
         Returns:
             CSV 형식 문자열
@@ -51,121 +155,160 @@ class RunPodService:
         # CSV 헤더 (포함할 컬럼만)
         # 주의: Spring Backend가 추가하는 'id' 필드(DB PK)는 의도적으로 제외됨
         #      LLM 해설 생성에 불필요한 필드는 토큰 절약을 위해 전송하지 않음
+        if coord_mode == "features":
+            # NumPy 지연 로드 (raw 모드 워커는 임포트하지 않음)
+            from .spatial_features import FEATURE_COLUMNS, compute_features
+            coordinate_block = FEATURE_COLUMNS
+            features = compute_features(raw_data, match_info)
+        else:
+            coordinate_block = COORDINATE_COLUMNS
+            features = None
+
         columns = [
             "action_id", "period_id", "time_seconds", "result_name",
-            "start_x", "start_y", "end_x", "end_y", "dx", "dy",
+            *coordinate_block,
             "type_name", "player_name_ko", "team_name_ko_short",
             "position_name", "main_position"
         ]
 
-        # 필드명 매핑 (camelCase -> snake_case 또는 원본)
-        field_mapping = {
-            "action_id": ["actionId", "action_id"],
-            "period_id": ["periodId", "period_id"],
-            "time_seconds": ["timeSeconds", "time_seconds"],
-            "result_name": ["resultName", "result_name"],
-            "start_x": ["startX", "start_x"],
-            "start_y": ["startY", "start_y"],
-            "end_x": ["endX", "end_x"],
-            "end_y": ["endY", "end_y"],
-            "dx": ["dx"],
-            "dy": ["dy"],
-            "type_name": ["typeName", "type_name"],
-            "player_name_ko": ["playerNameKo", "player_name_ko"],
-            "team_name_ko_short": ["teamNameKoShort", "team_name_ko_short"],
-            "position_name": ["positionName", "position_name"],
-            "main_position": ["mainPosition", "main_position"]
-        }
-
-        def get_value(item: dict, column: str) -> str:
-            """아이템에서 컬럼 값 추출"""
-            # 좌표 관련 컬럼 (소수점 2자리로 반올림하여 토큰 절약)
-            coordinate_columns = {"start_x", "start_y", "end_x", "end_y", "dx", "dy"}
-
-            for key in field_mapping.get(column, [column]):
-                if key in item:
-                    val = item[key]
-                    if val is None:
-                        return ""
-
-                    # 좌표 컬럼은 소수점 2자리로 반올림
-                    if column in coordinate_columns:
-                        try:
-                            val = round(float(val), 2)
-                        except (ValueError, TypeError):
-                            pass  # 변환 실패 시 원본 유지
-
-                    # CSV 안전 처리 (쉼표, 따옴표 이스케이프)
-                    val_str = str(val)
-                    if "," in val_str or '"' in val_str or "\n" in val_str:
-                        val_str = '"' + val_str.replace('"', '""') + '"'
-                    return val_str
-            return ""
-
         # CSV 생성
         lines = [",".join(columns)]  # 헤더
 
-        for item in raw_data:
-            row = [get_value(item, col) for col in columns]
+        for index, item in enumerate(raw_data):
+            feature_row = features.row(index) if features is not None else {}
+            row = [
+                feature_row[col] if col in feature_row else self._csv_value(item, col)
+                for col in columns
+            ]
+            if drop_duplicate_main_position and row[-1] == row[-2]:
+                row[-1] = ""
             lines.append(",".join(row))
 
         return "\n".join(lines)
 
-    def _build_match_info_text(self, match_info: dict) -> str:
+    def _build_compact_csv(
+        self,
+        raw_data: List[ActionRecord],
+        match_info: Optional[MatchRecord] = None,
+        coord_mode: str = "raw",
+        drop_duplicate_main_position: bool = False
+    ) -> str:
+        """
+        코드표 + CSV 형식 (윈도우에 반복되는 선수/팀/포지션을 코드로 치환)
+
+        예:
+            팀: T1=대구, T2=김천
+            선수: P1=이영준(T2,CF), P2=김민덕(T2,CB/CM)
+            action_id,...,type_name,player
+            0,...,Pass,P1
+
+        Args:
+            raw_data: 정규화된 액션 레코드 리스트
+            match_info: 경기 메타데이터 (features 모드의 홈/원정 판별용)
+            coord_mode: "raw" (원시 좌표) 또는 "features" (위치 코드)
+            drop_duplicate_main_position: main_position이 position_name과 같으면 생략
+
+        Returns:
+            코드표와 CSV를 포함한 문자열
+        """
+        if coord_mode == "features":
+            # NumPy 지연 로드 (raw 모드 워커는 임포트하지 않음)
+            from .spatial_features import FEATURE_COLUMNS, compute_features
+            coordinate_block = FEATURE_COLUMNS
+            features = compute_features(raw_data, match_info)
+        else:
+            coordinate_block = COORDINATE_COLUMNS
+            features = None
+
+        columns = [
+            "action_id", "period_id", "time_seconds", "result_name",
+            *coordinate_block,
+            "type_name", "player"
+        ]
+
+        team_codes: dict = {}
+        player_codes: dict = {}
+        player_legend: List[str] = []
+
+        lines = [",".join(columns)]
+        for index, item in enumerate(raw_data):
+            team = self._csv_value(item, "team_name_ko_short")
+            player = self._csv_value(item, "player_name_ko")
+            position = self._csv_value(item, "position_name")
+            main_position = self._csv_value(item, "main_position")
+
+            if team and team not in team_codes:
+                team_codes[team] = f"T{len(team_codes) + 1}"
+
+            player_code = ""
+            if player:
+                key = (player, team, position, main_position)
+                player_code = player_codes.get(key, "")
+                if not player_code:
+                    player_code = player_codes[key] = f"P{len(player_codes) + 1}"
+                    positions = position
+                    if main_position and not (drop_duplicate_main_position and main_position == position):
+                        positions = f"{position}/{main_position}"
+                    details = ",".join(v for v in (team_codes.get(team, ""), positions) if v)
+                    player_legend.append(f"{player_code}={player}({details})")
+
+            feature_row = features.row(index) if features is not None else {}
+            row = [
+                feature_row[col] if col in feature_row else self._csv_value(item, col)
+                for col in columns[:-1]
+            ]
+            row.append(player_code)
+            lines.append(",".join(row))
+
+        legend = [
+            "팀: " + ", ".join(f"{code}={team}" for team, code in team_codes.items()),
+            "선수: " + ", ".join(player_legend),
+            "(player 컬럼은 선수 코드, 괄호 안은 팀 코드와 포지션(현재/주 포지션))"
+        ]
+        return "\n".join(legend) + "\n\n" + "\n".join(lines)
+
+    def choose_csv_format(self) -> str:
+        """이번 요청에 사용할 CSV 형식 (A/B 비율 설정 시 무작위 배정)"""
+        if PROMPT_AB_COMPACT_RATIO > 0:
+            return "compact" if random.random() < PROMPT_AB_COMPACT_RATIO else "full"
+        return PROMPT_CSV_FORMAT
+
+    def _build_match_info_text(self, match_info: MatchRecord) -> str:
         """
         match_info를 간결한 텍스트 형식으로 변환
 
         Args:
-            match_info: 경기 메타데이터
+            match_info: 정규화된 경기 메타데이터
 
         Returns:
             텍스트 형식 문자열
         """
-        # 필드명 매핑
-        field_mapping = {
-            "gameId": ["gameId", "game_id"],
-            "homeTeamNameKo": ["homeTeamNameKo", "home_team_name_ko"],
-            "awayTeamNameKo": ["awayTeamNameKo", "away_team_name_ko"],
-            "homeTeamNameKoShort": ["homeTeamNameKoShort", "home_team_name_ko_short"],
-            "awayTeamNameKoShort": ["awayTeamNameKoShort", "away_team_name_ko_short"],
-            "venue": ["venue"],
-            "gameDate": ["gameDate", "game_date"],
-            "weather": ["weather"],
-            "temperature": ["temperature"],
-            "homeTeamUniform": ["homeTeamUniform", "home_team_uniform"],
-            "awayTeamUniform": ["awayTeamUniform", "away_team_uniform"],
-            "referee": ["referee"],
-            "assistantReferees": ["assistantReferees", "assistant_referees"],
-            "fourthOfficial": ["fourthOfficial", "fourth_official"],
-            "varReferees": ["varReferees", "var_referees"],
-        }
-
-        def get_val(key: str) -> str:
-            for k in field_mapping.get(key, [key]):
-                if k in match_info and match_info[k]:
-                    return str(match_info[k])
-            return "N/A"
+        def get_val(name: str) -> str:
+            return getattr(match_info, name) or "N/A"
 
-        text = f"""경기ID: {get_val("gameId")}
-홈팀: {get_val("homeTeamNameKo")} ({get_val("homeTeamNameKoShort")})
-원정팀: {get_val("awayTeamNameKo")} ({get_val("awayTeamNameKoShort")})
+        text = f"""경기ID: {get_val("game_id")}
+홈팀: {get_val("home_team_name_ko")} ({get_val("home_team_name_ko_short")})
+원정팀: {get_val("away_team_name_ko")} ({get_val("away_team_name_ko_short")})
 경기장: {get_val("venue")}
-날짜: {get_val("gameDate")}
+날짜: {get_val("game_date")}
 날씨: {get_val("weather")}
 기온: {get_val("temperature")}
-홈팀유니폼: {get_val("homeTeamUniform")}
-원정팀유니폼: {get_val("awayTeamUniform")}
+홈팀유니폼: {get_val("home_team_uniform")}
+원정팀유니폼: {get_val("away_team_uniform")}
 주심: {get_val("referee")}
-부심: {get_val("assistantReferees")}
-제4심: {get_val("fourthOfficial")}
-VAR 심판: {get_val("varReferees")}"""
+부심: {get_val("assistant_referees")}
+제4심: {get_val("fourth_official")}
+VAR 심판: {get_val("var_referees")}"""
 
         return text
 
     def build_user_prompt(
         self,
-        match_info: dict,
-        raw_data: List[dict]
+        match_info: Union[dict, MatchRecord],
+        raw_data: List[Union[dict, ActionRecord]],
+        coord_mode: Optional[str] = None,
+        csv_format: Optional[str] = None,
+        context: Optional[List[Tuple[ActionRecord, dict]]] = None
     ) -> str:
         """
         사용자 프롬프트 생성 (system_prompts.py의 BASE_CONTEXT 기반)
@@ -173,18 +316,50 @@ VAR 심판: {get_val("varReferees")}"""
         Args:
             match_info: 경기 메타데이터
             raw_data: 액션 데이터 (보통 10개)
+            coord_mode: 좌표 표현 방식 (기본값: PROMPT_COORD_MODE)
+            csv_format: "full" 또는 "compact" (기본값: PROMPT_CSV_FORMAT)
+            context: 이미 해설한 직전 액션 [(액션 레코드, 해설)] (맥락 참고용, 해설 생성 대상 아님)
 
         Returns:
             사용자 프롬프트 문자열
         """
+        coord_mode = coord_mode or PROMPT_COORD_MODE
+        csv_format = csv_format or PROMPT_CSV_FORMAT
+        match_info = to_match(match_info)
+        raw_data = to_actions(raw_data)
         match_info_text = self._build_match_info_text(match_info)
-        raw_data_csv = self._build_raw_data_csv(raw_data)
+
+        build_csv = self._build_compact_csv if csv_format == "compact" else self._build_raw_data_csv
+        raw_data_csv = build_csv(
+            raw_data, match_info, coord_mode, PROMPT_DROP_DUPLICATE_MAIN_POSITION
+        )
+
+        # features 모드: 좌표 컬럼 대신 위치 코드 설명 추가
+        legend = ""
+        if coord_mode == "features":
+            from .spatial_features import FEATURE_LEGEND
+            legend = f"{FEATURE_LEGEND}\n\n"
+
+        # 캐시된 직전 액션: 흐름 파악용 (해설 생성 대상에서 제외)
+        context_text = ""
+        if context:
+            context_csv = self._build_raw_data_csv(
+                to_actions(item for item, _ in context), match_info, coord_mode, PROMPT_DROP_DUPLICATE_MAIN_POSITION
+            )
+            context_lines = "\n".join(
+                f"- {script.get('actionId', '')}: {script.get('description', '')}" for _, script in context
+            )
+            context_text = f"""# 직전 액션 (이미 해설함, 맥락 참고용 - 해설 생성 금지)
+{context_csv}
+{context_lines}
+
+"""
 
         # BASE_CONTEXT에 맞춘 프롬프트
         prompt = f"""# 경기 정보
 {match_info_text}
 
-# 액션 데이터 (CSV)
+{legend}{context_text}# 액션 데이터 (CSV)
 {raw_data_csv}
 
 **중요: 위 {len(raw_data)}개 액션 모두에 대해 누락 없이 반드시 해설을 생성하세요.**
@@ -196,9 +371,10 @@ VAR 심판: {get_val("varReferees")}"""
     async def call_llm(
         self,
         style: str,
-        match_info: dict,
-        raw_data: List[dict],
-        timeout: float = 300.0
+        match_info: Union[dict, MatchRecord],
+        raw_data: List[Union[dict, ActionRecord]],
+        timeout: float = 300.0,
+        job=None
     ) -> List[dict]:
         """
         RunPod LLM 호출
@@ -207,15 +383,38 @@ VAR 심판: {get_val("varReferees")}"""
             style: 해설 스타일 ("CASTER", "ANALYST", "FRIEND")
             match_info: 경기 메타데이터
             raw_data: 액션 데이터 (보통 10개)
+            timeout: 전체 타임아웃 (초, 재시도 포함 상한) - 시도별 마감 시간은 응답 시간 모델로 결정
+            job: JobData (선택, 토큰 사용량 / 응답 엔드포인트 / 원격 작업 ID 기록용)
 
         Returns:
             해설 스크립트 배열 (입력 액션 수와 동일)
+            서킷 브레이커가 열려 있으면 fallback 스크립트를 즉시 반환
+            학습한 마감 시간을 넘기고 재시도할 엔드포인트가 없으면 fallback 스크립트 반환
+            이전 윈도우에서 해설한 액션은 캐시된 해설을 사용하고 나머지만 LLM으로 생성
 
         Raises:
             Exception: LLM 호출 실패 시
         """
+        match_info = to_match(match_info)
+        raw_data = to_actions(raw_data)
+        game_id = job.game_id if job is not None else match_info.game_id
+
+        # 겹치는 윈도우: 이미 해설한 액션은 캐시 사용, 나머지만 생성
+        action_cache = get_action_cache()
+        cached = action_cache.lookup(game_id, style, raw_data)
+        pending = [item for item, hit in zip(raw_data, cached) if hit is None]
+        if not pending:
+            print(f"[CACHE] {len(raw_data)}개 액션 모두 캐시 적중 - RunPod 호출 생략")
+            return [dict(hit) for hit in cached]
+        context = self._cache_context(raw_data, cached)
+
         system_prompt = get_system_prompt(style)
-        user_prompt = self.build_user_prompt(match_info, raw_data)
+        csv_format = self.choose_csv_format()
+        with cpu_section("prompt_build"):
+            user_prompt = self.build_user_prompt(match_info, pending, csv_format=csv_format, context=context)
+        if job is not None:
+            job.prompt_variant = csv_format
+            job.mark("prompt_built")
 
         # OpenAI Chat Completion API 형식
         # /openai/v1/chat/completions 엔드포인트는 표준 OpenAI 형식 사용
@@ -230,17 +429,202 @@ VAR 심판: {get_val("varReferees")}"""
             "top_p": 0.9,
             "stream": False
         }
+        self._apply_output_schema(payload, pending)
+
+        # 비동기 모드 재시작 복구: 이미 제출한 원격 작업이 있으면 같은 엔드포인트에서 결과만 수집
+        endpoint = None
+        if self.call_mode == "async" and job is not None and job.remote_job_id:
+            endpoint = self.pool.get(job.remote_endpoint or "")
+
+        # 사용 가능한 엔드포인트가 없으면 (모두 서킷 OPEN) RunPod 호출 없이 즉시 fallback
+        endpoint = endpoint or self.pool.select()
+        if endpoint is None:
+            print(f"[BREAKER] 모든 엔드포인트 회로 열림 - RunPod 호출 생략, fallback 스크립트 반환")
+            get_metrics().incr("runpod_fast_fallback_total", style=style)
+            return self._merge_cached(
+                raw_data, cached, self._generate_fallback_scripts(pending, match_info, style), match_info, style
+            )
+
+        # 시도별 마감 시간: 학습한 응답 시간 백분위 기반 (학습 전에는 남은 전체 타임아웃)
+        started = time.monotonic()
+        budget_end = started + timeout
+        tried: List[Endpoint] = []
+        try:
+            while True:
+                attempt_started = time.monotonic()
+                deadline, learned = self._request_deadline(
+                    endpoint, style, len(pending), budget_end - attempt_started, job
+                )
+                try:
+                    endpoint, result = await self._post(endpoint, payload, deadline, job, style, len(pending))
+                    break
+                except (asyncio.TimeoutError, TimeoutError, httpx.TimeoutException) as e:
+                    if not learned:
+                        raise TimeoutError(f"RunPod 응답 timeout ({deadline:.1f}s, {endpoint.name})") from e
+                    # 학습한 마감 시간 초과 (멈춘 호출) -> 다른 엔드포인트 재시도 또는 fallback
+                    get_metrics().incr("runpod_deadline_exceeded_total", endpoint=endpoint.name)
+                    tried.append(endpoint)
+                    if job is not None and job.remote_job_id:
+                        # 비동기 모드: 시간 초과 작업은 취소됨 -> 저널에서 완료 처리 (재시작 후 재개 방지), 재시도는 새로 제출
+                        await get_async_poller().journal.record_finished(job.job_id)
+                        job.remote_job_id = None
+                    retry = self.pool.select(exclude=tried) if len(tried) <= RUNPOD_TIMEOUT_RETRIES else None
+                    if retry is None or budget_end - time.monotonic() < LATENCY_TIMEOUT_MIN:
+                        print(f"[TIMEOUT] {endpoint.name} {deadline:.1f}s 마감 초과 - fallback 스크립트 반환")
+                        get_metrics().incr("runpod_deadline_fallback_total", style=style)
+                        return self._merge_cached(
+                            raw_data, cached, self._generate_fallback_scripts(pending, match_info, style),
+                            match_info, style
+                        )
+                    print(f"[TIMEOUT] {endpoint.name} {deadline:.1f}s 마감 초과 - {retry.name}로 재시도")
+                    endpoint = retry
+        except Exception:
+            get_metrics().incr("runpod_call_errors_total", style=style)
+            raise
+
+        latency = time.monotonic() - started
+        get_metrics().observe("runpod_call_seconds", latency, style=style)
+        get_latency_model().observe(endpoint.name, time.monotonic() - attempt_started, style, len(pending))
+        if job is not None:
+            job.mark("response_complete")
+
+        # 토큰 사용량 기록 (job / 스타일 / 경기 / 엔드포인트별)
+        usage = extract_usage(result)
+        if job is not None:
+            job.usage = usage
+            job.endpoint = endpoint.name
+        if usage:
+            get_usage_tracker().record(
+                usage, style=style, game_id=game_id, endpoint=endpoint.name, variant=csv_format
+            )
+
+        # OpenAI Chat Completion 응답에서 텍스트 추출
+        llm_response = self._extract_openai_text(result)
+
+        # JSON 배열 파싱 (실패 시 fallback), 프롬프트 형식별 결과 품질 기록
+        with cpu_section("response_parse"):
+            scripts = self._decode_response(llm_response, len(pending))
+        if scripts is None:
+            outcome = "parse_error"
+            get_usage_tracker().record_outcome(csv_format, outcome)
+            scripts = self._generate_fallback_scripts(pending, match_info, style)
+        else:
+            outcome = "ok" if len(scripts) == len(pending) else "count_mismatch"
+            get_usage_tracker().record_outcome(csv_format, outcome)
+            # LLM이 생성한 해설만 캐시 (fallback / 요청하지 않은 actionId 제외)
+            pending_ids = {item.action_id for item in pending}
+            action_cache.store(
+                game_id, style, [script for script in scripts if action_id_of(script) in pending_ids]
+            )
+
+        # 샘플링된 호출은 요청/응답 캡처 (성능 회귀 테스트 코퍼스, capture_replay로 재실행)
+        capture_sink = get_capture_sink()
+        if capture_sink.should_sample():
+            capture_sink.capture({
+                "capturedAt": time.time(),
+                "jobId": job.job_id if job is not None else None,
+                "gameId": game_id,
+                "style": style,
+                "variant": csv_format,
+                "endpoint": endpoint.name,
+                "mode": self.call_mode,
+                "payload": payload,
+                "response": result,
+                "latency": round(latency, 3),
+                "pendingCount": len(pending),
+                "outcome": outcome
+            })
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
+        if len(pending) != len(raw_data):
+            scripts = self._merge_cached(raw_data, cached, scripts, match_info, style)
+        if job is not None:
+            job.mark("parsed")
+        return scripts
+
+    @staticmethod
+    def _cache_context(
+        raw_data: List[ActionRecord],
+        cached: List[Optional[dict]]
+    ) -> List[Tuple[ActionRecord, dict]]:
+        """첫 미생성 액션 직전의 캐시 액션 (최대 ACTION_CACHE_CONTEXT_ROWS개)"""
+        if ACTION_CACHE_CONTEXT_ROWS <= 0:
+            return []
+        first_pending = next(i for i, hit in enumerate(cached) if hit is None)
+        start = max(0, first_pending - ACTION_CACHE_CONTEXT_ROWS)
+        return [(raw_data[i], cached[i]) for i in range(start, first_pending)]
+
+    def _merge_cached(
+        self,
+        raw_data: List[ActionRecord],
+        cached: List[Optional[dict]],
+        fresh: List[dict],
+        match_info: MatchRecord,
+        style: str
+    ) -> List[dict]:
+        """
+        캐시된 해설과 새로 생성한 해설을 원래 액션 순서로 병합
+
+        - 새 해설은 actionId로 매칭 (actionId가 없으면 순서대로)
+        - LLM이 누락한 액션은 규칙 기반 해설로 채움
+        """
+        pending = [item for item, hit in zip(raw_data, cached) if hit is None]
+        by_id = {action_id_of(script): script for script in fresh if action_id_of(script)}
+        if not by_id and len(fresh) == len(pending):
+            by_id = {item.action_id: script for item, script in zip(pending, fresh)}
+
+        missing = [item for item in pending if item.action_id not in by_id]
+        if missing:
+            for item, script in zip(missing, self._generate_fallback_scripts(missing, match_info, style)):
+                by_id[item.action_id] = script
+
+        return [
+            dict(hit) if hit is not None else by_id[item.action_id]
+            for item, hit in zip(raw_data, cached)
+        ]
+
+    @staticmethod
+    def _timing_hooks(job) -> dict:
+        """요청 전송 / 응답 헤더 수신 시각을 job에 기록하는 httpx 이벤트 훅"""
+        if job is None:
+            return {}
+
+        async def on_request(request: httpx.Request) -> None:
+            job.mark("request_sent")
+
+        async def on_response(response: httpx.Response) -> None:
+            job.mark("first_byte")
+
+        return {"request": [on_request], "response": [on_response]}
+
+    def _headers(self, endpoint: Endpoint) -> dict:
+        """엔드포인트별 요청 헤더"""
+        return {
+            "Authorization": f"Bearer {endpoint.api_key}",
             "Content-Type": "application/json"
         }
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
+    async def _post_completion(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: Endpoint,
+        payload: dict
+    ) -> Tuple[Endpoint, dict]:
+        """
+        Chat Completion 요청 1회 전송 (엔드포인트 상태 기록 포함)
+
+        Returns:
+            (응답한 엔드포인트, OpenAI 형식 응답)
+
+        Raises:
+            Exception: HTTP 오류 또는 RunPod 오류 응답
+        """
+        self.pool.on_start(endpoint)
+        started = time.monotonic()
+        try:
             response = await client.post(
-                self.endpoint_url,
+                endpoint.url,
                 json=payload,
-                headers=headers
+                headers=self._headers(endpoint)
             )
 
             if response.status_code != 200:
@@ -254,13 +638,267 @@ VAR 심판: {get_val("varReferees")}"""
             if "error" in result:
                 raise Exception(f"RunPod error: {result['error']}")
 
-            # OpenAI Chat Completion 응답에서 텍스트 추출
-            llm_response = self._extract_openai_text(result)
+        except asyncio.CancelledError:
+            # 헤징에서 진 요청 등 취소된 호출은 성공/실패로 집계하지 않음
+            endpoint.breaker.release_probe()
+            raise
+        except Exception:
+            self.pool.record_failure(endpoint)
+            raise
+        finally:
+            self.pool.on_finish(endpoint)
+
+        self.pool.record_success(endpoint, time.monotonic() - started)
+        return endpoint, result
+
+    async def _post_async(
+        self,
+        endpoint: Endpoint,
+        payload: dict,
+        timeout: float,
+        job=None
+    ) -> Tuple[Endpoint, dict]:
+        """
+        RunPod /run 제출 후 결과 수집 (결과를 기다리는 동안 HTTP 연결을 유지하지 않음)
+        job에 같은 엔드포인트의 원격 작업 ID가 있으면 제출 없이 결과만 수집 (재시작 복구)
+
+        Returns:
+            (응답한 엔드포인트, OpenAI 형식 응답)
+
+        Raises:
+            Exception: 제출 실패 / 원격 작업 실패 / 시간 초과
+        """
+        poller = get_async_poller()
+        self.pool.on_start(endpoint)
+        started = time.monotonic()
+        try:
+            if job is not None and job.remote_job_id and job.remote_endpoint == endpoint.name:
+                remote_id = job.remote_job_id
+                print(f"[RUNPOD-ASYNC] 원격 작업 결과 수집 재개: {remote_id} ({endpoint.name})")
+            else:
+                async with httpx.AsyncClient(timeout=RUNPOD_ASYNC_REQUEST_TIMEOUT) as client:
+                    remote_id = await poller.submit(client, endpoint, payload)
+                poller.track(endpoint, remote_id)
+                if job is not None:
+                    job.mark("request_sent")
+                    job.remote_job_id = remote_id
+                    job.remote_endpoint = endpoint.name
+                    await poller.journal.record_submitted(
+                        job.job_id, remote_id, endpoint.name, job.resume_request
+                    )
+
+            result = await poller.wait(endpoint, remote_id, timeout)
+
+            if not isinstance(result, dict):
+                raise Exception(f"RunPod 응답 형식 오류: {str(result)[:200]}")
+            if "error" in result:
+                raise Exception(f"RunPod error: {result['error']}")
+
+        except asyncio.CancelledError:
+            endpoint.breaker.release_probe()
+            raise
+        except Exception:
+            self.pool.record_failure(endpoint)
+            raise
+        finally:
+            self.pool.on_finish(endpoint)
+
+        self.pool.record_success(endpoint, time.monotonic() - started)
+        return endpoint, result
+
+    async def cancel_remote(self, job) -> bool:
+        """
+        비동기 모드 원격 작업 취소 (작업 삭제 / 대체 시, best effort)
+        워커 종료로 중단된 작업과 달리 재시작 후 재개하지 않도록 저널에 완료로 기록
+
+        Args:
+            job: JobData (remote_job_id / remote_endpoint)
+
+        Returns:
+            취소 요청 전송 여부
+        """
+        if job is None or not job.remote_job_id:
+            return False
+        poller = get_async_poller()
+        endpoint = self.pool.get(job.remote_endpoint or "")
+        if endpoint is not None:
+            await poller.cancel_remote(endpoint, job.remote_job_id)
+        await poller.journal.record_finished(job.job_id)
+        job.remote_job_id = None
+        return endpoint is not None
+
+    async def warm_ping(self, timeout: float = 120.0) -> dict:
+        """
+        최소 길이 keep-alive 요청 (서버리스 워커 웜 유지용, 모든 엔드포인트 대상)
+        콜드 스타트 응답 시간이 헬스 점수에 반영되지 않도록 풀 상태는 기록하지 않음
+
+        Args:
+            timeout: 요청 타임아웃 (초, 콜드 스타트 포함)
+
+        Returns:
+            {엔드포인트 이름: 응답 시간(초) 또는 예외}
+        """
+        payload = {
+            "model": "lgai-exaone/exaone-3.5-7.8b-instruct",
+            "messages": [{"role": "user", "content": "ping"}],
+            "max_tokens": 1,
+            "temperature": 0.0,
+            "stream": False
+        }
+
+        async def ping(client: httpx.AsyncClient, endpoint: Endpoint) -> float:
+            started = time.monotonic()
+            response = await client.post(
+                endpoint.url,
+                json=payload,
+                headers=self._headers(endpoint)
+            )
+            if response.status_code != 200:
+                raise Exception(
+                    f"RunPod API error: {response.status_code} - {response.text}"
+                )
+            return time.monotonic() - started
+
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            results = await asyncio.gather(
+                *(ping(client, endpoint) for endpoint in self.pool.endpoints),
+                return_exceptions=True
+            )
+        return {
+            endpoint.name: result
+            for endpoint, result in zip(self.pool.endpoints, results)
+        }
+
+    @staticmethod
+    def _request_deadline(
+        endpoint: Endpoint,
+        style: str,
+        count: int,
+        remaining: float,
+        job=None
+    ) -> Tuple[float, bool]:
+        """
+        이번 시도의 마감 시간
 
-            # JSON 배열 파싱
-            scripts = self._parse_llm_response(llm_response, raw_data)
+        Args:
+            endpoint: 요청할 엔드포인트
+            style: 해설 스타일
+            count: 요청 액션 수
+            remaining: 남은 전체 타임아웃 (초)
+            job: 비동기 모드 재시작 복구 중이면 학습값 미사용 (이미 진행 중인 원격 작업)
 
-            return scripts
+        Returns:
+            (마감 시간(초), 학습값 사용 여부)
+        """
+        remaining = max(0.1, remaining)
+        if job is not None and job.remote_job_id:
+            return remaining, False
+        learned = get_latency_model().deadline(endpoint.name, style, count, ceiling=remaining)
+        if learned is None:
+            return remaining, False
+        return learned, True
+
+    async def _post(
+        self,
+        endpoint: Endpoint,
+        payload: dict,
+        deadline: float,
+        job=None,
+        style: Optional[str] = None,
+        count: Optional[int] = None
+    ) -> Tuple[Endpoint, dict]:
+        """
+        호출 모드별 요청 1회 (헤징 포함), deadline(초) 안에 응답이 없으면 TimeoutError
+
+        Returns:
+            (응답한 엔드포인트, OpenAI 형식 응답)
+        """
+        if self.call_mode == "async":
+            return await self._post_async(endpoint, payload, deadline, job)
+
+        timeout = httpx.Timeout(deadline, connect=min(deadline, RUNPOD_CONNECT_TIMEOUT))
+        # 마감 시점에 응답을 기다리던 엔드포인트 (헤지 요청 포함)
+        in_flight = [endpoint]
+        async with httpx.AsyncClient(timeout=timeout, event_hooks=self._timing_hooks(job)) as client:
+            try:
+                if self.hedge_enabled:
+                    return await asyncio.wait_for(
+                        self._post_hedged(client, endpoint, payload, style, count, in_flight), deadline
+                    )
+                return await asyncio.wait_for(self._post_completion(client, endpoint, payload), deadline)
+            except asyncio.TimeoutError:
+                # 취소된 요청은 실패로 집계되지 않으므로 마감 초과를 요청별 서킷 브레이커에 기록
+                for timed_out in in_flight:
+                    self.pool.record_failure(timed_out)
+                raise
+
+    def _hedge_delay(self, endpoint: Endpoint, style: Optional[str] = None, count: Optional[int] = None) -> float:
+        """헤지 요청 전송까지 대기 시간 (응답 시간 모델의 백분위 기반)"""
+        delay = get_latency_model().quantile(endpoint.name, RUNPOD_HEDGE_PERCENTILE, style, count)
+        if delay is None:
+            return RUNPOD_HEDGE_DEFAULT_DELAY
+        return max(RUNPOD_HEDGE_MIN_DELAY, delay)
+
+    async def _post_hedged(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: Endpoint,
+        payload: dict,
+        style: Optional[str] = None,
+        count: Optional[int] = None,
+        in_flight: Optional[List[Endpoint]] = None
+    ) -> Tuple[Endpoint, dict]:
+        """
+        헤징 요청: 백분위 지연 이후에도 응답이 없으면 다른 엔드포인트로
+        중복 요청을 보내 먼저 성공한 응답을 사용하고 나머지는 취소
+        (다른 엔드포인트가 없으면 같은 엔드포인트에 중복 요청하지 않고 기존 요청만 대기)
+
+        Args:
+            in_flight: 응답을 기다리는 엔드포인트 목록 (헤지 요청 시 추가, 실패한 요청은 제거 - 마감 초과 기록용)
+
+        Returns:
+            (응답한 엔드포인트, OpenAI 형식 응답)
+        """
+        if in_flight is None:
+            in_flight = [endpoint]
+        primary = asyncio.create_task(self._post_completion(client, endpoint, payload))
+        pending = {primary}
+
+        try:
+            delay = self._hedge_delay(endpoint, style, count)
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            hedge_endpoint = self.pool.select(exclude=[endpoint])
+            if hedge_endpoint is None:
+                print(f"[HEDGE] {delay:.1f}s 동안 응답 없음 - 다른 엔드포인트가 없어 헤지 요청 생략")
+                return await primary
+
+            print(f"[HEDGE] {delay:.1f}s 동안 응답 없음 - 헤지 요청 전송 ({hedge_endpoint.name})")
+            hedge = asyncio.create_task(self._post_completion(client, hedge_endpoint, payload))
+            in_flight.append(hedge_endpoint)
+            targets = {primary: endpoint, hedge: hedge_endpoint}
+            pending = {primary, hedge}
+
+            last_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            print(f"[HEDGE] 헤지 요청이 먼저 완료되었습니다")
+                        return task.result()
+                    # 실패는 _post_completion에서 이미 기록
+                    in_flight.remove(targets[task])
+                    last_error = task.exception()
+
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
 
     def _extract_openai_text(self, result: dict) -> str:
         """
@@ -354,94 +992,111 @@ VAR 심판: {get_val("varReferees")}"""
         # 최후의 수단: 문자열 변환
         return str(output)
 
-    def _save_prompt_to_file(
-        self,
-        system_prompt: str,
-        user_prompt: str,
-        style: str
-    ) -> None:
+    @staticmethod
+    def script_schema(action_ids: List[str]) -> dict:
         """
-        LLM에 입력되는 프롬프트를 파일로 저장 (디버깅용)
+        스크립트 배열 JSON 스키마 (구조화 출력용)
 
         Args:
-            system_prompt: 시스템 프롬프트
-            user_prompt: 사용자 프롬프트
-            style: 해설 스타일
-        """
-        from datetime import datetime
-        import json
+            action_ids: 해설할 액션 ID (배열 길이 고정, 모두 비어있지 않으면 actionId 값도 제한)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"prompt_{timestamp}.txt"
+        Returns:
+            JSON Schema
+        """
+        action_id_schema = {"type": "string"}
+        if action_ids and all(action_ids):
+            action_id_schema["enum"] = list(dict.fromkeys(action_ids))
+        return {
+            "type": "array",
+            "minItems": len(action_ids),
+            "maxItems": len(action_ids),
+            "items": {
+                "type": "object",
+                "properties": {
+                    "actionId": action_id_schema,
+                    "timeSeconds": {"type": "string"},
+                    "tone": {"type": "string", "enum": list(TONE_VALUES)},
+                    "description": {"type": "string", "minLength": 1}
+                },
+                "required": ["actionId", "timeSeconds", "tone", "description"],
+                "additionalProperties": False
+            }
+        }
 
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
+    def _apply_output_schema(self, payload: dict, pending: List[ActionRecord]) -> None:
+        """출력 형식이 json_schema / guided_json이면 요청 payload에 스키마 추가"""
+        if self.output_mode == "text":
+            return
+        schema = self.script_schema([item.action_id for item in pending])
+        if self.output_mode == "json_schema":
+            payload["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": "commentary_scripts", "schema": schema, "strict": True}
+            }
+        else:
+            payload["guided_json"] = schema
+
+    def _decode_response(self, llm_response: str, expected_count: int) -> Optional[List[dict]]:
+        """
+        출력 형식별 응답 디코딩
 
-        content = f"""{'=' * 80}
-LLM 입력 프롬프트
-{'=' * 80}
-스타일: {style}
-생성 시간: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
-{'=' * 80}
-[System Prompt]
-{'=' * 80}
-{system_prompt}
-
-{'=' * 80}
-[User Prompt]
-{'=' * 80}
-{user_prompt}
-
-{'=' * 80}
-[Full Messages (OpenAI Format)]
-{'=' * 80}
-{json.dumps(messages, ensure_ascii=False, indent=2)}
-"""
+        - json_schema / guided_json: 스키마 검증만 하는 빠른 경로, 실패 시 (서버가 스키마를 무시한 경우 등)
+          텍스트 휴리스틱으로 재시도
+        - text: 텍스트 휴리스틱 (_decode_scripts)
 
-        try:
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(content)
-            print(f"[OK] 프롬프트가 {filename}에 저장되었습니다.")
-        except Exception as e:
-            print(f"[WARNING] 프롬프트 저장 실패: {e}")
+        Args:
+            llm_response: LLM 텍스트 응답
+            expected_count: 요청한 액션 수
 
-    def _save_runpod_response(self, result: dict) -> None:
+        Returns:
+            정규화된 스크립트 배열, 파싱 실패 시 None
         """
-        RunPod 응답을 JSON 파일로 저장 (디버깅용)
-
-        Args:
-            result: RunPod API 응답
+        if self.output_mode != "text":
+            scripts = self._decode_structured(llm_response, expected_count)
+            get_metrics().incr("structured_output_total", result="ok" if scripts is not None else "invalid")
+            if scripts is not None:
+                return scripts
+        return self._decode_scripts(llm_response)
+
+    @staticmethod
+    def _decode_structured(llm_response: str, expected_count: int) -> Optional[List[dict]]:
         """
-        from datetime import datetime
-        import json
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"runpod_response_{timestamp}.json"
+        스키마 제약 응답 검증 (```json 블록 / 대괄호 탐색 없이 json.loads 1회)
 
+        Returns:
+            정규화된 스크립트 배열, 스키마와 다르면 None
+        """
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
-            print(f"[OK] RunPod 응답이 {filename}에 저장되었습니다.")
-        except Exception as e:
-            print(f"[WARNING] RunPod 응답 저장 실패: {e}")
+            items = json.loads(llm_response)
+        except ValueError:
+            return None
+        if not isinstance(items, list) or len(items) != expected_count:
+            return None
 
-    def _parse_llm_response(
-        self,
-        llm_response: str,
-        raw_data: List[dict]
-    ) -> List[dict]:
+        scripts = []
+        for item in items:
+            if not isinstance(item, dict) or item.get("tone") not in TONE_VALUES:
+                return None
+            description = item.get("description")
+            if not isinstance(description, str) or not description:
+                return None
+            scripts.append({
+                "actionId": str(item.get("actionId", "")),
+                "timeSeconds": str(item.get("timeSeconds", "")),
+                "tone": item["tone"],
+                "description": description
+            })
+        return scripts
+
+    def _decode_scripts(self, llm_response: str) -> Optional[List[dict]]:
         """
-        LLM 응답에서 JSON 배열 파싱
+        LLM 응답에서 JSON 배열 추출 및 정규화
 
         Args:
             llm_response: LLM 텍스트 응답
-            raw_data: 원본 액션 데이터 (fallback용)
 
         Returns:
-            파싱된 스크립트 배열
+            정규화된 스크립트 배열, 파싱 실패 시 None
         """
         # JSON 배열 추출 시도
         llm_response = llm_response.strip()
@@ -485,54 +1140,57 @@ LLM 입력 프롬프트
 
             return validated_scripts
 
-        except json.JSONDecodeError as e:
-            # 파싱 실패 시 기본 응답 생성
+        except (json.JSONDecodeError, TypeError, AttributeError) as e:
             print(f"JSON 파싱 실패: {e}")
             print(f"LLM 응답: {llm_response[:500]}...")
+            return None
 
-            # Fallback: 원본 데이터 기반 기본 스크립트 생성
-            return self._generate_fallback_scripts(raw_data)
-
-    def _generate_fallback_scripts(self, raw_data: List[dict]) -> List[dict]:
+    def _parse_llm_response(
+        self,
+        llm_response: str,
+        raw_data: List[Union[dict, ActionRecord]],
+        match_info: Union[dict, MatchRecord, None] = None,
+        style: str = "CASTER"
+    ) -> List[dict]:
         """
-        LLM 응답 파싱 실패 시 기본 스크립트 생성
+        LLM 응답에서 JSON 배열 파싱
 
         Args:
-            raw_data: 원본 액션 데이터
+            llm_response: LLM 텍스트 응답
+            raw_data: 원본 액션 데이터 (fallback용)
+            match_info: 경기 메타데이터 (fallback용)
+            style: 해설 스타일 (fallback용)
 
         Returns:
-            기본 스크립트 배열
+            파싱된 스크립트 배열
         """
-        field_mapping = {
-            "actionId": ["actionId", "action_id"],
-            "timeSeconds": ["timeSeconds", "time_seconds"],
-            "typeName": ["typeName", "type_name"],
-            "playerNameKo": ["playerNameKo", "player_name_ko"],
-        }
-
-        def get_val(item: dict, key: str) -> str:
-            for k in field_mapping.get(key, [key]):
-                if k in item:
-                    return str(item[k]) if item[k] else ""
-            return ""
-
-        scripts = []
-        for item in raw_data:
-            action_id = get_val(item, "actionId")
-            time_seconds = get_val(item, "timeSeconds")
-            type_name = get_val(item, "typeName")
-            player_name = get_val(item, "playerNameKo")
+        scripts = self._decode_scripts(llm_response)
+        if scripts is None:
+            # Fallback: 원본 데이터 기반 기본 스크립트 생성
+            return self._generate_fallback_scripts(raw_data, match_info, style)
+        return scripts
 
-            description = f"{player_name} 선수가 {type_name}을 합니다." if player_name and type_name else "플레이 진행 중입니다."
+    def _generate_fallback_scripts(
+        self,
+        raw_data: List[Union[dict, ActionRecord]],
+        match_info: Union[dict, MatchRecord, None] = None,
+        style: str = "CASTER"
+    ) -> List[dict]:
+        """
+        LLM 응답 파싱 실패 / 서킷 OPEN 시 규칙 기반 스크립트 생성
 
-            scripts.append({
-                "actionId": action_id,
-                "timeSeconds": time_seconds,
-                "tone": "DEFAULT",
-                "description": description
-            })
+        Args:
+            raw_data: 원본 액션 데이터 (dict 또는 ActionRecord)
+            match_info: 경기 메타데이터 (홈/원정 공격 방향 판별용)
+            style: 해설 스타일
 
-        return scripts
+        Returns:
+            기본 스크립트 배열
+        """
+        # NumPy 지연 로드 (fallback이 필요할 때만 임포트)
+        from .rule_commentary import generate_rule_scripts
+        with cpu_section("rule_scripts"):
+            return generate_rule_scripts(raw_data, match_info, style)
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,206 @@
+"""
+경기별 해설 아카이브 (SQLite, append-only)
+완료된 작업의 해설을 저장하고 (gameId, style, 시간 구간) 단위로 재생/하이라이트용 조회
+
+- 쓰기/읽기는 asyncio.to_thread로 이벤트 루프 밖에서 실행
+- 같은 액션이 다시 생성되면 새 행을 추가하고, 조회 시 가장 최근 행 사용
+- 구간 조회 기준 시각(periodId, timeSeconds)은 LLM 출력이 아닌 입력 액션 레코드 값 사용
+
+Version: 1.0
+"""
+
+import os
+import time
+import sqlite3
+import asyncio
+import threading
+from typing import List, Optional
+
+from ..models.records import ActionRecord
+
+# 아카이브 파일 경로 (기본 비활성화, 예: data/commentary_archive.sqlite3)
+COMMENTARY_ARCHIVE_PATH = os.getenv("COMMENTARY_ARCHIVE_PATH", "")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scripts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id TEXT NOT NULL,
+    style TEXT NOT NULL,
+    action_id TEXT NOT NULL,
+    period_id INTEGER,
+    time_seconds REAL,
+    tone TEXT NOT NULL,
+    description TEXT NOT NULL,
+    job_id TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scripts_game_style_time
+    ON scripts (game_id, style, period_id, time_seconds, action_id);
+"""
+
+
+class ScriptArchive:
+    """SQLite 기반 해설 아카이브"""
+
+    def __init__(self, path: str = COMMENTARY_ARCHIVE_PATH):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        """연결 생성 (최초 1회, 스레드 간 공유 - _lock으로 직렬화)"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def append(
+        self,
+        game_id: str,
+        style: str,
+        scripts: List[dict],
+        raw_data: Optional[List[ActionRecord]] = None,
+        job_id: Optional[str] = None
+    ) -> int:
+        """
+        해설 저장 (동기)
+
+        Args:
+            game_id: 경기 ID
+            style: 해설 스타일
+            scripts: 해설 스크립트 배열
+            raw_data: 액션 레코드 (periodId / timeSeconds 조회용, 없는 액션은 시각 없이 저장)
+            job_id: Job ID
+
+        Returns:
+            저장된 행 수
+        """
+        actions = {action.action_id: action for action in raw_data or []}
+
+        now = time.time()
+        rows = []
+        for script in scripts:
+            action_id = str(script.get("actionId", ""))
+            action = actions.get(action_id)
+            rows.append((
+                str(game_id),
+                style,
+                action_id,
+                action.period if action is not None else None,
+                action.time_value if action is not None else None,
+                str(script.get("tone", "DEFAULT")),
+                str(script.get("description", "")),
+                job_id,
+                now
+            ))
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO scripts (game_id, style, action_id, period_id, time_seconds, "
+                    "tone, description, job_id, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        return len(rows)
+
+    def query(
+        self,
+        game_id: str,
+        style: Optional[str] = None,
+        time_from: Optional[float] = None,
+        time_to: Optional[float] = None,
+        period_id: Optional[int] = None
+    ) -> List[dict]:
+        """
+        경기 해설 구간 조회 (동기, 액션별 최신 행)
+
+        Args:
+            game_id: 경기 ID
+            style: 해설 스타일 (없으면 전체)
+            time_from: 시작 시간(초, 포함)
+            time_to: 종료 시간(초, 포함)
+            period_id: 전/후반 (없으면 전체)
+
+        Returns:
+            [{"actionId", "timeSeconds", "periodId", "style", "tone", "description"}] (시간순)
+        """
+        conditions = ["game_id = ?"]
+        params: list = [str(game_id)]
+        if style:
+            conditions.append("style = ?")
+            params.append(style)
+        if period_id is not None:
+            conditions.append("period_id = ?")
+            params.append(period_id)
+        if time_from is not None:
+            conditions.append("time_seconds >= ?")
+            params.append(time_from)
+        if time_to is not None:
+            conditions.append("time_seconds <= ?")
+            params.append(time_to)
+
+        # SQLite: MAX(id)와 함께 선택한 컬럼은 해당 행의 값 (액션별 최신 해설)
+        sql = (
+            "SELECT MAX(id) AS id, style, action_id, period_id, time_seconds, tone, description "
+            "FROM scripts WHERE " + " AND ".join(conditions) + " "
+            "GROUP BY style, action_id "
+            "ORDER BY period_id, time_seconds, CAST(action_id AS INTEGER), style"
+        )
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+
+        return [
+            {
+                "actionId": row["action_id"],
+                "timeSeconds": "" if row["time_seconds"] is None else f"{row['time_seconds']:.15g}",
+                "periodId": row["period_id"],
+                "style": row["style"],
+                "tone": row["tone"],
+                "description": row["description"]
+            }
+            for row in rows
+        ]
+
+    async def append_async(
+        self,
+        game_id: str,
+        style: str,
+        scripts: List[dict],
+        raw_data: Optional[List[ActionRecord]] = None,
+        job_id: Optional[str] = None
+    ) -> None:
+        """해설 저장 (이벤트 루프 밖에서 실행, 실패해도 작업에는 영향 없음)"""
+        if not self.enabled or not scripts:
+            return
+        try:
+            await asyncio.to_thread(self.append, game_id, style, scripts, raw_data, job_id)
+        except Exception as e:
+            print(f"[ARCHIVE] 해설 저장 실패 ({game_id}, {style}): {e}")
+
+    async def query_async(self, game_id: str, **filters) -> List[dict]:
+        """경기 해설 구간 조회 (이벤트 루프 밖에서 실행)"""
+        return await asyncio.to_thread(self.query, game_id, **filters)
+
+
+# 싱글톤 인스턴스
+_script_archive: Optional[ScriptArchive] = None
+
+
+def get_script_archive() -> ScriptArchive:
+    """ScriptArchive 인스턴스 반환"""
+    global _script_archive
+    if _script_archive is None:
+        _script_archive = ScriptArchive()
+    return _script_archive
@@ -0,0 +1,370 @@
+"""
+gameId 기반 워커 샤딩 / 샤드 인코딩 Job ID / 워커 간 요청 전달
+gunicorn 멀티 워커에서는 워커(프로세스)마다 JobStore / 액션 캐시 / 응답 시간 모델이 따로 있으므로
+같은 경기의 요청은 항상 같은 워커(샤드)가 처리하고, 상태 조회는 Job ID에 기록된 샤드로 전달
+(중앙 저장소 없이 워커 수평 확장)
+
+- 샤드 번호: 시작 시 SHARD_SOCKET_DIR의 잠금 파일(shard-N.lock)을 0번부터 선점
+  (워커가 재시작되면 비워진 번호를 새 워커가 이어받음, SHARD_COUNT 이상 번호는 소유 경기 없이 전달만 담당)
+- Job ID: job_ + 생성 시각(ms, hex 11자리) + 인스턴스(hex 6자리) + 샤드(hex 2자리) + 순번(hex 3자리)
+  -> 시간순 정렬, 워커 간 / 같은 ms 안에서도 충돌 없음
+  -> 인스턴스: SHARD_INSTANCE_ID / WEBSITE_INSTANCE_ID / 호스트 이름의 crc32 (샤드 번호는 호스트마다 0부터 선점하므로
+     App Service 스케일 아웃 시 인스턴스끼리 같은 샤드 + 순번을 발급해도 ID가 겹치지 않도록)
+- 경기 소유 샤드: crc32(gameId) % SHARD_COUNT (프로세스마다 달라지는 hash() 대신 고정 해시)
+- 전달: 소유 워커의 Unix 소켓(shard-N.sock)으로 같은 HTTP 요청 전송 (X-Shard-Forwarded 헤더로 재전달 방지)
+- 이벤트 중계: 푸시 채널(WebSocket) 이벤트를 다른 워커에도 전달 (백엔드 연결이 붙은 워커와 경기 소유 워커가 달라도 수신)
+  워커별 순차 전송 태스크 1개로 보내 같은 작업의 이벤트 순서 유지
+- SHARD_COUNT=1 (기본): 전달 없음 (Job ID 충돌 방지만 적용)
+
+Version: 1.0
+"""
+
+import os
+import re
+import json
+import time
+import zlib
+import socket
+import asyncio
+import contextlib
+from typing import Dict, Iterator, List, Mapping, Optional
+
+import httpx
+
+from .metrics import get_metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows (로컬 개발)
+    fcntl = None
+
+# 경기를 나눠 가질 샤드(워커) 수 (gunicorn -w 와 같게 설정, 1이면 전달 없음)
+SHARD_COUNT = int(os.getenv("SHARD_COUNT", "1"))
+# 샤드 잠금 파일 / Unix 소켓 디렉터리 (같은 호스트의 워커끼리 공유)
+SHARD_SOCKET_DIR = os.getenv("SHARD_SOCKET_DIR", "/tmp/kleague-ai-shards")
+# 워커 간 전달 타임아웃 (초)
+SHARD_FORWARD_TIMEOUT = float(os.getenv("SHARD_FORWARD_TIMEOUT", "5"))
+# Job ID 인스턴스 구분값 (빈 문자열이면 WEBSITE_INSTANCE_ID(Azure App Service) -> 호스트 이름 순으로 사용)
+SHARD_INSTANCE_ID = os.getenv("SHARD_INSTANCE_ID", "") or os.getenv("WEBSITE_INSTANCE_ID", "")
+
+# 전달된 요청 표시 헤더 (값: 보낸 샤드 번호)
+FORWARDED_HEADER = "x-shard-forwarded"
+# 전달 응답에서 그대로 돌려줄 헤더
+RELAY_HEADERS = ("content-type", "etag", "retry-after", "cache-control")
+
+MAX_SHARDS = 256  # Job ID 샤드 자리 (hex 2자리)
+RELAY_QUEUE_MAX = 1000  # 중계 대기 이벤트 최대 수 (초과 시 버림)
+_SOCKET_NAME = re.compile(r"shard-(\d+)\.sock$")
+JOB_ID_PREFIX = "job_"
+JOB_ID_LENGTH = len(JOB_ID_PREFIX) + 11 + 6 + 2 + 3
+
+
+def instance_tag(instance_id: str = SHARD_INSTANCE_ID) -> str:
+    """Job ID 인스턴스 자리 (인스턴스 ID 또는 호스트 이름의 crc32 하위 24비트, hex 6자리)"""
+    source = instance_id or socket.gethostname()
+    return f"{zlib.crc32(source.encode('utf-8')) & 0xFFFFFF:06x}"
+
+
+def shard_of_job(job_id: str) -> Optional[int]:
+    """
+    Job ID에 기록된 샤드 번호
+
+    Returns:
+        샤드 번호, 이전 형식(job_ + hex 6자리) 등 샤드 정보가 없으면 None
+    """
+    if len(job_id) != JOB_ID_LENGTH or not job_id.startswith(JOB_ID_PREFIX):
+        return None
+    try:
+        return int(job_id[-5:-3], 16)
+    except ValueError:
+        return None
+
+
+class _LocalServer:
+    """워커 간 전달 수신용 Unix 소켓 서버 (같은 앱, lifespan / 시그널 처리 없음)"""
+
+    def __init__(self, app, path: str):
+        import uvicorn
+
+        class _Server(uvicorn.Server):
+            @contextlib.contextmanager
+            def capture_signals(self) -> Iterator[None]:
+                # 종료 시그널은 워커(gunicorn / uvicorn) 본 서버가 처리
+                yield
+
+        self.path = path
+        self.server = _Server(uvicorn.Config(
+            app, uds=path, lifespan="off", log_level="warning", access_log=False
+        ))
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)  # 이전 워커가 남긴 소켓
+        self.task = asyncio.create_task(self.server.serve())
+
+    async def stop(self) -> None:
+        if self.task is None:
+            return
+        self.server.should_exit = True
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(self.task, timeout=5)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+
+
+class ShardRouter:
+    """샤드 번호 선점 / Job ID 생성 / 경기 소유 샤드 판정 / 요청 전달"""
+
+    def __init__(
+        self,
+        shard_count: int = SHARD_COUNT,
+        socket_dir: str = SHARD_SOCKET_DIR,
+        forward_timeout: float = SHARD_FORWARD_TIMEOUT,
+        instance_id: str = SHARD_INSTANCE_ID
+    ):
+        self.shard_count = min(max(1, shard_count), MAX_SHARDS)
+        self.instance = instance_tag(instance_id)
+        self.socket_dir = socket_dir
+        self.forward_timeout = forward_timeout
+        self._index: Optional[int] = None
+        self._lock_file = None
+        self._last_ms = 0
+        self._seq = 0
+        self._clients: Dict[int, httpx.AsyncClient] = {}
+        self._server: Optional[_LocalServer] = None
+        self.forwarded: Dict[str, int] = {}
+        self._relay_queue: Optional[asyncio.Queue] = None
+        self._relay_task: Optional[asyncio.Task] = None
+        self.relayed: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """워커 간 전달 사용 여부"""
+        return self.shard_count > 1
+
+    @property
+    def index(self) -> int:
+        """이 워커의 샤드 번호 (최초 사용 시 선점 - fork 이후 워커 프로세스에서)"""
+        if self._index is None:
+            self._index = self._claim()
+        return self._index
+
+    def _claim(self) -> int:
+        """비어 있는 가장 작은 샤드 번호의 잠금 파일 선점 (프로세스 종료 시 자동 해제)"""
+        if fcntl is None:
+            index = os.getpid() % MAX_SHARDS
+            print(f"[SHARD] 파일 잠금 미지원 - 샤드 번호 {index} (PID 기반)")
+            return index
+
+        os.makedirs(self.socket_dir, exist_ok=True)
+        for index in range(MAX_SHARDS):
+            lock_file = open(os.path.join(self.socket_dir, f"shard-{index}.lock"), "w")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                continue
+            self._lock_file = lock_file
+            role = "경기 소유" if index < self.shard_count else "전달 전용"
+            print(f"[SHARD] 샤드 {index}/{self.shard_count} 선점 ({role}, PID {os.getpid()})")
+            return index
+        raise RuntimeError(f"사용 가능한 샤드 번호가 없습니다 ({MAX_SHARDS}개 모두 사용 중)")
+
+    def socket_path(self, index: int) -> str:
+        return os.path.join(self.socket_dir, f"shard-{index}.sock")
+
+    def next_job_id(self) -> str:
+        """
+        시간순 / 충돌 없는 Job ID (생성 시각 ms + 인스턴스 + 샤드 + 같은 ms 안의 순번)
+
+        시계가 뒤로 가거나 같은 ms에 순번(4096개)을 모두 쓰면 직전 시각 이후로 이어서 발급
+        """
+        now = max(int(time.time() * 1000), self._last_ms)
+        if now == self._last_ms:
+            self._seq += 1
+            if self._seq > 0xFFF:
+                now += 1
+                self._seq = 0
+        else:
+            self._seq = 0
+        self._last_ms = now
+        return f"{JOB_ID_PREFIX}{now:011x}{self.instance}{self.index:02x}{self._seq:03x}"
+
+    def owner_of_game(self, game_id: str) -> int:
+        """경기 소유 샤드 (전달 미사용 시 이 워커)"""
+        if not self.enabled:
+            return self.index
+        return zlib.crc32(game_id.encode("utf-8")) % self.shard_count
+
+    def owner_of_job(self, job_id: str) -> int:
+        """작업 소유 샤드 (이전 형식 Job ID / 전달 미사용 시 이 워커)"""
+        shard = shard_of_job(job_id)
+        if not self.enabled or shard is None:
+            return self.index
+        return shard
+
+    def issued_here(self, job_id: str) -> bool:
+        """
+        이 워커의 샤드 번호로 발급된 Job ID인지 (재시작 후 원격 작업 재개 대상 판정)
+
+        전달 사용 여부와 관계없이 Job ID에 기록된 샤드 기준 (이전 형식 Job ID는 샤드 0)
+        """
+        shard = shard_of_job(job_id)
+        return (shard if shard is not None else 0) == self.index
+
+    def is_local(self, shard: int) -> bool:
+        return shard == self.index
+
+    def is_internal(self, scope: Mapping) -> bool:
+        """이 워커의 전달 수신 소켓으로 들어온 요청인지 (헤더와 달리 외부에서 위조할 수 없음)"""
+        server = scope.get("server")
+        return bool(server) and server[1] is None and server[0] == self.socket_path(self.index)
+
+    def peers(self) -> List[int]:
+        """전달 수신 소켓이 있는 다른 워커의 샤드 번호 (전달 전용 워커 포함)"""
+        try:
+            names = os.listdir(self.socket_dir)
+        except OSError:
+            return []
+        shards = (_SOCKET_NAME.fullmatch(name) for name in names)
+        return sorted(int(m.group(1)) for m in shards if m and int(m.group(1)) != self.index)
+    async def start(self, app) -> None:
+        """샤드 번호 선점 및 전달 수신 소켓 시작 (lifespan에서 호출)"""
+        index = self.index
+        if self.enabled and fcntl is not None and self._server is None:
+            self._server = _LocalServer(app, self.socket_path(index))
+            self._server.start()
+
+    async def stop(self) -> None:
+        """전달 수신 소켓 / 클라이언트 종료"""
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._relay_task
+            self._relay_task = None
+        if self._server is not None:
+            await self._server.stop()
+            self._server = None
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    def _client(self, shard: int) -> httpx.AsyncClient:
+        client = self._clients.get(shard)
+        if client is None:
+            client = self._clients[shard] = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=self.socket_path(shard)),
+                base_url=f"http://shard-{shard}",
+                timeout=self.forward_timeout
+            )
+        return client
+
+    async def forward(
+        self,
+        shard: int,
+        method: str,
+        path: str,
+        query: str = "",
+        body: bytes = b"",
+        headers: Optional[Mapping[str, str]] = None
+    ) -> Optional[httpx.Response]:
+        """
+        소유 워커로 요청 전달
+
+        Args:
+            shard: 대상 샤드 번호
+            method / path / query / body: 원본 요청
+            headers: 원본 요청 헤더 (If-None-Match 등, host / content-length 제외하고 전달)
+
+        Returns:
+            소유 워커 응답, 연결 실패 / 시간 초과면 None
+        """
+        forward_headers = {
+            name: value for name, value in (headers or {}).items()
+            if name.lower() not in ("host", "content-length", "connection", FORWARDED_HEADER)
+        }
+        forward_headers[FORWARDED_HEADER] = str(self.index)
+
+        started = time.monotonic()
+        try:
+            response = await self._client(shard).request(
+                method,
+                path + (f"?{query}" if query else ""),
+                content=body,
+                headers=forward_headers
+            )
+        except (httpx.TransportError, OSError) as e:
+            self._count("error")
+            print(f"[SHARD] 샤드 {shard}로 전달 실패 ({method} {path}): {e}")
+            return None
+
+        self._count("ok")
+        get_metrics().observe("shard_forward_seconds", time.monotonic() - started)
+        return response
+
+    def relay(self, path: str, message: dict) -> None:
+        """
+        다른 모든 워커로 이벤트 중계 (블로킹 없음, 전달 미사용 시 무시)
+
+        Args:
+            path: 수신 워커의 내부 경로 (is_internal로 확인하는 엔드포인트)
+            message: JSON 본문
+        """
+        if not self.enabled:
+            return
+        if self._relay_queue is None:
+            self._relay_queue = asyncio.Queue(maxsize=RELAY_QUEUE_MAX)
+        if self._relay_task is None or self._relay_task.done():
+            self._relay_task = asyncio.create_task(self._relay_loop())
+        try:
+            self._relay_queue.put_nowait((path, json.dumps(message, ensure_ascii=False).encode("utf-8")))
+        except asyncio.QueueFull:
+            self._count_relay("dropped")
+
+    async def _relay_loop(self) -> None:
+        """중계 대기열 순차 전송 (같은 작업 이벤트 순서 유지, 연결할 수 없는 워커는 건너뜀)"""
+        while True:
+            path, body = await self._relay_queue.get()
+            for shard in self.peers():
+                try:
+                    response = await self._client(shard).post(
+                        path, content=body,
+                        headers={"content-type": "application/json", FORWARDED_HEADER: str(self.index)}
+                    )
+                    self._count_relay("ok" if response.status_code < 400 else "error")
+                except (httpx.TransportError, OSError):
+                    # 비정상 종료한 워커가 남긴 소켓 등
+                    self._count_relay("error")
+
+    def _count_relay(self, result: str) -> None:
+        self.relayed[result] = self.relayed.get(result, 0) + 1
+        get_metrics().incr("shard_relay_total", result=result)
+
+    def _count(self, result: str) -> None:
+        self.forwarded[result] = self.forwarded.get(result, 0) + 1
+        get_metrics().incr("shard_forward_total", result=result)
+
+    def snapshot(self) -> dict:
+        """상태 요약"""
+        return {
+            "shard": self.index,
+            "shardCount": self.shard_count,
+            "instance": self.instance,
+            "enabled": self.enabled,
+            "owner": self.index < self.shard_count,
+            "forwarded": dict(self.forwarded),
+            "relayed": dict(self.relayed)
+        }
+
+
+# 싱글톤 인스턴스
+_shard_router: Optional[ShardRouter] = None
+
+
+def get_shard_router() -> ShardRouter:
+    """ShardRouter 인스턴스 반환"""
+    global _shard_router
+    if _shard_router is None:
+        _shard_router = ShardRouter()
+    return _shard_router
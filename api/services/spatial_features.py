@@ -0,0 +1,196 @@
+"""
+액션 위치 특성 추출 (NumPy 벡터화)
+원시 좌표(start_x ~ dy)를 행동 팀 공격 방향 기준의 범주형 특성으로 변환
+(프롬프트 토큰 절감 및 LLM의 좌표 계산 부담 제거)
+
+Version: 1.0
+"""
+
+from typing import List, Union
+
+import numpy as np
+
+from ..models.records import ActionRecord, MatchRecord, to_actions, to_match
+
+# =============================================================================
+# 필드 좌표계 (system_prompts.BASE_CONTEXT 기준)
+# 홈팀: x=0 -> x=105 방향 공격 / 원정팀: x=105 -> x=0 방향 공격
+# =============================================================================
+
+PITCH_LENGTH = 105.0
+PITCH_WIDTH = 68.0
+
+# 페널티 박스 (골라인에서 16.5m, 폭 40.32m)
+BOX_DEPTH = 16.5
+BOX_Y_MIN = (PITCH_WIDTH - 40.32) / 2
+BOX_Y_MAX = PITCH_WIDTH - BOX_Y_MIN
+
+# 3분할 경계 (공격 방향 기준 x)
+THIRD_BOUNDARIES = np.array([PITCH_LENGTH / 3, PITCH_LENGTH * 2 / 3])
+# 좌/중/우 채널 경계 (공격 방향 기준 y, 큰 값이 왼쪽)
+CHANNEL_BOUNDARIES = np.array([PITCH_WIDTH / 3, PITCH_WIDTH * 2 / 3])
+
+# 이동 거리 기준 (m)
+LONG_DISTANCE = 30.0
+MIN_DIRECTION_DISTANCE = 3.0
+
+# 구역 코드: 3분할(D=자기 진영, M=중원, A=상대 진영) + 채널(R=오른쪽, C=중앙, L=왼쪽)
+# 페널티 박스: PB=상대 페널티 박스, OB=자기 페널티 박스
+THIRD_CODES = np.array(["D", "M", "A"])
+CHANNEL_CODES = np.array(["R", "C", "L"])
+OPPONENT_BOX = "PB"
+OWN_BOX = "OB"
+
+# 방향 코드: F=전진, B=후진, L=왼쪽, R=오른쪽, S=제자리(짧은 이동)
+DIRECTION_CODES = ("F", "B", "L", "R", "S")
+
+# 프롬프트용 위치 코드 설명 (features 모드에서 CSV 앞에 추가)
+FEATURE_LEGEND = """# 위치 코드 안내 (좌표 대신 제공, 모두 행동 팀의 공격 방향 기준)
+- zone/end_zone: 시작/종료 구역. 첫 글자 D=자기 진영, M=중원, A=상대 진영 / 둘째 글자 L=왼쪽 측면, C=중앙, R=오른쪽 측면
+  PB=상대 페널티 박스 안, OB=자기 페널티 박스 안
+- prog: 상대 골문 방향 전진 거리(m, 음수는 후진)
+- dir: 이동 방향 F=전진, B=후진, L=왼쪽, R=오른쪽, S=제자리 (끝에 +가 붙으면 30m 이상 긴 거리)"""
+
+FEATURE_COLUMNS = ["zone", "end_zone", "prog", "dir"]
+
+
+def resolve_home_mask(actions: List[ActionRecord], match_info: MatchRecord) -> np.ndarray:
+    """
+    액션별 홈팀 여부 (팀명이 원정팀과 일치하지 않으면 홈팀 방향으로 간주)
+
+    Returns:
+        bool 배열 (len(actions),)
+    """
+    away_names = match_info.away_names
+    return np.array([action.team_name_ko_short not in away_names for action in actions], dtype=bool)
+
+
+class SpatialFeatures:
+    """
+    윈도우 단위 위치 특성 (배열 길이 = 액션 수)
+
+    - start_zone / end_zone: 구역 코드 (좌표 없으면 "")
+    - progress: 공격 방향 전진 거리 (m)
+    - distance: 이동 거리 (m)
+    - direction: 방향 코드
+    - in_box: 종료 위치가 상대 페널티 박스 안인지
+    - attacking_third: 시작 위치가 상대 진영(공격 3분의 1)인지
+    """
+
+    def __init__(
+        self,
+        start_zone: np.ndarray,
+        end_zone: np.ndarray,
+        progress: np.ndarray,
+        distance: np.ndarray,
+        direction: np.ndarray,
+        in_box: np.ndarray,
+        attacking_third: np.ndarray,
+        has_start: np.ndarray,
+        has_end: np.ndarray
+    ):
+        self.start_zone = start_zone
+        self.end_zone = end_zone
+        self.progress = progress
+        self.distance = distance
+        self.direction = direction
+        self.in_box = in_box
+        self.attacking_third = attacking_third
+        self.has_start = has_start
+        self.has_end = has_end
+
+    def __len__(self) -> int:
+        return len(self.start_zone)
+
+    def row(self, index: int) -> dict:
+        """프롬프트 CSV용 특성 값 (FEATURE_COLUMNS 순서)"""
+        has_move = bool(self.has_start[index] and self.has_end[index])
+        direction = str(self.direction[index]) if has_move else ""
+        if has_move and self.distance[index] >= LONG_DISTANCE:
+            direction += "+"
+        return {
+            "zone": str(self.start_zone[index]),
+            "end_zone": str(self.end_zone[index]) if has_move else "",
+            "prog": str(int(round(self.progress[index]))) if has_move else "",
+            "dir": direction
+        }
+
+
+def _zone_codes(ax: np.ndarray, ay: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """공격 방향 기준 좌표 -> 구역 코드 배열"""
+    safe_x = np.where(valid, ax, 0.0)
+    safe_y = np.where(valid, ay, 0.0)
+
+    third = THIRD_CODES[np.digitize(safe_x, THIRD_BOUNDARIES)]
+    channel = CHANNEL_CODES[np.digitize(safe_y, CHANNEL_BOUNDARIES)]
+    codes = np.char.add(third, channel).astype(object)
+
+    in_box_width = (safe_y >= BOX_Y_MIN) & (safe_y <= BOX_Y_MAX)
+    codes[in_box_width & (safe_x >= PITCH_LENGTH - BOX_DEPTH)] = OPPONENT_BOX
+    codes[in_box_width & (safe_x <= BOX_DEPTH)] = OWN_BOX
+    codes[~valid] = ""
+    return codes
+
+
+def compute_features(
+    raw_data: List[Union[dict, ActionRecord]],
+    match_info: Union[dict, MatchRecord, None] = None
+) -> SpatialFeatures:
+    """
+    윈도우 전체 액션의 위치 특성을 한 번에 계산
+
+    Args:
+        raw_data: 액션 데이터 리스트 (dict 또는 ActionRecord)
+        match_info: 경기 메타데이터 (홈/원정 공격 방향 판별용)
+
+    Returns:
+        SpatialFeatures
+    """
+    actions = to_actions(raw_data)
+    # 좌표가 없으면(None) NaN
+    coords = np.array(
+        [[a.start_x, a.start_y, a.end_x, a.end_y] for a in actions],
+        dtype=float
+    ).reshape(len(actions), 4)
+    is_home = resolve_home_mask(actions, to_match(match_info))
+
+    # 행동 팀 공격 방향 기준으로 회전 (원정팀은 180도)
+    sx, sy, ex, ey = coords.T
+    ax_start = np.where(is_home, sx, PITCH_LENGTH - sx)
+    ay_start = np.where(is_home, sy, PITCH_WIDTH - sy)
+    ax_end = np.where(is_home, ex, PITCH_LENGTH - ex)
+    ay_end = np.where(is_home, ey, PITCH_WIDTH - ey)
+
+    has_start = ~(np.isnan(sx) | np.isnan(sy))
+    has_end = ~(np.isnan(ex) | np.isnan(ey))
+    has_move = has_start & has_end
+
+    forward = np.where(has_move, ax_end - ax_start, 0.0)
+    lateral = np.where(has_move, ay_end - ay_start, 0.0)
+    distance = np.hypot(forward, lateral)
+
+    longitudinal = np.abs(forward) >= np.abs(lateral)
+    direction = np.select(
+        [
+            distance < MIN_DIRECTION_DISTANCE,
+            longitudinal & (forward > 0),
+            longitudinal,
+            lateral > 0,
+        ],
+        ["S", "F", "B", "L"],
+        default="R"
+    )
+
+    end_zone = _zone_codes(ax_end, ay_end, has_end)
+
+    return SpatialFeatures(
+        start_zone=_zone_codes(ax_start, ay_start, has_start),
+        end_zone=end_zone,
+        progress=forward,
+        distance=distance,
+        direction=direction,
+        in_box=end_zone == OPPONENT_BOX,
+        attacking_third=has_start & (np.where(has_start, ax_start, 0.0) >= THIRD_BOUNDARIES[1]),
+        has_start=has_start,
+        has_end=has_end
+    )
@@ -0,0 +1,134 @@
+"""
+오프라인 프롬프트 토큰 추정
+build_user_prompt 출력의 토큰 수를 RunPod 호출 없이 계산 (프롬프트 형식 비교용)
+
+- transformers가 설치되어 있으면 EXAONE 토크나이저로 정확히 계산
+- 없으면 한글/기타 문자 비율 기반 근사치
+
+Usage: python -m api.services.token_estimator [request.json]
+
+Version: 1.0
+"""
+
+import os
+import math
+from typing import Optional
+
+TOKENIZER_MODEL = os.getenv("TOKENIZER_MODEL", "LGAI-EXAONE/EXAONE-3.5-7.8B-Instruct")
+
+# 근사치 계수 (EXAONE 토크나이저 기준 대략값, 숫자는 한 자리당 1토큰)
+HANGUL_TOKENS_PER_CHAR = 0.8
+OTHER_CHARS_PER_TOKEN = 3.2
+
+_tokenizer = None
+_tokenizer_loaded = False
+
+
+def get_tokenizer():
+    """토크나이저 로드 (transformers 미설치 또는 로드 실패 시 None)"""
+    global _tokenizer, _tokenizer_loaded
+    if not _tokenizer_loaded:
+        _tokenizer_loaded = True
+        try:
+            from transformers import AutoTokenizer
+            _tokenizer = AutoTokenizer.from_pretrained(TOKENIZER_MODEL, trust_remote_code=True)
+        except Exception as e:
+            print(f"[TOKENS] 토크나이저 로드 실패, 근사치 사용: {e}")
+            _tokenizer = None
+    return _tokenizer
+
+
+def heuristic_tokens(text: str) -> int:
+    """문자 종류 기반 토큰 수 근사치"""
+    hangul = sum(1 for ch in text if "가" <= ch <= "힣")
+    digits = sum(1 for ch in text if ch.isdigit())
+    other = sum(1 for ch in text if not ch.isspace()) - hangul - digits
+    return math.ceil(hangul * HANGUL_TOKENS_PER_CHAR + digits + other / OTHER_CHARS_PER_TOKEN)
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트 토큰 수 (토크나이저 우선, 없으면 근사치)"""
+    tokenizer = get_tokenizer()
+    if tokenizer is not None:
+        return len(tokenizer.encode(text, add_special_tokens=False))
+    return heuristic_tokens(text)
+
+
+def estimate_prompt(
+    match_info: dict,
+    raw_data: list,
+    style: str = "CASTER",
+    service=None,
+    **prompt_options
+) -> dict:
+    """
+    요청 1건의 프롬프트 토큰 추정
+
+    Args:
+        match_info: 경기 메타데이터
+        raw_data: 액션 데이터
+        style: 해설 스타일
+        service: RunPodService (없으면 프롬프트 빌더 전용 인스턴스 생성)
+        prompt_options: build_user_prompt 옵션 (예: coord_mode="features")
+
+    Returns:
+        {"systemTokens", "userTokens", "totalTokens", "perActionTokens", "method"}
+    """
+    from .runpod_service import RunPodService, get_system_prompt
+
+    if service is None:
+        service = RunPodService(api_key="offline", endpoint_url="http://offline")
+
+    system_tokens = estimate_tokens(get_system_prompt(style))
+    user_tokens = estimate_tokens(service.build_user_prompt(match_info, raw_data, **prompt_options))
+    return {
+        "systemTokens": system_tokens,
+        "userTokens": user_tokens,
+        "totalTokens": system_tokens + user_tokens,
+        "perActionTokens": round(user_tokens / len(raw_data), 1) if raw_data else 0,
+        "method": "tokenizer" if get_tokenizer() is not None else "heuristic"
+    }
+
+
+def _load_request(path: Optional[str]) -> dict:
+    """요청 JSON 파일 로드 (없으면 system_prompts 예시 액션 사용)"""
+    import json
+
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    sample_action = {
+        "actionId": "0", "periodId": "1", "timeSeconds": "1.033",
+        "typeName": "Pass", "playerNameKo": "이영준", "teamNameKoShort": "김천",
+        "positionName": "CF", "mainPosition": "CF", "resultName": "Successful",
+        "startX": "52.67", "startY": "34.92", "endX": "68.63", "endY": "34.35",
+        "dx": "15.96", "dy": "-0.57"
+    }
+    return {
+        "style": "CASTER",
+        "matchInfo": {"homeTeamNameKoShort": "대구", "awayTeamNameKoShort": "김천"},
+        "rawData": [dict(sample_action, actionId=str(i)) for i in range(10)]
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    from api.services.runpod_service import RunPodService
+
+    request = _load_request(sys.argv[1] if len(sys.argv) > 1 else None)
+    service = RunPodService(api_key="offline", endpoint_url="http://offline")
+
+    print("=" * 60)
+    print(f"프롬프트 토큰 추정 ({len(request['rawData'])}개 액션, {request.get('style', 'CASTER')})")
+    print("=" * 60)
+    for csv_format in ("full", "compact"):
+        for coord_mode in ("raw", "features"):
+            estimate = estimate_prompt(
+                request["matchInfo"], request["rawData"],
+                style=request.get("style", "CASTER"),
+                service=service,
+                coord_mode=coord_mode,
+                csv_format=csv_format
+            )
+            print(f"[{csv_format}/{coord_mode}] {estimate}")
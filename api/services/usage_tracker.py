@@ -0,0 +1,151 @@
+"""
+LLM 토큰 사용량 집계
+Chat Completion 응답의 usage 블록을 스타일 / 경기 / 엔드포인트별로 누적
+
+Version: 1.0
+"""
+
+from typing import Dict, Optional
+
+from .metrics import get_metrics
+
+
+def extract_usage(result: dict) -> Optional[dict]:
+    """
+    OpenAI 형식 응답에서 usage 추출
+
+    Args:
+        result: Chat Completion 응답
+
+    Returns:
+        {"promptTokens", "completionTokens", "totalTokens"} 또는 None
+    """
+    usage = result.get("usage") if isinstance(result, dict) else None
+    if not isinstance(usage, dict):
+        return None
+
+    prompt_tokens = int(usage.get("prompt_tokens") or 0)
+    completion_tokens = int(usage.get("completion_tokens") or 0)
+    total_tokens = int(usage.get("total_tokens") or prompt_tokens + completion_tokens)
+    return {
+        "promptTokens": prompt_tokens,
+        "completionTokens": completion_tokens,
+        "totalTokens": total_tokens
+    }
+
+
+class UsageBucket:
+    """사용량 누적 단위"""
+
+    def __init__(self):
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+
+    def add(self, usage: dict) -> None:
+        self.requests += 1
+        self.prompt_tokens += usage["promptTokens"]
+        self.completion_tokens += usage["completionTokens"]
+        self.total_tokens += usage["totalTokens"]
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "promptTokens": self.prompt_tokens,
+            "completionTokens": self.completion_tokens,
+            "totalTokens": self.total_tokens,
+            "avgPromptTokens": round(self.prompt_tokens / self.requests, 1) if self.requests else 0,
+            "avgCompletionTokens": round(self.completion_tokens / self.requests, 1) if self.requests else 0
+        }
+
+
+class UsageTracker:
+    """스타일 / gameId / 엔드포인트별 토큰 사용량 집계"""
+
+    DIMENSIONS = ("style", "game", "endpoint")
+
+    def __init__(self):
+        self._total = UsageBucket()
+        self._buckets: Dict[str, Dict[str, UsageBucket]] = {
+            dimension: {} for dimension in self.DIMENSIONS
+        }
+        # 프롬프트 형식(variant)별 응답 품질: {variant: {"ok", "parse_error", "count_mismatch"}}
+        self._outcomes: Dict[str, Dict[str, int]] = {}
+
+    def _bucket(self, dimension: str, key: str) -> UsageBucket:
+        buckets = self._buckets.setdefault(dimension, {})
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = UsageBucket()
+        return bucket
+
+    def record(
+        self,
+        usage: dict,
+        style: str,
+        game_id: str,
+        endpoint: str,
+        **extra_dimensions: str
+    ) -> None:
+        """
+        사용량 기록
+
+        Args:
+            usage: extract_usage() 결과
+            style: 해설 스타일
+            game_id: 경기 ID
+            endpoint: RunPod 엔드포인트 이름
+            extra_dimensions: 추가 집계 기준 (예: variant="compact")
+        """
+        self._total.add(usage)
+        self._bucket("style", style).add(usage)
+        self._bucket("game", game_id).add(usage)
+        self._bucket("endpoint", endpoint).add(usage)
+        for dimension, key in extra_dimensions.items():
+            self._bucket(dimension, key).add(usage)
+
+        metrics = get_metrics()
+        metrics.incr("llm_prompt_tokens_total", usage["promptTokens"], style=style, endpoint=endpoint)
+        metrics.incr("llm_completion_tokens_total", usage["completionTokens"], style=style, endpoint=endpoint)
+        metrics.observe("llm_prompt_tokens", usage["promptTokens"], style=style)
+        metrics.observe("llm_completion_tokens", usage["completionTokens"], style=style)
+
+    def record_outcome(self, variant: str, outcome: str) -> None:
+        """
+        프롬프트 형식별 응답 품질 기록 (A/B 비교용)
+
+        Args:
+            variant: 프롬프트 형식 (예: "full", "compact")
+            outcome: "ok", "parse_error", "count_mismatch"
+        """
+        counts = self._outcomes.setdefault(
+            variant, {"ok": 0, "parse_error": 0, "count_mismatch": 0}
+        )
+        counts[outcome] = counts.get(outcome, 0) + 1
+        get_metrics().incr("llm_responses_total", variant=variant, outcome=outcome)
+
+    def game_usage(self, game_id: str) -> Optional[dict]:
+        """경기별 사용량"""
+        bucket = self._buckets["game"].get(game_id)
+        return bucket.to_dict() if bucket else None
+
+    def snapshot(self) -> dict:
+        """전체 집계"""
+        result = {"total": self._total.to_dict()}
+        for dimension, buckets in self._buckets.items():
+            result[dimension] = {key: bucket.to_dict() for key, bucket in buckets.items()}
+        result["outcomes"] = {variant: dict(counts) for variant, counts in self._outcomes.items()}
+        return result
+
+
+# 싱글톤 인스턴스
+_usage_tracker: Optional[UsageTracker] = None
+
+
+def get_usage_tracker() -> UsageTracker:
+    """UsageTracker 인스턴스 반환"""
+    global _usage_tracker
+    if _usage_tracker is None:
+        _usage_tracker = UsageTracker()
+    return _usage_tracker
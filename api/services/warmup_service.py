@@ -0,0 +1,237 @@
+"""
+RunPod Serverless 웜 유지 스케줄러
+경기 일정(또는 최근 gameId 트래픽) 기준으로 활성 구간에만 keep-alive 요청 전송
+
+Version: 1.0
+"""
+
+import os
+import json
+import time
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from .metrics import get_metrics
+
+# 웜 유지 설정
+RUNPOD_WARMUP_ENABLED = os.getenv("RUNPOD_WARMUP_ENABLED", "false").lower() == "true"
+# 경기 일정: JSON 파일 경로 또는 JSON 문자열
+# 예: [{"gameId": "126288", "kickoff": "2024-03-03 14:00:00"}]
+RUNPOD_WARMUP_SCHEDULE = os.getenv("RUNPOD_WARMUP_SCHEDULE", "")
+RUNPOD_WARMUP_INTERVAL = float(os.getenv("RUNPOD_WARMUP_INTERVAL", "60"))
+RUNPOD_WARMUP_IDLE_MAX_INTERVAL = float(os.getenv("RUNPOD_WARMUP_IDLE_MAX_INTERVAL", "900"))
+RUNPOD_WARMUP_ACTIVITY_WINDOW = float(os.getenv("RUNPOD_WARMUP_ACTIVITY_WINDOW", "600"))
+RUNPOD_WARMUP_COLD_THRESHOLD = float(os.getenv("RUNPOD_WARMUP_COLD_THRESHOLD", "10"))
+
+# 킥오프 전 웜업 시작 / 킥오프 후 활성 유지 시간 (분)
+WARMUP_LEAD_MINUTES = 15
+MATCH_DURATION_MINUTES = 130
+
+
+class MatchWindow:
+    """웜 유지 대상 경기 구간"""
+
+    def __init__(self, game_id: str, start: datetime, end: datetime):
+        self.game_id = game_id
+        self.start = start
+        self.end = end
+
+    @classmethod
+    def from_dict(cls, item: dict) -> "MatchWindow":
+        """
+        일정 항목 파싱
+
+        Args:
+            item: {"gameId", "kickoff"} 또는 {"gameId", "start", "end"}
+                  (kickoff는 matchInfo.gameDate와 같은 "YYYY-MM-DD HH:MM:SS" 형식)
+        """
+        game_id = str(item.get("gameId", item.get("game_id", "")))
+        if "start" in item and "end" in item:
+            start = datetime.fromisoformat(str(item["start"]))
+            end = datetime.fromisoformat(str(item["end"]))
+        else:
+            kickoff = datetime.fromisoformat(str(item.get("kickoff", item.get("gameDate"))))
+            start = kickoff - timedelta(minutes=WARMUP_LEAD_MINUTES)
+            end = kickoff + timedelta(minutes=MATCH_DURATION_MINUTES)
+        return cls(game_id, start, end)
+
+    def to_dict(self) -> dict:
+        return {
+            "gameId": self.game_id,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat()
+        }
+
+
+def load_schedule(source: str) -> List[MatchWindow]:
+    """
+    경기 일정 로드
+
+    Args:
+        source: JSON 파일 경로 또는 JSON 문자열
+
+    Returns:
+        MatchWindow 리스트
+    """
+    if not source:
+        return []
+    try:
+        if os.path.isfile(source):
+            with open(source, "r", encoding="utf-8") as f:
+                items = json.load(f)
+        else:
+            items = json.loads(source)
+        return [MatchWindow.from_dict(item) for item in items]
+    except Exception as e:
+        print(f"[WARMUP] 경기 일정 로드 실패: {e}")
+        return []
+
+
+class WarmupScheduler:
+    """
+    RunPod 웜 유지 스케줄러
+
+    - 활성 구간(일정 또는 최근 트래픽): interval마다 keep-alive 전송
+    - 비활성 구간: keep-alive 없이 확인 주기를 idle_max_interval까지 지수 증가
+    """
+
+    def __init__(
+        self,
+        schedule: Optional[List[MatchWindow]] = None,
+        interval: float = RUNPOD_WARMUP_INTERVAL,
+        idle_max_interval: float = RUNPOD_WARMUP_IDLE_MAX_INTERVAL,
+        activity_window: float = RUNPOD_WARMUP_ACTIVITY_WINDOW,
+        cold_threshold: float = RUNPOD_WARMUP_COLD_THRESHOLD
+    ):
+        self.schedule: List[MatchWindow] = schedule or []
+        self.interval = interval
+        self.idle_max_interval = idle_max_interval
+        self.activity_window = activity_window
+        self.cold_threshold = cold_threshold
+
+        self._recent_games: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._idle_sleep = interval
+
+    def set_schedule(self, schedule: List[MatchWindow]) -> None:
+        """경기 일정 교체 (즉시 재평가)"""
+        self.schedule = schedule
+        self._wakeup.set()
+
+    def note_activity(self, game_id: str) -> None:
+        """gameId 트래픽 기록 (해설 요청 수신 시 호출, 비활성 -> 활성 전환 시 즉시 재평가)"""
+        now = time.monotonic()
+        last_seen = self._recent_games.get(game_id)
+        self._recent_games[game_id] = now
+        if last_seen is None or last_seen < now - self.activity_window:
+            self._wakeup.set()
+
+    def active_games(self) -> List[str]:
+        """현재 활성 경기 목록 (일정 + 최근 트래픽)"""
+        now = datetime.now()
+        active = {w.game_id for w in self.schedule if w.start <= now <= w.end}
+
+        cutoff = time.monotonic() - self.activity_window
+        for game_id, last_seen in list(self._recent_games.items()):
+            if last_seen >= cutoff:
+                active.add(game_id)
+            else:
+                del self._recent_games[game_id]
+
+        return sorted(active)
+
+    def _seconds_until_next_window(self) -> Optional[float]:
+        """다음 일정 시작까지 남은 시간 (초)"""
+        now = datetime.now()
+        upcoming = [w.start for w in self.schedule if w.start > now]
+        if not upcoming:
+            return None
+        return (min(upcoming) - now).total_seconds()
+
+    def start(self) -> None:
+        """스케줄러 시작 (lifespan에서 호출)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            print(f"[WARMUP] 웜 유지 스케줄러 시작 (일정 {len(self.schedule)}개)")
+
+    async def stop(self) -> None:
+        """스케줄러 종료"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            # 상태 평가 전에 초기화 (keep-alive 중 set_schedule / note_activity 호출 보존)
+            self._wakeup.clear()
+            active = self.active_games()
+            get_metrics().set_gauge("warmup_active_games", len(active))
+
+            if active:
+                self._idle_sleep = self.interval
+                await self._ping()
+                sleep_for = self.interval
+            else:
+                # 비활성: 확인 주기 지수 증가 (다음 일정 시작 전에는 깨어남)
+                sleep_for = self._idle_sleep
+                self._idle_sleep = min(self._idle_sleep * 2, self.idle_max_interval)
+                until_next = self._seconds_until_next_window()
+                if until_next is not None:
+                    sleep_for = min(sleep_for, max(1.0, until_next))
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=sleep_for)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _ping(self) -> None:
+        """keep-alive 요청 전송 및 엔드포인트별 응답 시간 기록"""
+        from .runpod_service import get_runpod_service
+
+        metrics = get_metrics()
+        try:
+            results = await get_runpod_service().warm_ping()
+        except Exception as e:
+            metrics.incr("warmup_ping_errors_total")
+            print(f"[WARMUP] keep-alive 실패: {e}")
+            return
+
+        for endpoint_name, latency in results.items():
+            if isinstance(latency, BaseException):
+                metrics.incr("warmup_ping_errors_total", endpoint=endpoint_name)
+                print(f"[WARMUP] {endpoint_name} keep-alive 실패: {latency}")
+                continue
+
+            metrics.observe("warmup_ping_seconds", latency, endpoint=endpoint_name)
+            if latency >= self.cold_threshold:
+                metrics.incr("runpod_cold_starts_total", endpoint=endpoint_name)
+                metrics.observe("runpod_cold_start_seconds", latency, endpoint=endpoint_name)
+                print(f"[WARMUP] {endpoint_name} 콜드 스타트 감지: {latency:.1f}s")
+
+    def snapshot(self) -> dict:
+        """상태 요약"""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "activeGames": self.active_games(),
+            "schedule": [w.to_dict() for w in self.schedule],
+            "interval": self.interval,
+            "idleMaxInterval": self.idle_max_interval
+        }
+
+
+# 싱글톤 인스턴스
+_warmup_scheduler: Optional[WarmupScheduler] = None
+
+
+def get_warmup_scheduler() -> WarmupScheduler:
+    """WarmupScheduler 인스턴스 반환"""
+    global _warmup_scheduler
+    if _warmup_scheduler is None:
+        _warmup_scheduler = WarmupScheduler(schedule=load_schedule(RUNPOD_WARMUP_SCHEDULE))
+    return _warmup_scheduler
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트에서 `pytest`로 실행해도 api 패키지를 찾을 수 있도록
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+from api.models.records import ActionRecord
+from api.services import action_cache
+from api.services.action_cache import ActionCache
+
+
+def _actions(*action_ids):
+    return [ActionRecord.from_dict({"actionId": action_id}) for action_id in action_ids]
+
+
+@pytest.mark.skipif("ACTION_CACHE_ENABLED" in os.environ, reason="ACTION_CACHE_ENABLED 설정됨")
+def test_disabled_by_default():
+    cache = ActionCache()
+    assert action_cache.ACTION_CACHE_ENABLED is False
+
+    cache.store("g1", "CASTER", [{"actionId": "1", "description": "a"}])
+    assert len(cache) == 0
+    assert cache.lookup("g1", "CASTER", _actions("1")) == [None]
+
+
+def test_enabled_cache_reuses_overlapping_actions():
+    cache = ActionCache(max_entries=2, enabled=True)
+    cache.store("g1", "CASTER", [{"actionId": "1", "description": "a"}, {"actionId": "2", "description": "b"}])
+
+    assert [hit and hit["description"] for hit in cache.lookup("g1", "CASTER", _actions("2", "3"))] == ["b", None]
+    assert cache.lookup("g1", "ANALYST", _actions("1")) == [None]
+
+    # 최근 조회한 "2"는 유지, 가장 오래된 "1"이 밀려남
+    cache.store("g1", "CASTER", [{"actionId": "3", "description": "c"}])
+    assert [hit is not None for hit in cache.lookup("g1", "CASTER", _actions("1", "2", "3"))] == [False, True, True]
@@ -0,0 +1,57 @@
+import time
+
+from api.services.circuit_breaker import BreakerState, CircuitBreaker
+from api.services.endpoint_pool import Endpoint, EndpointPool
+
+
+def _pool():
+    endpoints = [
+        Endpoint(name, f"https://{name}/v1/chat/completions", "key",
+                 CircuitBreaker(failure_threshold=1, latency_slo=0, reset_timeout=30))
+        for name in ("a", "b")
+    ]
+    return EndpointPool(endpoints), endpoints
+
+
+def _reopen(endpoint):
+    """OPEN 유지 시간이 지난 것처럼 되돌림 -> 다음 상태 조회에서 HALF_OPEN"""
+    endpoint.breaker._opened_at = time.monotonic() - 31
+
+
+def test_ejected_endpoint_is_probed_while_another_is_healthy():
+    pool, (a, b) = _pool()
+    pool.record_failure(a)
+    assert a.breaker.state == BreakerState.OPEN
+    assert {pool.select().name for _ in range(20)} == {"b"}
+
+    _reopen(a)
+    # 정상 엔드포인트(b)가 있어도 probe 1건은 a로
+    assert pool.select() is a
+    # probe 진행 중에는 다른 요청은 b로
+    assert {pool.select().name for _ in range(20)} == {"b"}
+
+    pool.record_success(a, 0.5)
+    assert a.breaker.state == BreakerState.CLOSED
+    # 다시 정상 엔드포인트로 선택 대상에 포함
+    assert pool.select(exclude=[b]) is a
+
+
+def test_failed_probe_reopens_endpoint():
+    pool, (a, b) = _pool()
+    pool.record_failure(a)
+    _reopen(a)
+
+    assert pool.select() is a
+    pool.record_failure(a)
+
+    assert a.breaker.state == BreakerState.OPEN
+    assert pool.select() is b
+
+
+def test_hedge_exclusion_skips_probe_candidate():
+    pool, (a, b) = _pool()
+    pool.record_failure(a)
+    _reopen(a)
+
+    assert pool.select(exclude=[a]) is b
+    assert pool.select(exclude=[b]) is a
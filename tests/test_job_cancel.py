@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+from starlette.requests import Request
+
+from api.routers import commentary
+from api.services import job_tasks
+from api.services.job_store import JobStatus, JobStore
+from api.services.job_tasks import JobTaskRegistry
+
+
+class FakeRunPodService:
+    def __init__(self):
+        self.cancelled_remote = []
+
+    async def cancel_remote(self, job):
+        self.cancelled_remote.append(job.remote_job_id)
+        return True
+
+
+@pytest.fixture
+def env(monkeypatch):
+    """작업 저장소 / 태스크 레지스트리 / RunPod / 웹훅을 테스트용으로 교체"""
+    store = JobStore()
+    runpod = FakeRunPodService()
+    webhooks = []
+
+    async def send_webhook(**kwargs):
+        webhooks.append(kwargs)
+        return True
+
+    def use_registry(policy):
+        registry = JobTaskRegistry(supersede_policy=policy, cancel_wait=1)
+        monkeypatch.setattr(commentary, "get_job_tasks", lambda: registry)
+        return registry
+
+    monkeypatch.setattr(commentary, "get_job_store", lambda: store)
+    monkeypatch.setattr(job_tasks, "get_job_store", lambda: store)
+    monkeypatch.setattr(commentary, "get_runpod_service", lambda: runpod)
+    monkeypatch.setattr(commentary, "send_webhook", send_webhook)
+    return store, runpod, webhooks, use_registry
+
+
+async def _start_running(store, registry, window_end, remote_id=None, dispatched=True):
+    """RunPod 응답을 기다리는 작업 (취소되면 cancelled에 기록)"""
+    job_id = await store.create_job("g1", "CASTER", window_end=window_end)
+    job = await store.get_job(job_id)
+    started = asyncio.Event()
+    cancelled = []
+
+    async def task():
+        if dispatched:
+            job.mark("dispatched")
+        job.remote_job_id = remote_id
+        started.set()
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.append(job_id)
+            raise
+
+    registry.start(job_id, "g1", "CASTER", task())
+    await started.wait()
+    return job_id, cancelled
+
+
+def _delete_request(job_id):
+    return Request({"type": "http", "method": "DELETE", "path": f"/ai/commentary/jobs/{job_id}", "headers": []})
+
+
+def test_delete_cancels_running_job_and_remote_job(env):
+    store, runpod, webhooks, use_registry = env
+
+    async def scenario():
+        registry = use_registry("off")
+        job_id, cancelled = await _start_running(store, registry, (1, 600.0), remote_id="remote-1")
+        job = await store.get_job(job_id)
+
+        result = await commentary.delete_job(job_id, _delete_request(job_id))
+
+        assert result == {"message": f"Job {job_id} 삭제 완료", "cancelled": True}
+        assert cancelled == [job_id]
+        assert not registry.is_running(job_id)
+        assert job.status == JobStatus.ERROR and job.error_code == "CANCELLED"
+        assert runpod.cancelled_remote == ["remote-1"]
+        assert await store.get_job(job_id) is None
+        assert registry.snapshot()["cancelled"] == {"deleted": 1}
+
+    asyncio.run(scenario())
+    assert webhooks == []
+
+
+def test_delete_without_remote_job_skips_remote_cancel(env):
+    store, runpod, _, use_registry = env
+
+    async def scenario():
+        registry = use_registry("off")
+        job_id, cancelled = await _start_running(store, registry, None)
+
+        result = await commentary.delete_job(job_id, _delete_request(job_id))
+
+        assert result["cancelled"] is True
+        assert cancelled == [job_id]
+        assert runpod.cancelled_remote == []
+
+    asyncio.run(scenario())
+
+
+def test_new_window_supersedes_older_running_job(env):
+    store, runpod, webhooks, use_registry = env
+
+    async def scenario():
+        registry = use_registry("all")
+        older_id, cancelled = await _start_running(store, registry, (1, 600.0), remote_id="remote-old")
+        other_style = await store.create_job("g1", "ANALYST", window_end=(1, 500.0))
+        newer_id = await store.create_job("g1", "CASTER", window_end=(1, 630.0))
+
+        await commentary._supersede_jobs([newer_id])
+        await asyncio.gather(*commentary._webhook_tasks)
+
+        older = await store.get_job(older_id)
+        assert cancelled == [older_id]
+        assert older.status == JobStatus.ERROR and older.error_code == "SUPERSEDED"
+        assert runpod.cancelled_remote == ["remote-old"]
+        assert [(w["job_id"], w["error_code"]) for w in webhooks] == [(older_id, "SUPERSEDED")]
+        assert (await store.get_job(newer_id)).status == JobStatus.PENDING
+        assert (await store.get_job(other_style)).status == JobStatus.PENDING
+
+    asyncio.run(scenario())
+
+
+def test_queued_policy_keeps_dispatched_job_and_late_window(env):
+    store, runpod, webhooks, use_registry = env
+
+    async def scenario():
+        registry = use_registry("queued")
+        running_id, running_cancelled = await _start_running(store, registry, (1, 600.0))
+        queued_id, queued_cancelled = await _start_running(store, registry, (1, 610.0), dispatched=False)
+        # 순서가 바뀌어 도착한 윈도우 (마지막 액션이 더 늦음)는 대체하지 않음
+        late_id, late_cancelled = await _start_running(store, registry, (2, 10.0), dispatched=False)
+        newer_id = await store.create_job("g1", "CASTER", window_end=(1, 640.0))
+
+        await commentary._supersede_jobs([newer_id])
+        await asyncio.gather(*commentary._webhook_tasks)
+
+        assert queued_cancelled == [queued_id]
+        assert (await store.get_job(queued_id)).error_code == "SUPERSEDED"
+        assert running_cancelled == [] and late_cancelled == []
+        assert registry.is_running(running_id) and registry.is_running(late_id)
+        assert [w["job_id"] for w in webhooks] == [queued_id]
+
+        for job_id in (running_id, late_id):
+            await registry.cancel(job_id, "test")
+
+    asyncio.run(scenario())
+    assert runpod.cancelled_remote == []
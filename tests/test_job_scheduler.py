@@ -0,0 +1,130 @@
+import asyncio
+import time
+
+from api.services.job_scheduler import JobScheduler
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_live_uses_reserved_slots_while_bulk_waits():
+    async def scenario():
+        scheduler = JobScheduler(max_concurrency=3, live_reserved_slots=1)
+        assert await scheduler.acquire("BULK")
+        assert await scheduler.acquire("BULK")
+
+        # 예약분을 제외한 슬롯(2개)이 모두 사용 중 -> BULK 대기
+        bulk = asyncio.create_task(scheduler.acquire("BULK"))
+        await _settle()
+        assert not bulk.done()
+
+        # LIVE는 예약 슬롯 사용
+        assert await asyncio.wait_for(scheduler.acquire("LIVE"), timeout=1)
+        assert scheduler.running == 3
+        assert scheduler.snapshot()["classes"]["BULK"]["queued"] == 1
+
+        # LIVE가 슬롯을 반환해도 BULK는 예약분을 쓰지 못함
+        scheduler.release()
+        await _settle()
+        assert not bulk.done()
+
+        # 일반 슬롯이 반환되면 배정
+        scheduler.release()
+        assert await asyncio.wait_for(bulk, timeout=1)
+        assert scheduler.running == 2
+
+    asyncio.run(scenario())
+
+
+def test_queued_live_dispatches_before_earlier_bulk():
+    async def scenario():
+        scheduler = JobScheduler(max_concurrency=2, live_reserved_slots=0)
+        order = []
+
+        async def job(name, priority):
+            assert await scheduler.acquire(priority)
+            order.append(name)
+
+        assert await scheduler.acquire("NORMAL")
+        assert await scheduler.acquire("NORMAL")
+        tasks = [asyncio.create_task(job("bulk", "BULK")), asyncio.create_task(job("live", "LIVE"))]
+        await _settle()
+
+        scheduler.release()
+        scheduler.release()
+        await asyncio.gather(*tasks)
+        assert order == ["live", "bulk"]
+
+    asyncio.run(scenario())
+
+
+def test_earliest_deadline_first_within_priority():
+    async def scenario():
+        scheduler = JobScheduler(max_concurrency=1, live_reserved_slots=0)
+        assert await scheduler.acquire("NORMAL")
+
+        now = time.monotonic()
+        order = []
+
+        async def job(name, deadline):
+            assert await scheduler.acquire("NORMAL", deadline)
+            order.append(name)
+            scheduler.release()
+
+        # 도착 순서와 반대로 마감 시간이 빠른 작업부터
+        tasks = [
+            asyncio.create_task(job("none", None)),
+            asyncio.create_task(job("late", now + 30)),
+            asyncio.create_task(job("early", now + 10)),
+            asyncio.create_task(job("late-2", now + 30)),
+        ]
+        await _settle()
+
+        scheduler.release()
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        assert order == ["early", "late", "late-2", "none"]
+
+    asyncio.run(scenario())
+
+
+def test_expired_while_waiting_returns_false():
+    async def scenario():
+        scheduler = JobScheduler(max_concurrency=1, live_reserved_slots=0)
+        assert await scheduler.acquire("NORMAL")
+
+        assert await scheduler.acquire("NORMAL", time.monotonic() + 0.05) is False
+        assert scheduler.snapshot()["classes"]["NORMAL"]["expired"] == 1
+        assert scheduler.queue_stats() == (0, 0.0)
+
+    asyncio.run(scenario())
+
+
+def test_queue_stats_reports_oldest_waiting_job():
+    async def scenario():
+        scheduler = JobScheduler(max_concurrency=1, live_reserved_slots=0)
+        assert scheduler.queue_stats() == (0, 0.0)
+        assert await scheduler.acquire("NORMAL")
+
+        first = asyncio.create_task(scheduler.acquire("BULK"))
+        await asyncio.sleep(0.1)
+        second = asyncio.create_task(scheduler.acquire("LIVE"))
+        await _settle()
+
+        count, oldest = scheduler.queue_stats()
+        assert count == 2
+        assert 0.1 <= oldest < 1
+
+        # 취소된 대기 작업은 제외
+        first.cancel()
+        await _settle()
+        count, oldest = scheduler.queue_stats()
+        assert count == 1
+        assert oldest < 0.1
+
+        scheduler.release()
+        assert await second
+        assert scheduler.queue_stats() == (0, 0.0)
+
+    asyncio.run(scenario())
@@ -0,0 +1,53 @@
+import pytest
+
+from api.services.rule_commentary import classify_result, generate_rule_scripts
+
+MATCH = {"homeTeamNameKoShort": "울산", "awayTeamNameKoShort": "포항"}
+
+
+def _action(type_name, result_name="Successful", team="울산", **coords):
+    return {
+        "actionId": 1, "timeSeconds": 10, "typeName": type_name, "resultName": result_name,
+        "playerNameKo": "김민수", "teamNameKoShort": team, **coords
+    }
+
+
+@pytest.mark.parametrize("result_name, expected", [
+    ("", "success"),
+    ("Successful", "success"),
+    ("Unsuccessful", "fail"),
+    ("Goal", "goal"),
+    ("Own Goal", "own_goal"),
+    ("own_goal", "own_goal"),
+    ("On Target", "on_target"),
+    ("Off Target", "fail"),
+])
+def test_classify_result(result_name, expected):
+    assert classify_result(result_name) == expected
+
+
+@pytest.mark.parametrize("team, scorer", [("울산", "포항이"), ("포항", "울산이"), ("", "상대 팀이")])
+def test_own_goal_is_opponent_scoring(team, scorer):
+    for type_name in ("Clearance", "Pass", "Shot"):
+        script = generate_rule_scripts([_action(type_name, "Own Goal", team)], MATCH, "CASTER")[0]
+
+        assert script["tone"] == "SAD"
+        assert "자책골" in script["description"]
+        assert f"{scorer} 득점합니다" in script["description"]
+
+
+def test_calm_tone_ends_without_exclamation():
+    # 자기 진영 빌드업 패스 -> CALM
+    action = _action("Pass", startX=20, startY=34, endX=35, endY=34)
+    for style in ("CASTER", "FRIEND"):
+        script = generate_rule_scripts([action], MATCH, style)[0]
+        assert script["tone"] == "CALM"
+        assert script["description"].endswith(".") and "!" not in script["description"]
+
+
+def test_excited_tone_keeps_exclamation():
+    action = _action("Shot", "Goal", startX=95, startY=34)
+    script = generate_rule_scripts([action], MATCH, "CASTER")[0]
+
+    assert script["tone"] == "EXCITED"
+    assert script["description"].endswith("!")
@@ -0,0 +1,63 @@
+import json
+import threading
+
+from api.services.runpod_async import AsyncJobJournal
+from api.services.sharding import ShardRouter
+
+
+def _submitted(job_id):
+    return {"event": "submitted", "jobId": job_id, "remoteJobId": f"r-{job_id}", "endpoint": "primary", "request": {}}
+
+
+def test_shared_file_keeps_appends_during_compaction(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    # 워커 두 개가 같은 파일을 쓰는 상황 (인스턴스마다 프로세스 내 잠금이 따로 있음)
+    writer = AsyncJobJournal(path)
+    compactor = AsyncJobJournal(path)
+    job_ids = [f"job_{i:04d}" for i in range(300)]
+
+    def append_all():
+        for job_id in job_ids:
+            writer._append(_submitted(job_id))
+
+    def compact_repeatedly():
+        for _ in range(50):
+            compactor.load_unfinished()
+
+    threads = [threading.Thread(target=append_all), threading.Thread(target=compact_repeatedly)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [entry["jobId"] for entry in compactor.load_unfinished()] == job_ids
+    assert not [name for name in tmp_path.iterdir() if name.suffix == ".tmp"]
+
+
+def test_finished_entries_are_dropped(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    journal = AsyncJobJournal(path)
+    journal._append(_submitted("job_a"))
+    journal._append(_submitted("job_b"))
+    journal._append({"event": "finished", "jobId": "job_a"})
+
+    assert [entry["jobId"] for entry in journal.load_unfinished()] == ["job_b"]
+    with open(path, encoding="utf-8") as f:
+        assert [json.loads(line)["jobId"] for line in f] == ["job_b"]
+
+
+def test_each_worker_resumes_only_its_own_shard(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    routers = [ShardRouter(shard_count=2, socket_dir=str(tmp_path / "shards")) for _ in range(2)]
+    job_ids = [router.next_job_id() for router in routers]
+    journal = AsyncJobJournal(path)
+    for job_id in job_ids:
+        journal._append(_submitted(job_id))
+    journal._append(_submitted("job_82f395"))  # 이전 형식 Job ID -> 샤드 0
+
+    resumed = [
+        [entry["jobId"] for entry in AsyncJobJournal(path).load_unfinished(router.issued_here)]
+        for router in routers
+    ]
+
+    assert resumed == [[job_ids[0], "job_82f395"], [job_ids[1]]]
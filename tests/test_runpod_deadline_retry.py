@@ -0,0 +1,79 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from api.services import runpod_service
+from api.services.action_cache import ActionCache
+from api.services.endpoint_pool import Endpoint
+from api.services.job_store import JobData
+from api.services.runpod_async import AsyncJobJournal
+from api.services.runpod_service import RunPodService
+
+ACTIONS = [{"actionId": "1", "timeSeconds": "10", "typeName": "Pass", "playerNameKo": "김민수"}]
+SCRIPT = [{"actionId": "1", "timeSeconds": "10", "tone": "CALM", "description": "LLM"}]
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    """비동기 모드 서비스: 첫 요청은 학습한 마감 시간을 넘기고, 재시도는 바로 응답"""
+    journal = AsyncJobJournal(str(tmp_path / "journal.jsonl"))
+    monkeypatch.setattr(runpod_service, "get_async_poller", lambda: SimpleNamespace(journal=journal))
+    monkeypatch.setattr(runpod_service, "get_action_cache", lambda: ActionCache(enabled=False))
+    monkeypatch.setattr(RunPodService, "_request_deadline", staticmethod(lambda *args, **kwargs: (0.1, True)))
+
+    def build(names):
+        endpoints = [Endpoint(name, f"https://api.runpod.ai/v2/{name}/openai/v1/chat/completions", "key") for name in names]
+        service = RunPodService(endpoints=endpoints)
+        service.call_mode = "async"
+        submitted = []
+
+        async def post(endpoint, payload, deadline, job=None, style=None, count=None):
+            # _post_async와 같이 제출 직후 저널 기록
+            remote_id = f"remote-{len(submitted)}"
+            submitted.append(remote_id)
+            job.remote_job_id = remote_id
+            job.remote_endpoint = endpoint.name
+            await journal.record_submitted(job.job_id, remote_id, endpoint.name, {"gameId": job.game_id})
+            if len(submitted) == 1:
+                raise asyncio.TimeoutError()
+            return endpoint, {"choices": [{"message": {"content": json.dumps(SCRIPT)}}]}
+
+        monkeypatch.setattr(service, "_post", post)
+        return service, submitted
+
+    return journal, build
+
+
+async def _run_job(service, journal):
+    """라우터(generate_commentary_task)와 같이 원격 작업이 남아 있으면 완료 기록"""
+    job = JobData("g1", "CASTER")
+    job.job_id = "job_0000000000000001"
+    scripts = await service.call_llm("CASTER", {}, ACTIONS, timeout=60, job=job)
+    if job.remote_job_id:
+        await journal.record_finished(job.job_id)
+    return job, scripts
+
+
+def test_timed_out_submission_is_not_resumed_after_retry(setup, tmp_path):
+    journal, build = setup
+    service, submitted = build(["a", "b"])
+
+    job, scripts = asyncio.run(_run_job(service, journal))
+
+    assert submitted == ["remote-0", "remote-1"]
+    assert job.remote_job_id == "remote-1" and scripts[0]["description"] == "LLM"
+    # 재시작: 새 저널 인스턴스로 재개 대상 조회
+    assert AsyncJobJournal(journal.path).load_unfinished() == []
+
+
+def test_timed_out_submission_is_not_resumed_after_fallback(setup):
+    journal, build = setup
+    service, submitted = build(["a"])
+
+    job, scripts = asyncio.run(_run_job(service, journal))
+
+    assert submitted == ["remote-0"]
+    assert job.remote_job_id is None and scripts[0]["description"] != "LLM"
+    assert AsyncJobJournal(journal.path).load_unfinished() == []
@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+import pytest
+
+from api.services import runpod_service
+from api.services.endpoint_pool import Endpoint
+from api.services.runpod_service import RunPodService
+
+COMPLETION = {"choices": [{"message": {"content": "[]"}}]}
+
+
+def _service(monkeypatch, delays):
+    """엔드포인트별 응답 지연(초)을 흉내 내는 MockTransport로 요청하는 서비스 (헤지 대기 0.05초)"""
+    requests = []
+
+    async def handler(request):
+        name = request.url.host
+        requests.append(name)
+        await asyncio.sleep(delays[name])
+        return httpx.Response(200, json=COMPLETION)
+
+    real_client = httpx.AsyncClient
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(runpod_service.httpx, "AsyncClient", client)
+    endpoints = [Endpoint(name, f"https://{name}/v1/chat/completions", "key") for name in delays]
+    service = RunPodService(endpoints=endpoints)
+    service.call_mode = "sync"
+    service.hedge_enabled = True
+    monkeypatch.setattr(service, "_hedge_delay", lambda *args: 0.05)
+    return service, requests
+
+
+def _failures(service):
+    return {endpoint.name: endpoint.total_failures for endpoint in service.pool.endpoints}
+
+
+def test_single_endpoint_is_not_hedged_to_itself(monkeypatch):
+    service, requests = _service(monkeypatch, {"a": 0.2})
+    endpoint = service.pool.endpoints[0]
+
+    responded, result = asyncio.run(service._post(endpoint, {}, deadline=2))
+
+    assert responded is endpoint and result == COMPLETION
+    assert requests == ["a"]
+
+
+def test_hedge_goes_to_another_endpoint(monkeypatch):
+    service, requests = _service(monkeypatch, {"a": 1.0, "b": 0.0})
+    primary = service.pool.get("a")
+
+    responded, _ = asyncio.run(service._post(primary, {}, deadline=2))
+
+    assert responded.name == "b"
+    assert requests == ["a", "b"]
+    assert _failures(service) == {"a": 0, "b": 0}
+
+
+def test_deadline_records_failure_for_every_cancelled_endpoint(monkeypatch):
+    service, requests = _service(monkeypatch, {"a": 5.0, "b": 5.0})
+    primary = service.pool.get("a")
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(service._post(primary, {}, deadline=0.3))
+
+    assert requests == ["a", "b"]
+    assert _failures(service) == {"a": 1, "b": 1}
+
+
+def test_deadline_without_hedge_records_only_primary(monkeypatch):
+    service, requests = _service(monkeypatch, {"a": 5.0})
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(service._post(service.pool.endpoints[0], {}, deadline=0.3))
+
+    assert requests == ["a"]
+    assert _failures(service) == {"a": 1}
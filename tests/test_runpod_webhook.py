@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from api.routers import commentary
+from api.services.runpod_async import AsyncJobJournal, RunPodAsyncPoller
+
+
+def _receive(token):
+    return asyncio.run(commentary.receive_runpod_webhook({"id": "r-1", "status": "COMPLETED"}, token=token))
+
+
+def test_webhook_rejected_without_configured_token(monkeypatch):
+    monkeypatch.setattr(commentary, "RUNPOD_WEBHOOK_TOKEN", "")
+
+    for token in (None, "", "anything"):
+        with pytest.raises(HTTPException) as exc:
+            _receive(token)
+        assert exc.value.status_code == 403
+        assert exc.value.detail["errorCode"] == "WEBHOOK_DISABLED"
+
+
+def test_webhook_token_must_match(monkeypatch):
+    monkeypatch.setattr(commentary, "RUNPOD_WEBHOOK_TOKEN", "secret")
+
+    for token in (None, "wrong"):
+        with pytest.raises(HTTPException) as exc:
+            _receive(token)
+        assert exc.value.status_code == 401
+
+    assert _receive("secret") == {"id": "r-1", "delivered": False}
+
+
+def test_poller_disables_webhook_without_token():
+    journal = AsyncJobJournal("")
+    url = "https://example.com/ai/commentary/runpod/webhook?token=x"
+
+    assert RunPodAsyncPoller(webhook_url=url, webhook_token="", journal=journal).webhook_url == ""
+    assert RunPodAsyncPoller(webhook_url=url, webhook_token="x", journal=journal).webhook_url == url
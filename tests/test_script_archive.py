@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from api.models.records import ActionRecord
+from api.services import script_archive
+from api.services.script_archive import ScriptArchive
+
+
+def _action(action_id, period, time_seconds):
+    return ActionRecord.from_dict({"actionId": action_id, "periodId": period, "timeSeconds": time_seconds})
+
+
+@pytest.mark.skipif("COMMENTARY_ARCHIVE_PATH" in os.environ, reason="COMMENTARY_ARCHIVE_PATH 설정됨")
+def test_disabled_by_default():
+    assert script_archive.COMMENTARY_ARCHIVE_PATH == ""
+    assert not ScriptArchive().enabled
+
+
+def test_row_time_comes_from_input_action(tmp_path):
+    archive = ScriptArchive(str(tmp_path / "archive.sqlite3"))
+    scripts = [
+        # LLM이 시각을 잘못 적거나 빠뜨려도 입력 액션의 시각으로 저장
+        {"actionId": "1", "timeSeconds": "9999", "tone": "CALM", "description": "a"},
+        {"actionId": "2", "tone": "EXCITED", "description": "b"},
+        {"actionId": "99", "timeSeconds": "620", "tone": "CALM", "description": "unknown"},
+    ]
+    archive.append("g1", "CASTER", scripts, [_action("1", 1, 612.5), _action("2", 2, 30)], job_id="job_1")
+
+    rows = archive.query("g1", time_from=600, time_to=700)
+    assert [(row["actionId"], row["periodId"], row["timeSeconds"]) for row in rows] == [("1", 1, "612.5")]
+
+    rows = archive.query("g1", period_id=2)
+    assert [(row["actionId"], row["timeSeconds"]) for row in rows] == [("2", "30")]
+
+    unknown = [row for row in archive.query("g1") if row["actionId"] == "99"]
+    assert unknown[0]["timeSeconds"] == "" and unknown[0]["periodId"] is None
@@ -0,0 +1,270 @@
+import asyncio
+import json
+import re
+import zlib
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException, Request as FastAPIRequest
+from starlette.requests import Request
+
+from api.routers import commentary
+from api.services.push_hub import PushHub
+from api.services.sharding import FORWARDED_HEADER, JOB_ID_LENGTH, ShardRouter, instance_tag, shard_of_job
+
+
+def _router(tmp_path, index, shard_count=4, instance_id="instance-a"):
+    router = ShardRouter(shard_count=shard_count, socket_dir=str(tmp_path), instance_id=instance_id)
+    router._index = index
+    return router
+
+
+def test_job_id_layout(tmp_path):
+    router = _router(tmp_path, index=0x2a, shard_count=64)
+    job_ids = [router.next_job_id() for _ in range(5)]
+
+    for job_id in job_ids:
+        # job_ + 생성 시각(ms, hex 11자리) + 인스턴스(hex 6자리) + 샤드(hex 2자리) + 순번(hex 3자리)
+        assert re.fullmatch(r"job_[0-9a-f]{11}" + instance_tag("instance-a") + r"2a[0-9a-f]{3}", job_id)
+        assert len(job_id) == JOB_ID_LENGTH
+        assert shard_of_job(job_id) == 0x2a
+    assert job_ids == sorted(job_ids) and len(set(job_ids)) == len(job_ids)
+
+
+def test_job_id_sequence_rolls_into_next_ms(tmp_path, monkeypatch):
+    router = _router(tmp_path, index=1)
+    monkeypatch.setattr("api.services.sharding.time.time", lambda: 1_700_000_000.0)
+
+    job_ids = [router.next_job_id() for _ in range(0x1001)]
+
+    assert job_ids[0][-3:] == "000" and job_ids[0xFFF][-3:] == "fff"
+    assert int(job_ids[-1][4:15], 16) == int(job_ids[0][4:15], 16) + 1
+    assert job_ids[-1][-3:] == "000"
+    assert len(set(job_ids)) == len(job_ids)
+
+
+def test_legacy_job_id_has_no_shard():
+    assert shard_of_job("job_82f395") is None
+    assert shard_of_job("job_0000000000000000") is None  # 인스턴스 자리가 없는 형식
+    assert shard_of_job("job_00000000000abcdef01000") == 1
+    assert shard_of_job("job_00000000000abcdefzz000") is None
+
+
+def test_instances_with_same_shard_issue_different_ids(tmp_path, monkeypatch):
+    # App Service 인스턴스마다 샤드 0을 선점하고 같은 ms에 첫 작업 생성
+    monkeypatch.setattr("api.services.sharding.time.time", lambda: 1_700_000_000.0)
+    first = _router(tmp_path / "a", index=0, instance_id="instance-a").next_job_id()
+    second = _router(tmp_path / "b", index=0, instance_id="instance-b").next_job_id()
+
+    assert first != second
+    assert shard_of_job(first) == shard_of_job(second) == 0
+
+
+def test_instance_tag_defaults_to_hostname(monkeypatch):
+    monkeypatch.setattr("api.services.sharding.socket.gethostname", lambda: "host-1")
+
+    assert instance_tag("") == instance_tag("host-1")
+    assert instance_tag("") != instance_tag("host-2")
+    assert re.fullmatch(r"[0-9a-f]{6}", instance_tag(""))
+
+
+def test_game_owner_is_crc32_mod_shard_count(tmp_path):
+    router = _router(tmp_path, index=0, shard_count=4)
+
+    for game_id in ("126283", "126284", "g-1", "경기"):
+        assert router.owner_of_game(game_id) == zlib.crc32(game_id.encode("utf-8")) % 4
+    # 워커마다 같은 결과 (프로세스별 hash() 시드와 무관)
+    assert _router(tmp_path, index=3).owner_of_game("126283") == router.owner_of_game("126283")
+
+
+def test_single_shard_keeps_everything_local(tmp_path):
+    router = _router(tmp_path, index=0, shard_count=1)
+    other = _router(tmp_path, index=1, shard_count=4).next_job_id()
+
+    assert not router.enabled
+    assert router.is_local(router.owner_of_game("126283"))
+    assert router.is_local(router.owner_of_job(other))
+
+
+def test_forward_reaches_owner_over_unix_socket(tmp_path):
+    owner_app = FastAPI()
+
+    @owner_app.get("/ai/commentary/jobs/{job_id}")
+    async def job_status(job_id: str, request: FastAPIRequest):
+        return {"jobId": job_id, "forwardedFrom": request.headers.get(FORWARDED_HEADER), "q": request.url.query}
+
+    async def scenario():
+        owner = _router(tmp_path, index=1, shard_count=2)
+        sender = _router(tmp_path, index=0, shard_count=2)
+        await owner.start(owner_app)
+        try:
+            for _ in range(100):
+                if owner._server.server.started:
+                    break
+                await asyncio.sleep(0.02)
+            response = await sender.forward(
+                1, "GET", "/ai/commentary/jobs/job_x", "a=1",
+                headers={"host": "client", FORWARDED_HEADER: "9", "if-none-match": '"e"'}
+            )
+        finally:
+            await owner.stop()
+            await sender.stop()
+        return response, sender
+
+    response, sender = asyncio.run(scenario())
+    assert response.status_code == 200
+    assert response.json() == {"jobId": "job_x", "forwardedFrom": "0", "q": "a=1"}
+    assert sender.forwarded == {"ok": 1}
+
+
+def test_forward_to_missing_owner_returns_none(tmp_path):
+    sender = _router(tmp_path, index=0, shard_count=2)
+
+    async def scenario():
+        try:
+            return await sender.forward(1, "GET", "/ai/commentary/jobs/job_x")
+        finally:
+            await sender.stop()
+
+    assert asyncio.run(scenario()) is None
+    assert sender.forwarded == {"error": 1}
+
+
+def _job_request(job_id, headers=()):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    return Request({
+        "type": "http", "method": "GET", "path": f"/ai/commentary/jobs/{job_id}", "query_string": b"",
+        "headers": [(name.encode(), value.encode()) for name, value in headers]
+    }, receive)
+
+
+def test_job_request_is_forwarded_to_issuing_shard(tmp_path, monkeypatch):
+    local = _router(tmp_path, index=0, shard_count=2)
+    remote_job = _router(tmp_path, index=1, shard_count=2).next_job_id()
+    local_job = local.next_job_id()
+    calls = []
+
+    async def forward(shard, method, path, query="", body=b"", headers=None):
+        calls.append((shard, method, path))
+        return httpx.Response(200, json={"jobId": remote_job}, headers={"etag": '"v1"', "x-other": "1"})
+
+    monkeypatch.setattr(local, "forward", forward)
+    monkeypatch.setattr(commentary, "get_shard_router", lambda: local)
+
+    async def scenario():
+        relayed = await commentary._forward_job_request(remote_job, _job_request(remote_job))
+        own = await commentary._forward_job_request(local_job, _job_request(local_job))
+        # 이미 전달된 요청은 다시 전달하지 않음
+        again = await commentary._forward_job_request(remote_job, _job_request(remote_job, [(FORWARDED_HEADER, "1")]))
+        return relayed, own, again
+
+    relayed, own, again = asyncio.run(scenario())
+    assert calls == [(1, "GET", f"/ai/commentary/jobs/{remote_job}")]
+    assert relayed.status_code == 200 and relayed.headers["etag"] == '"v1"'
+    assert "x-other" not in relayed.headers
+    assert own is None and again is None
+
+
+def test_unreachable_owner_returns_503(tmp_path, monkeypatch):
+    local = _router(tmp_path, index=0, shard_count=2)
+    remote_job = _router(tmp_path, index=1, shard_count=2).next_job_id()
+
+    async def forward(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(local, "forward", forward)
+    monkeypatch.setattr(commentary, "get_shard_router", lambda: local)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(commentary._forward_job_request(remote_job, _job_request(remote_job)))
+    assert exc.value.status_code == 503
+    assert exc.value.detail["errorCode"] == "SHARD_UNAVAILABLE"
+
+
+def test_relay_delivers_events_in_order_to_every_peer(tmp_path):
+    received = {1: [], 2: []}
+
+    def peer_app(shard, router):
+        app = FastAPI()
+
+        @app.post("/relay")
+        async def relay(message: dict, request: FastAPIRequest):
+            received[shard].append((message["n"], router.is_internal(request.scope)))
+            return {}
+
+        return app
+
+    async def scenario():
+        sender = _router(tmp_path, index=0, shard_count=2)
+        peers = {shard: _router(tmp_path, index=shard, shard_count=2) for shard in (1, 2)}
+        for shard, router in peers.items():
+            await router.start(peer_app(shard, router))
+        # 비정상 종료한 워커가 남긴 소켓은 건너뜀
+        (tmp_path / "shard-7.sock").touch()
+        try:
+            for _ in range(100):
+                if all(router._server.server.started for router in peers.values()):
+                    break
+                await asyncio.sleep(0.02)
+            assert sender.peers() == [1, 2, 7]
+            for n in range(20):
+                sender.relay("/relay", {"n": n})
+            for _ in range(200):
+                if all(len(events) == 20 for events in received.values()):
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await sender.stop()
+            for router in peers.values():
+                await router.stop()
+        return sender
+
+    sender = asyncio.run(scenario())
+    for events in received.values():
+        assert events == [(n, True) for n in range(20)]
+    assert sender.relayed == {"ok": 40, "error": 20}
+
+
+def test_relay_is_noop_without_sharding(tmp_path):
+    router = _router(tmp_path, index=0, shard_count=1)
+    router.relay("/relay", {"n": 1})
+    assert router._relay_task is None
+
+
+def _relay_request(message, server):
+    body = json.dumps(message).encode()
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request({
+        "type": "http", "method": "POST", "path": commentary.PUSH_RELAY_PATH, "query_string": b"",
+        "headers": [(b"content-type", b"application/json")], "server": server
+    }, receive)
+
+
+def test_relayed_event_reaches_local_websocket_subscriber(tmp_path, monkeypatch):
+    local = _router(tmp_path, index=1, shard_count=2)
+    hub = PushHub()
+    monkeypatch.setattr(commentary, "get_shard_router", lambda: local)
+    monkeypatch.setattr(commentary, "get_push_hub", lambda: hub)
+    message = {"gameId": "g1", "jobId": "job_x", "payload": {"jobId": "job_x", "status": "DONE"}, "terminal": True}
+
+    async def scenario():
+        subscriber = hub.connect()
+        hub.subscribe(subscriber, game_ids=["g1"])
+        subscriber.queue.get_nowait()  # hello
+
+        # TCP로 들어온 요청은 거부 (헤더 위조 방지)
+        with pytest.raises(HTTPException) as exc:
+            await commentary.receive_push_relay(message, _relay_request(message, ("127.0.0.1", 8000)))
+        assert exc.value.status_code == 403
+
+        internal = _relay_request(message, (local.socket_path(1), None))
+        assert await commentary.receive_push_relay(message, internal) == {"seq": 1}
+        return json.loads(subscriber.queue.get_nowait())
+
+    event = asyncio.run(scenario())
+    assert event == {"type": "job", "seq": 1, "gameId": "g1", "jobId": "job_x", "status": "DONE"}
@@ -0,0 +1,66 @@
+import asyncio
+
+from api.services.warmup_service import WarmupScheduler
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _scheduler(pings, release=None):
+    """keep-alive 대신 호출 기록 (release가 있으면 설정될 때까지 응답 지연)"""
+    scheduler = WarmupScheduler(interval=30, idle_max_interval=900, activity_window=600)
+
+    async def ping():
+        pings.append(scheduler.active_games())
+        if release is not None:
+            await release.wait()
+
+    scheduler._ping = ping
+    return scheduler
+
+
+def test_new_game_activity_wakes_idle_scheduler():
+    async def scenario():
+        pings = []
+        scheduler = _scheduler(pings)
+        scheduler.start()
+        await _settle()
+        assert pings == []  # 비활성: 30초 대기 중
+
+        scheduler.note_activity("g1")
+        await _settle()
+        assert pings == [["g1"]]
+
+        # 이미 활성인 경기의 트래픽은 주기를 앞당기지 않음
+        scheduler.note_activity("g1")
+        await _settle()
+        assert pings == [["g1"]]
+
+        scheduler.note_activity("g2")
+        await _settle()
+        await scheduler.stop()
+        return pings
+
+    assert asyncio.run(scenario()) == [["g1"], ["g1", "g2"]]
+
+
+def test_schedule_change_during_ping_is_not_lost():
+    async def scenario():
+        pings = []
+        release = asyncio.Event()
+        scheduler = _scheduler(pings, release)
+        scheduler.note_activity("g1")
+        scheduler.start()
+        await _settle()
+        assert pings == [["g1"]]
+
+        # keep-alive 응답 대기 중 일정 교체 -> 완료 직후 재평가
+        scheduler.set_schedule([])
+        release.set()
+        await _settle()
+        await scheduler.stop()
+        return pings
+
+    assert asyncio.run(scenario()) == [["g1"], ["g1"]]